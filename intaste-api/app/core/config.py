@@ -99,6 +99,25 @@ class Settings(BaseSettings):
         default=5, ge=1, le=20, validation_alias="INTASTE_RELEVANCE_MAX_CONCURRENT"
     )
 
+    # Search Concurrency
+    intaste_max_concurrent_searches: int = Field(
+        default=32, ge=1, validation_alias="INTASTE_MAX_CONCURRENT_SEARCHES"
+    )
+
+    # Intent Cache
+    intaste_intent_cache_size: int = Field(
+        default=4096, ge=0, validation_alias="INTASTE_INTENT_CACHE_SIZE"
+    )
+    intaste_intent_cache_ttl_s: int = Field(
+        default=7 * 86400, ge=1, validation_alias="INTASTE_INTENT_CACHE_TTL_S"
+    )
+
+    # Speculative search: query Fess with the raw user query while intent
+    # extraction runs, and reuse that result if the normalized query is close
+    intaste_speculative_search_enabled: bool = Field(
+        default=False, validation_alias="INTASTE_SPECULATIVE_SEARCH_ENABLED"
+    )
+
     # LLM Warmup
     intaste_llm_warmup_enabled: bool = Field(
         default=True, validation_alias="INTASTE_LLM_WARMUP_ENABLED"
@@ -24,14 +24,29 @@ from ..schemas.common import DependencyHealth
 
 logger = logging.getLogger(__name__)
 
+# Pool for the app-wide health client: probes hit two hosts, so a few idle
+# connections are enough to skip the TCP/TLS handshake on every scrape
+HEALTH_HTTP_LIMITS = httpx.Limits(max_connections=20, max_keepalive_connections=10)
 
-async def check_fess_health(base_url: str, timeout_ms: int = 5000) -> DependencyHealth:
+
+async def _get(client: httpx.AsyncClient | None, url: str, timeout_ms: int) -> httpx.Response:
+    """GET url on the shared client, or on a one-off client when none is given."""
+    if client is not None:
+        return await client.get(url, timeout=timeout_ms / 1000)
+    async with httpx.AsyncClient(timeout=timeout_ms / 1000) as one_off:
+        return await one_off.get(url)
+
+
+async def check_fess_health(
+    base_url: str, timeout_ms: int = 5000, client: httpx.AsyncClient | None = None
+) -> DependencyHealth:
     """
     Check Fess search service health.
 
     Args:
         base_url: Fess base URL
         timeout_ms: Timeout in milliseconds
+        client: Shared HTTP client to reuse pooled connections (None = one-off client)
 
     Returns:
         DependencyHealth: Health status of Fess
@@ -39,36 +54,35 @@ async def check_fess_health(base_url: str, timeout_ms: int = 5000) -> Dependency
     start_time = time.time()
 
     try:
-        async with httpx.AsyncClient(timeout=timeout_ms / 1000) as client:
-            # Use Fess OpenAPI v1 health endpoint
-            response = await client.get(f"{base_url}/api/v1/health")
-
-            response_time_ms = int((time.time() - start_time) * 1000)
-
-            if response.status_code == 200:
-                # Parse health response: {"data": {"status": "green", "timed_out": false}}
-                data = response.json()
-                health_data = data.get("data", {})
-                status = health_data.get("status", "unknown")
-                timed_out = health_data.get("timed_out", False)
-
-                if status == "green" and not timed_out:
-                    return DependencyHealth(
-                        status="healthy",
-                        response_time_ms=response_time_ms,
-                    )
-                else:
-                    return DependencyHealth(
-                        status="degraded",
-                        response_time_ms=response_time_ms,
-                        error=f"Fess status: {status}, timed_out: {timed_out}",
-                    )
+        # Use Fess OpenAPI v1 health endpoint
+        response = await _get(client, f"{base_url}/api/v1/health", timeout_ms)
+
+        response_time_ms = int((time.time() - start_time) * 1000)
+
+        if response.status_code == 200:
+            # Parse health response: {"data": {"status": "green", "timed_out": false}}
+            data = response.json()
+            health_data = data.get("data", {})
+            status = health_data.get("status", "unknown")
+            timed_out = health_data.get("timed_out", False)
+
+            if status == "green" and not timed_out:
+                return DependencyHealth(
+                    status="healthy",
+                    response_time_ms=response_time_ms,
+                )
             else:
                 return DependencyHealth(
                     status="degraded",
                     response_time_ms=response_time_ms,
-                    error=f"HTTP {response.status_code}",
+                    error=f"Fess status: {status}, timed_out: {timed_out}",
                 )
+        else:
+            return DependencyHealth(
+                status="degraded",
+                response_time_ms=response_time_ms,
+                error=f"HTTP {response.status_code}",
+            )
 
     except httpx.TimeoutException:
         response_time_ms = int((time.time() - start_time) * 1000)
@@ -88,13 +102,16 @@ async def check_fess_health(base_url: str, timeout_ms: int = 5000) -> Dependency
         )
 
 
-async def check_ollama_health(base_url: str, timeout_ms: int = 5000) -> DependencyHealth:
+async def check_ollama_health(
+    base_url: str, timeout_ms: int = 5000, client: httpx.AsyncClient | None = None
+) -> DependencyHealth:
     """
     Check Ollama LLM service health.
 
     Args:
         base_url: Ollama base URL
         timeout_ms: Timeout in milliseconds
+        client: Shared HTTP client to reuse pooled connections (None = one-off client)
 
     Returns:
         DependencyHealth: Health status of Ollama
@@ -102,32 +119,31 @@ async def check_ollama_health(base_url: str, timeout_ms: int = 5000) -> Dependen
     start_time = time.time()
 
     try:
-        async with httpx.AsyncClient(timeout=timeout_ms / 1000) as client:
-            # Use Ollama's API endpoint to list models (lightweight operation)
-            response = await client.get(f"{base_url}/api/tags")
-
-            response_time_ms = int((time.time() - start_time) * 1000)
-
-            if response.status_code == 200:
-                data = response.json()
-                # Check if models are available
-                if "models" in data and len(data["models"]) > 0:
-                    return DependencyHealth(
-                        status="healthy",
-                        response_time_ms=response_time_ms,
-                    )
-                else:
-                    return DependencyHealth(
-                        status="degraded",
-                        response_time_ms=response_time_ms,
-                        error="No models available",
-                    )
+        # Use Ollama's API endpoint to list models (lightweight operation)
+        response = await _get(client, f"{base_url}/api/tags", timeout_ms)
+
+        response_time_ms = int((time.time() - start_time) * 1000)
+
+        if response.status_code == 200:
+            data = response.json()
+            # Check if models are available
+            if "models" in data and len(data["models"]) > 0:
+                return DependencyHealth(
+                    status="healthy",
+                    response_time_ms=response_time_ms,
+                )
             else:
                 return DependencyHealth(
                     status="degraded",
                     response_time_ms=response_time_ms,
-                    error=f"HTTP {response.status_code}",
+                    error="No models available",
                 )
+        else:
+            return DependencyHealth(
+                status="degraded",
+                response_time_ms=response_time_ms,
+                error=f"HTTP {response.status_code}",
+            )
 
     except httpx.TimeoutException:
         response_time_ms = int((time.time() - start_time) * 1000)
@@ -147,20 +163,23 @@ async def check_ollama_health(base_url: str, timeout_ms: int = 5000) -> Dependen
         )
 
 
-async def check_all_dependencies(fess_url: str, ollama_url: str) -> dict[str, DependencyHealth]:
+async def check_all_dependencies(
+    fess_url: str, ollama_url: str, client: httpx.AsyncClient | None = None
+) -> dict[str, DependencyHealth]:
     """
     Check health of all dependency services in parallel.
 
     Args:
         fess_url: Fess base URL
         ollama_url: Ollama base URL
+        client: Shared HTTP client to reuse pooled connections (None = one-off clients)
 
     Returns:
         dict: Health status of each dependency
     """
     # Run health checks in parallel
-    fess_task = check_fess_health(fess_url)
-    ollama_task = check_ollama_health(ollama_url)
+    fess_task = check_fess_health(fess_url, client=client)
+    ollama_task = check_ollama_health(ollama_url, client=client)
 
     results: tuple[DependencyHealth | BaseException, DependencyHealth | BaseException] = (
         await asyncio.gather(fess_task, ollama_task, return_exceptions=True)
@@ -14,10 +14,10 @@
 Base protocol and models for LLM clients.
 """
 
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Sequence
 from typing import Any, Literal, Protocol
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 
 class IntentOutput(BaseModel):
@@ -30,6 +30,22 @@ class IntentOutput(BaseModel):
     followups: list[str] = Field(default_factory=list, max_length=3)
     ambiguity: Literal["low", "medium", "high"] = "low"
 
+    _fallback: bool = PrivateAttr(default=False)
+
+    @classmethod
+    def fallback(cls, query: str, filters: dict[str, Any] | None = None) -> "IntentOutput":
+        """Intent that searches the raw query, used when no usable LLM output exists."""
+        intent = cls(
+            normalized_query=query.strip(), filters=filters, followups=[], ambiguity="medium"
+        )
+        intent._fallback = True
+        return intent
+
+    @property
+    def is_fallback(self) -> bool:
+        """True if this intent was synthesized by fallback() rather than produced by the LLM."""
+        return self._fallback
+
 
 class ComposeOutput(BaseModel):
     """
@@ -82,7 +98,7 @@ class LLMClient(Protocol):
         user_template: str,
         language: str | None = None,
         filters: dict[str, Any] | None = None,
-        query_history: list[str] | None = None,
+        query_history: Sequence[str] | None = None,
         timeout_ms: int | None = None,
         template_params: dict[str, Any] | None = None,
     ) -> IntentOutput:
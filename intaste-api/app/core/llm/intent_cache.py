@@ -0,0 +1,100 @@
+# Copyright (c) 2025 CodeLibs
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+In-process cache for LLM intent extraction results.
+
+Identical user queries resolve to the same IntentOutput for a given prompt
+version and model, so the LLM round trip can be skipped on repeat requests.
+"""
+
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from typing import Any
+
+from .base import IntentOutput
+
+
+class IntentCache:
+    """
+    Bounded LRU cache of IntentOutput entries with a per-entry TTL.
+    """
+
+    def __init__(self, maxsize: int = 4096, ttl_s: float = 7 * 86400):
+        """
+        Initialize IntentCache.
+
+        Args:
+            maxsize: Maximum number of cached intents (least recently used are evicted)
+            ttl_s: Time-to-live of each entry in seconds
+        """
+        self.maxsize = maxsize
+        self.ttl_s = ttl_s
+        self._entries: OrderedDict[str, tuple[float, dict[str, Any]]] = OrderedDict()
+
+    @staticmethod
+    def make_key(
+        query: str,
+        prompt_version: str,
+        model_id: str,
+        language: str | None = None,
+        filters: dict[str, Any] | None = None,
+    ) -> str:
+        """
+        Build a cache key from everything that influences the intent output.
+
+        The query is length-prefixed so that no two (query, version) pairs
+        produce the same byte sequence.
+        """
+        encoded_query = query.encode()
+        digest = hashlib.sha256()
+        digest.update(len(encoded_query).to_bytes(8, "big"))
+        digest.update(encoded_query)
+        digest.update(
+            json.dumps(
+                [prompt_version, model_id, language, filters], sort_keys=True, default=str
+            ).encode()
+        )
+        return digest.hexdigest()
+
+    def get(self, key: str) -> IntentOutput | None:
+        """Return the cached intent for key, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, data = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return IntentOutput.model_validate(data)
+
+    def set(self, key: str, intent: IntentOutput) -> None:
+        """Store intent under key, evicting the least recently used entry when full."""
+        if self.maxsize <= 0:
+            return
+
+        self._entries[key] = (time.monotonic() + self.ttl_s, intent.model_dump())
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -16,7 +16,7 @@ Ollama LLM client implementation.
 
 import json
 import logging
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Sequence
 from typing import Any
 
 import httpx
@@ -28,6 +28,10 @@ from .prompts import ComposeParams, get_registry
 
 logger = logging.getLogger(__name__)
 
+# Connection pool for the long-lived client: keep warm connections to Ollama
+# so requests skip the TCP handshake
+HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50, keepalive_expiry=30)
+
 
 class OllamaClient:
     """
@@ -47,7 +51,7 @@ class OllamaClient:
         self.timeout_ms = timeout_ms
         self.temperature = temperature
         self.top_p = top_p
-        self.client = httpx.AsyncClient(timeout=timeout_ms / 1000.0)
+        self.client = httpx.AsyncClient(timeout=timeout_ms / 1000.0, limits=HTTP_LIMITS)
 
     async def intent(
         self,
@@ -56,7 +60,7 @@ class OllamaClient:
         user_template: str,
         language: str | None = None,
         filters: dict[str, Any] | None = None,
-        query_history: list[str] | None = None,
+        query_history: Sequence[str] | None = None,
         timeout_ms: int | None = None,
         template_params: dict[str, Any] | None = None,
     ) -> IntentOutput:
@@ -166,12 +170,7 @@ class OllamaClient:
                 )
 
                 # Fallback: use original query
-                fallback_intent = IntentOutput(
-                    normalized_query=query.strip(),
-                    filters=filters,
-                    followups=[],
-                    ambiguity="medium",
-                )
+                fallback_intent = IntentOutput.fallback(query, filters)
                 logger.debug(f"Using fallback intent: {fallback_intent}")
                 return fallback_intent
 
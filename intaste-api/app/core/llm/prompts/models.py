@@ -124,8 +124,10 @@ class PromptTemplate[P: PromptParams](BaseModel):
             KeyError: If template contains placeholders not in params
             ValueError: If parameter validation fails
         """
-        # Pydantic already validated params, now format template
-        return self.user_template.format(**params.model_dump())
+        # Pydantic already validated params, now format template. Params are
+        # flat string fields with no custom serializers, so the instance dict
+        # equals model_dump() without the per-call serialization pass.
+        return self.user_template.format_map(params.__dict__)
 
     def __hash__(self) -> int:
         """Make PromptTemplate hashable for use in sets/dicts."""
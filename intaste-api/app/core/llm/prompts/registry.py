@@ -37,6 +37,10 @@ class PromptRegistry:
         self._prompts: dict[str, dict[str, PromptTemplate[Any]]] = {}
         # Default versions: {prompt_id: version}
         self._default_versions: dict[str, str] = {}
+        # Resolved lookups: {(prompt_id, requested version or None): PromptTemplate}.
+        # get() runs on every LLM call, so the default-version resolution is
+        # memoized here and dropped whenever registrations or defaults change.
+        self._resolved: dict[tuple[str, str | None], PromptTemplate[Any]] = {}
 
     def register(
         self,
@@ -72,6 +76,7 @@ class PromptRegistry:
 
         # Register the template
         self._prompts[prompt_id][version] = template
+        self._resolved.clear()
 
         # Set as default if requested or if it's the first version
         if set_as_default or prompt_id not in self._default_versions:
@@ -101,12 +106,17 @@ class PromptRegistry:
         Raises:
             KeyError: If the prompt_id or version is not found
         """
+        cached = self._resolved.get((prompt_id, version))
+        if cached is not None:
+            return cached
+
         if prompt_id not in self._prompts:
             raise KeyError(
                 f"Prompt '{prompt_id}' not found. " f"Available: {list(self._prompts.keys())}"
             )
 
         # Determine version to use
+        requested_version = version
         if version is None:
             if prompt_id not in self._default_versions:
                 raise KeyError(f"No default version set for prompt '{prompt_id}'")
@@ -121,6 +131,7 @@ class PromptRegistry:
 
         template = self._prompts[prompt_id][version]
         logger.debug(f"Retrieved prompt '{prompt_id}' version '{version}'")
+        self._resolved[(prompt_id, requested_version)] = template
         return template
 
     def list_prompts(self) -> dict[str, list[str]]:
@@ -131,6 +142,14 @@ class PromptRegistry:
         """
         return {prompt_id: list(versions.keys()) for prompt_id, versions in self._prompts.items()}
 
+    def prompt_ids(self) -> frozenset[str]:
+        """Return the IDs of all registered prompts (without copying their versions).
+
+        Returns:
+            Frozen set of registered prompt IDs
+        """
+        return frozenset(self._prompts)
+
     def get_default_version(self, prompt_id: str) -> str | None:
         """Get the default version for a prompt.
 
@@ -160,12 +179,14 @@ class PromptRegistry:
 
         old_version = self._default_versions.get(prompt_id)
         self._default_versions[prompt_id] = version
+        self._resolved.clear()
         logger.info(f"Changed default version for '{prompt_id}': " f"{old_version} -> {version}")
 
     def clear(self) -> None:
         """Clear all registered prompts (useful for testing)."""
         self._prompts.clear()
         self._default_versions.clear()
+        self._resolved.clear()
         logger.debug("Cleared all prompts from registry")
 
 
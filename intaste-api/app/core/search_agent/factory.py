@@ -18,6 +18,7 @@ import logging
 
 from ..config import Settings
 from ..llm.base import LLMClient
+from ..llm.intent_cache import IntentCache
 from ..search_provider.base import SearchProvider
 from .base import SearchAgent
 from .fess import FessSearchAgent
@@ -46,6 +47,16 @@ def create_search_agent(
         If INTASTE_MULTI_AGENT_ENABLED=True and agents are configured,
         returns MultiSearchAgent. Otherwise, returns single FessSearchAgent.
     """
+    # One intent cache shared by all agents (they share the same LLM client)
+    intent_cache = (
+        IntentCache(
+            maxsize=settings.intaste_intent_cache_size,
+            ttl_s=settings.intaste_intent_cache_ttl_s,
+        )
+        if settings.intaste_intent_cache_size > 0
+        else None
+    )
+
     # Check if multi-agent mode is enabled
     if settings.intaste_multi_agent_enabled and settings.intaste_search_agents:
         # Type assertion for mypy (validator ensures this is always list[SearchAgentConfig])
@@ -69,6 +80,9 @@ def create_search_agent(
                         search_timeout_ms=agent_config.timeout_ms,
                         agent_id=agent_config.agent_id,
                         agent_name=agent_config.agent_name,
+                        intent_cache=intent_cache,
+                        speculative_search=settings.intaste_speculative_search_enabled,
+                        max_concurrent_searches=settings.intaste_max_concurrent_searches,
                     )
                     agents.append((agent_config.agent_id, agent_config.agent_name, agent))
                     logger.info(f"Created FessSearchAgent: {agent_config.agent_id}")
@@ -105,6 +119,9 @@ def create_search_agent(
         search_timeout_ms=settings.search_timeout_ms,
         agent_id="fess",
         agent_name="FessSearchAgent",
+        intent_cache=intent_cache,
+        speculative_search=settings.intaste_speculative_search_enabled,
+        max_concurrent_searches=settings.intaste_max_concurrent_searches,
     )
 
     logger.debug(
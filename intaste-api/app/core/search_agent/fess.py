@@ -18,11 +18,14 @@ This agent uses LLM for intent extraction and Fess for search execution.
 
 import asyncio
 import logging
+import re
 import time
 from collections.abc import AsyncGenerator
+from functools import lru_cache
 from typing import Any
 
-from ..llm.base import IntentOutput, LLMClient
+from ..llm.base import IntentOutput, LLMClient, RelevanceOutput
+from ..llm.intent_cache import IntentCache
 from ..llm.prompts import (
     IntentParams,
     RelevanceParams,
@@ -30,7 +33,7 @@ from ..llm.prompts import (
     RetryIntentParams,
     get_registry,
 )
-from ..search_provider.base import SearchHit, SearchProvider, SearchQuery
+from ..search_provider.base import SearchHit, SearchProvider, SearchQuery, SearchResult
 from .base import (
     BaseSearchAgent,
     CitationsEventData,
@@ -40,6 +43,39 @@ from .base import (
 
 logger = logging.getLogger(__name__)
 
+# Minimum token overlap (Jaccard) between the user query and the normalized
+# query for a speculative search on the raw query to be reused
+SPECULATIVE_REUSE_MIN_JACCARD = 0.7
+
+# Retry refinements are remembered per query for a short while so a repeat of a
+# poorly-performing query starts from the refined intent instead of re-deriving it
+REFINEMENT_CACHE_SIZE = 512
+REFINEMENT_CACHE_TTL_S = 900
+
+
+_WORD_RE = re.compile(r"\w+")
+
+
+@lru_cache(maxsize=1024)
+def _tokenize(text: str) -> frozenset[str]:
+    """Lowercased word tokens of text (cached: the same queries recur across requests)."""
+    return frozenset(_WORD_RE.findall(text.lower()))
+
+
+def _query_similarity(a: str, b: str) -> float:
+    """Jaccard similarity of the word tokens of two queries."""
+    tokens_a = _tokenize(a)
+    tokens_b = _tokenize(b)
+    if not tokens_a and not tokens_b:
+        return 1.0
+    return len(tokens_a & tokens_b) / len(tokens_a | tokens_b)
+
+
+def _discard_task_exception(task: asyncio.Task[Any]) -> None:
+    """Mark a background task's exception as retrieved if nobody awaits it."""
+    if not task.cancelled():
+        task.exception()
+
 
 class FessSearchAgent(BaseSearchAgent):
     """
@@ -59,6 +95,9 @@ class FessSearchAgent(BaseSearchAgent):
         search_timeout_ms: int = 2000,
         agent_id: str | None = None,
         agent_name: str | None = None,
+        intent_cache: IntentCache | None = None,
+        speculative_search: bool = False,
+        max_concurrent_searches: int = 32,
     ):
         """
         Initialize FessSearchAgent.
@@ -70,6 +109,11 @@ class FessSearchAgent(BaseSearchAgent):
             search_timeout_ms: Timeout for search execution (default: 2000ms)
             agent_id: Unique identifier for multi-agent scenarios
             agent_name: Human-readable agent name
+            intent_cache: Optional cache of intent extraction results (None = disabled)
+            speculative_search: Search the raw query while intent extraction runs and
+                reuse the result when the normalized query is close to it
+            max_concurrent_searches: Maximum in-flight search provider calls for this
+                agent; further searches wait in-process instead of piling onto Fess
         """
         self.search_provider = search_provider
         self.llm_client = llm_client
@@ -77,6 +121,13 @@ class FessSearchAgent(BaseSearchAgent):
         self.search_timeout_ms = search_timeout_ms
         self.agent_id = agent_id or "fess"
         self.agent_name = agent_name or "FessSearchAgent"
+        self.intent_cache = intent_cache
+        self.speculative_search = speculative_search
+        self.max_concurrent_searches = max_concurrent_searches
+        self._search_semaphore = asyncio.Semaphore(max_concurrent_searches)
+        self._refinement_cache = IntentCache(
+            maxsize=REFINEMENT_CACHE_SIZE, ttl_s=REFINEMENT_CACHE_TTL_S
+        )
 
     async def search_stream(
         self,
@@ -115,297 +166,474 @@ class FessSearchAgent(BaseSearchAgent):
         previous_normalized_query: str | None = None
         search_result: Any = None
         evaluated_hits: list[SearchHit] = []
+        speculative_task: asyncio.Task[SearchResult] | None = None
+        previous_max_score = 0.0
+        refined_intent: IntentOutput | None = None
+
+        # Standalone queries whose retry refined the intent start from that refinement
+        refinement_key = None
+        if not options.get("query_history"):
+            refinement_key = IntentCache.make_key(
+                query=query,
+                prompt_version="retry_refinement",
+                model_id=str(getattr(self.llm_client, "model", "")),
+                language=options.get("language", "en"),
+                filters=options.get("filters"),
+            )
 
         # Timing accumulators
         total_intent_ms = 0
         total_search_ms = 0
         total_relevance_ms = 0
 
-        # Retry loop
-        while retry_count <= max_retries:
-            is_retry = retry_count > 0
+        try:
+            # Retry loop
+            while retry_count <= max_retries:
+                is_retry = retry_count > 0
 
-            # ========================================
-            # Step 1: Intent extraction
-            # ========================================
-            yield SearchEvent(
-                type="status",
-                data=StatusEventData(phase="intent"),
-                agent_id=self.agent_id,
-                agent_name=self.agent_name,
-            )
+                # ========================================
+                # Step 1: Intent extraction
+                # ========================================
+                yield SearchEvent(
+                    type="status",
+                    data=StatusEventData(phase="intent"),
+                    agent_id=self.agent_id,
+                    agent_name=self.agent_name,
+                )
 
-            logger.info(
-                f"[{session_id}] Starting {'retry ' if is_retry else ''}intent extraction "
-                f"(attempt {retry_count + 1})"
-            )
-            intent_start = time.time()
+                logger.info(
+                    f"[{session_id}] Starting {'retry ' if is_retry else ''}intent extraction "
+                    f"(attempt {retry_count + 1})"
+                )
+                intent_start = time.time()
 
-            try:
-                if is_retry and previous_normalized_query and evaluated_hits:
-                    # Retry intent extraction with low-score context
-                    intent = await self._extract_retry_intent(
-                        query=query,
-                        previous_normalized_query=previous_normalized_query,
-                        hits=evaluated_hits,
-                        language=options.get("language", "en"),
-                        session_id=session_id,
-                        timeout_ms=options.get(
-                            "retry_intent_timeout_ms", settings.retry_intent_timeout_ms
-                        ),
+                try:
+                    if is_retry and previous_normalized_query and evaluated_hits:
+                        # Retry intent extraction with low-score context
+                        intent = await self._extract_retry_intent(
+                            query=query,
+                            previous_normalized_query=previous_normalized_query,
+                            hits=evaluated_hits,
+                            language=options.get("language", "en"),
+                            session_id=session_id,
+                            timeout_ms=options.get(
+                                "retry_intent_timeout_ms", settings.retry_intent_timeout_ms
+                            ),
+                        )
+                        refined_intent = intent
+                    else:
+                        # Normal intent extraction - get template from registry
+                        registry = get_registry()
+                        intent_template = registry.get("intent", IntentParams)
+
+                        # Query history makes the intent conversation-specific, so only
+                        # standalone queries are looked up in / stored to the cache.
+                        # Retries skip both caches: they would hand back the intent whose
+                        # search just came up empty
+                        cache_key = None
+                        cached_intent = (
+                            self._refinement_cache.get(refinement_key)
+                            if refinement_key is not None and not is_retry
+                            else None
+                        )
+                        if cached_intent is not None:
+                            logger.debug(f"[{session_id}] Starting from cached retry refinement")
+                        elif (
+                            self.intent_cache is not None
+                            and not is_retry
+                            and not options.get("query_history")
+                        ):
+                            cache_key = IntentCache.make_key(
+                                query=query,
+                                prompt_version=intent_template.version,
+                                model_id=str(getattr(self.llm_client, "model", "")),
+                                language=options.get("language", "en"),
+                                filters=options.get("filters"),
+                            )
+                            cached_intent = self.intent_cache.get(cache_key)
+
+                        if cached_intent is not None:
+                            intent = cached_intent
+                            logger.debug(f"[{session_id}] Intent cache hit")
+                        else:
+                            # Retries skip speculation: the raw query is the one that
+                            # just came up short
+                            if self.speculative_search and not is_retry:
+                                # Overlap the search round trip with the LLM call
+                                speculative_task = asyncio.create_task(
+                                    self._search(
+                                        self._build_search_query(
+                                            query.strip(), options.get("filters"), options, is_retry
+                                        ),
+                                        session_id,
+                                    )
+                                )
+                                speculative_task.add_done_callback(_discard_task_exception)
+                            intent_timeout_ms = options.get(
+                                "intent_timeout_ms", self.intent_timeout_ms
+                            )
+                            # Hard deadline: the client timeout covers a single HTTP call,
+                            # not its internal retries
+                            async with asyncio.timeout(intent_timeout_ms / 1000):
+                                intent = await self.llm_client.intent(
+                                    query=query,
+                                    system_prompt=intent_template.system_prompt,
+                                    user_template=intent_template.user_template,
+                                    language=options.get("language", "en"),
+                                    filters=options.get("filters"),
+                                    query_history=options.get("query_history"),
+                                    timeout_ms=intent_timeout_ms,
+                                )
+                            # A fallback only means the LLM output was unusable this time
+                            if (
+                                cache_key is not None
+                                and self.intent_cache is not None
+                                and not intent.is_fallback
+                            ):
+                                self.intent_cache.set(cache_key, intent)
+
+                    intent_ms = int((time.time() - intent_start) * 1000)
+                    total_intent_ms += intent_ms
+                    logger.info(
+                        f"[{session_id}] Intent extracted: {intent.normalized_query} "
+                        f"(ambiguity: {intent.ambiguity}, {intent_ms}ms)"
+                    )
+                    logger.debug(
+                        f"[{session_id}] Intent details: normalized_query={intent.normalized_query!r}, "
+                        f"filters={intent.filters}, followups={intent.followups}"
                     )
-                else:
-                    # Normal intent extraction - get template from registry
-                    registry = get_registry()
-                    intent_template = registry.get("intent", IntentParams)
 
-                    intent = await self.llm_client.intent(
-                        query=query,
-                        system_prompt=intent_template.system_prompt,
-                        user_template=intent_template.user_template,
-                        language=options.get("language", "en"),
-                        filters=options.get("filters"),
-                        query_history=options.get("query_history"),
-                        timeout_ms=options.get("intent_timeout_ms", self.intent_timeout_ms),
+                except (TimeoutError, Exception) as e:
+                    intent_ms = int((time.time() - intent_start) * 1000)
+                    total_intent_ms += intent_ms
+                    logger.warning(
+                        f"[{session_id}] Intent extraction failed after {intent_ms}ms: {e}"
+                    )
+                    logger.debug(
+                        f"[{session_id}] Intent error: {type(e).__name__}, details: {str(e)}"
                     )
 
-                intent_ms = int((time.time() - intent_start) * 1000)
-                total_intent_ms += intent_ms
-                logger.info(
-                    f"[{session_id}] Intent extracted: {intent.normalized_query} "
-                    f"(ambiguity: {intent.ambiguity}, {intent_ms}ms)"
+                    # Fallback: use original query
+                    intent = IntentOutput.fallback(query, options.get("filters"))
+                    logger.debug(f"[{session_id}] Using fallback intent: {intent}")
+
+                # Yield intent event
+                yield SearchEvent(
+                    type="intent",
+                    data=IntentEventData(
+                        normalized_query=intent.normalized_query,
+                        filters=intent.filters,
+                        followups=intent.followups,
+                        ambiguity=intent.ambiguity,
+                        timing_ms=intent_ms,
+                    ),
+                    agent_id=self.agent_id,
+                    agent_name=self.agent_name,
                 )
-                logger.debug(
-                    f"[{session_id}] Intent details: normalized_query={intent.normalized_query!r}, "
-                    f"filters={intent.filters}, followups={intent.followups}"
+
+                # ========================================
+                # Step 2: Search execution
+                # ========================================
+                yield SearchEvent(
+                    type="status",
+                    data=StatusEventData(phase="search"),
+                    agent_id=self.agent_id,
+                    agent_name=self.agent_name,
                 )
 
-            except (TimeoutError, Exception) as e:
-                intent_ms = int((time.time() - intent_start) * 1000)
-                total_intent_ms += intent_ms
-                logger.warning(f"[{session_id}] Intent extraction failed after {intent_ms}ms: {e}")
-                logger.debug(f"[{session_id}] Intent error: {type(e).__name__}, details: {str(e)}")
-
-                # Fallback: use original query
-                intent = IntentOutput(
-                    normalized_query=query.strip(),
-                    filters=options.get("filters"),
-                    followups=[],
-                    ambiguity="medium",
+                logger.info(f"[{session_id}] Executing {'retry ' if is_retry else ''}search")
+                logger.debug(
+                    f"[{session_id}] Search input: normalized_query={intent.normalized_query!r}, "
+                    f"max_results={options.get('max_results', settings.intaste_max_search_results)}"
                 )
-                logger.debug(f"[{session_id}] Using fallback intent: {intent}")
-
-            # Yield intent event
-            yield SearchEvent(
-                type="intent",
-                data=IntentEventData(
-                    normalized_query=intent.normalized_query,
-                    filters=intent.filters,
-                    followups=intent.followups,
-                    ambiguity=intent.ambiguity,
-                    timing_ms=intent_ms,
-                ),
-                agent_id=self.agent_id,
-                agent_name=self.agent_name,
-            )
 
-            # ========================================
-            # Step 2: Search execution
-            # ========================================
-            yield SearchEvent(
-                type="status",
-                data=StatusEventData(phase="search"),
-                agent_id=self.agent_id,
-                agent_name=self.agent_name,
-            )
+                search_start = time.time()
 
-            logger.info(f"[{session_id}] Executing {'retry ' if is_retry else ''}search")
-            logger.debug(
-                f"[{session_id}] Search input: normalized_query={intent.normalized_query!r}, "
-                f"max_results={options.get('max_results', settings.intaste_max_search_results)}"
-            )
+                try:
+                    search_query = self._build_search_query(
+                        intent.normalized_query,
+                        intent.filters or options.get("filters"),
+                        options,
+                        is_retry,
+                    )
+                    logger.debug(f"[{session_id}] SearchQuery created: {search_query}")
 
-            search_start = time.time()
-
-            try:
-                search_query = SearchQuery(
-                    q=intent.normalized_query,
-                    page=1,
-                    size=options.get("max_results", settings.intaste_max_search_results),
-                    language=options.get("language", "en"),
-                    filters=intent.filters or options.get("filters"),
-                    timeout_ms=options.get(
-                        "retry_search_timeout_ms" if is_retry else "search_timeout_ms",
-                        settings.retry_search_timeout_ms if is_retry else self.search_timeout_ms,
-                    ),
-                )
-                logger.debug(f"[{session_id}] SearchQuery created: {search_query}")
+                    search_result = None
+                    if speculative_task is not None:
+                        search_result = await self._take_speculative_result(
+                            speculative_task, query, search_query, options, session_id
+                        )
+                        speculative_task = None
+                    if search_result is None:
+                        async with asyncio.timeout(
+                            search_query.timeout_ms / 1000 if search_query.timeout_ms else None
+                        ):
+                            search_result = await self._search(search_query, session_id)
+                    search_ms = int((time.time() - search_start) * 1000)
+                    total_search_ms += search_ms
+                    logger.info(
+                        f"[{session_id}] Search completed: {len(search_result.hits)} hits "
+                        f"(total: {search_result.total}, {search_ms}ms)"
+                    )
 
-                search_result = await self.search_provider.search(search_query)
-                search_ms = int((time.time() - search_start) * 1000)
-                total_search_ms += search_ms
-                logger.info(
-                    f"[{session_id}] Search completed: {len(search_result.hits)} hits "
-                    f"(total: {search_result.total}, {search_ms}ms)"
-                )
+                    if logger.isEnabledFor(logging.DEBUG) and search_result.hits:
+                        for idx, hit in enumerate(search_result.hits[:3], 1):
+                            logger.debug(
+                                f"[{session_id}] Hit #{idx}: id={hit.id}, "
+                                f"title={hit.title[:50]}, score={hit.score}"
+                            )
+
+                except (TimeoutError, Exception) as e:
+                    search_ms = int((time.time() - search_start) * 1000)
+                    total_search_ms += search_ms
+                    logger.error(f"[{session_id}] Search failed after {search_ms}ms: {e}")
+                    logger.debug(
+                        f"[{session_id}] Search error: {type(e).__name__}, "
+                        f"query={intent.normalized_query!r}"
+                    )
+                    # Search failure is critical - propagate exception
+                    raise RuntimeError(f"Search provider error: {e}") from e
 
-                if logger.isEnabledFor(logging.DEBUG) and search_result.hits:
-                    for idx, hit in enumerate(search_result.hits[:3], 1):
-                        logger.debug(
-                            f"[{session_id}] Hit #{idx}: id={hit.id}, "
-                            f"title={hit.title[:50]}, score={hit.score}"
+                # ========================================
+                # Step 3: Relevance evaluation
+                # ========================================
+                if search_result.hits:
+                    yield SearchEvent(
+                        type="status",
+                        data=StatusEventData(phase="relevance"),
+                        agent_id=self.agent_id,
+                        agent_name=self.agent_name,
+                    )
+
+                    logger.info(f"[{session_id}] Starting relevance evaluation")
+                    relevance_start = time.time()
+
+                    try:
+                        evaluated_hits = await self._evaluate_relevance(
+                            query=query,
+                            normalized_query=intent.normalized_query,
+                            hits=search_result.hits,
+                            session_id=session_id,
+                            timeout_ms=options.get(
+                                (
+                                    "retry_relevance_timeout_ms"
+                                    if is_retry
+                                    else "relevance_timeout_ms"
+                                ),
+                                (
+                                    settings.retry_relevance_timeout_ms
+                                    if is_retry
+                                    else settings.relevance_timeout_ms
+                                ),
+                            ),
+                            evaluation_count=options.get(
+                                "relevance_evaluation_count",
+                                settings.intaste_relevance_evaluation_count,
+                            ),
                         )
 
-            except (TimeoutError, Exception) as e:
-                search_ms = int((time.time() - search_start) * 1000)
-                total_search_ms += search_ms
-                logger.error(f"[{session_id}] Search failed after {search_ms}ms: {e}")
-                logger.debug(
-                    f"[{session_id}] Search error: {type(e).__name__}, "
-                    f"query={intent.normalized_query!r}"
-                )
-                # Search failure is critical - propagate exception
-                raise RuntimeError(f"Search provider error: {e}") from e
+                        relevance_ms = int((time.time() - relevance_start) * 1000)
+                        total_relevance_ms += relevance_ms
 
-            # ========================================
-            # Step 3: Relevance evaluation
-            # ========================================
-            if search_result.hits:
-                yield SearchEvent(
-                    type="status",
-                    data=StatusEventData(phase="relevance"),
-                    agent_id=self.agent_id,
-                    agent_name=self.agent_name,
-                )
+                        # Get max score
+                        max_score = max(
+                            (
+                                hit.relevance_score
+                                for hit in evaluated_hits
+                                if hit.relevance_score is not None
+                            ),
+                            default=0.0,
+                        )
 
-                logger.info(f"[{session_id}] Starting relevance evaluation")
-                relevance_start = time.time()
+                        logger.info(
+                            f"[{session_id}] Relevance evaluation completed: "
+                            f"max_score={max_score:.2f}, {relevance_ms}ms"
+                        )
 
-                try:
-                    evaluated_hits = await self._evaluate_relevance(
-                        query=query,
-                        normalized_query=intent.normalized_query,
-                        hits=search_result.hits,
-                        session_id=session_id,
-                        timeout_ms=options.get(
-                            "retry_relevance_timeout_ms" if is_retry else "relevance_timeout_ms",
-                            (
-                                settings.retry_relevance_timeout_ms
-                                if is_retry
-                                else settings.relevance_timeout_ms
+                        # Yield relevance event
+                        yield SearchEvent(
+                            type="relevance",
+                            data=RelevanceEventData(
+                                evaluated_count=len(evaluated_hits),
+                                max_score=max_score,
+                                timing_ms=relevance_ms,
                             ),
-                        ),
-                        evaluation_count=options.get(
-                            "relevance_evaluation_count",
-                            settings.intaste_relevance_evaluation_count,
-                        ),
-                    )
+                            agent_id=self.agent_id,
+                            agent_name=self.agent_name,
+                        )
 
-                    relevance_ms = int((time.time() - relevance_start) * 1000)
-                    total_relevance_ms += relevance_ms
+                    except Exception as e:
+                        relevance_ms = int((time.time() - relevance_start) * 1000)
+                        total_relevance_ms += relevance_ms
+                        logger.error(
+                            f"[{session_id}] Relevance evaluation failed after {relevance_ms}ms: {e}"
+                        )
+                        # Continue with unevaluated hits
+                        evaluated_hits = search_result.hits
+                        max_score = 0.0
+                else:
+                    # No hits to evaluate
+                    evaluated_hits = []
+                    max_score = 0.0
+                    logger.info(f"[{session_id}] No hits to evaluate")
+
+                # Remember a refinement only if it beat the attempt it replaced; a tie
+                # (e.g. both scored 0.0 because relevance evaluation failed) proves nothing
+                if (
+                    refined_intent is not None
+                    and refinement_key is not None
+                    and not refined_intent.is_fallback
+                    and max_score > previous_max_score
+                ):
+                    self._refinement_cache.set(refinement_key, refined_intent)
+                refined_intent = None
+
+                # ========================================
+                # Step 4: Retry decision
+                # ========================================
+                should_retry = self._should_retry(
+                    hits=evaluated_hits,
+                    threshold=threshold,
+                    retry_count=retry_count,
+                    max_retries=max_retries,
+                )
 
-                    # Get max score
-                    max_score = max(
-                        (
-                            hit.relevance_score
-                            for hit in evaluated_hits
-                            if hit.relevance_score is not None
-                        ),
-                        default=0.0,
-                    )
+                if should_retry:
+                    retry_count += 1
+                    previous_normalized_query = intent.normalized_query
+                    previous_max_score = max_score
 
                     logger.info(
-                        f"[{session_id}] Relevance evaluation completed: "
-                        f"max_score={max_score:.2f}, {relevance_ms}ms"
+                        f"[{session_id}] Max score ({max_score:.2f}) below threshold ({threshold}). "
+                        f"Retrying (attempt {retry_count + 1}/{max_retries + 1})"
                     )
 
-                    # Yield relevance event
+                    # Yield retry event
                     yield SearchEvent(
-                        type="relevance",
-                        data=RelevanceEventData(
-                            evaluated_count=len(evaluated_hits),
-                            max_score=max_score,
-                            timing_ms=relevance_ms,
+                        type="retry",
+                        data=RetryEventData(
+                            attempt=retry_count,
+                            reason=f"Max relevance score ({max_score:.2f}) below threshold ({threshold})",
+                            previous_max_score=max_score,
                         ),
                         agent_id=self.agent_id,
                         agent_name=self.agent_name,
                     )
 
-                except Exception as e:
-                    relevance_ms = int((time.time() - relevance_start) * 1000)
-                    total_relevance_ms += relevance_ms
-                    logger.error(
-                        f"[{session_id}] Relevance evaluation failed after {relevance_ms}ms: {e}"
+                    # Continue to next iteration
+                    continue
+                else:
+                    # Exit retry loop
+                    logger.info(
+                        f"[{session_id}] Search complete. Max score: {max_score:.2f}, "
+                        f"retry_count: {retry_count}"
                     )
-                    # Continue with unevaluated hits
-                    evaluated_hits = search_result.hits
-                    max_score = 0.0
-            else:
-                # No hits to evaluate
-                evaluated_hits = []
-                max_score = 0.0
-                logger.info(f"[{session_id}] No hits to evaluate")
+                    break
 
             # ========================================
-            # Step 4: Retry decision
+            # Final: Yield citations event
             # ========================================
-            should_retry = self._should_retry(
-                hits=evaluated_hits,
-                threshold=threshold,
-                retry_count=retry_count,
-                max_retries=max_retries,
+            # Hits were validated by the provider (and copied by _evaluate_relevance),
+            # so build the largest event without re-running validation over them
+            yield SearchEvent.model_construct(
+                type="citations",
+                data=CitationsEventData.model_construct(
+                    hits=evaluated_hits,
+                    total=search_result.total if search_result else 0,
+                    timing_ms=total_search_ms,
+                ),
+                agent_id=self.agent_id,
+                agent_name=self.agent_name,
             )
+        finally:
+            # A disconnect or aclose() mid-stream must not leave the raw-query search
+            # running (and holding a search slot) after the caller has gone
+            if speculative_task is not None and not speculative_task.done():
+                speculative_task.cancel()
 
-            if should_retry:
-                retry_count += 1
-                previous_normalized_query = intent.normalized_query
+        logger.debug(
+            f"[{session_id}] FessSearchAgent.search_stream completed: "
+            f"intent={total_intent_ms}ms, search={total_search_ms}ms, "
+            f"relevance={total_relevance_ms}ms, retry_count={retry_count}"
+        )
 
-                logger.info(
-                    f"[{session_id}] Max score ({max_score:.2f}) below threshold ({threshold}). "
-                    f"Retrying (attempt {retry_count + 1}/{max_retries + 1})"
-                )
+    async def _search(self, search_query: SearchQuery, session_id: str = "unknown") -> SearchResult:
+        """
+        Run a provider search, bounded by the agent's concurrent search limit.
+        """
+        if self._search_semaphore.locked():
+            logger.info(
+                f"[{session_id}] Search queued: {self.max_concurrent_searches} searches in flight"
+            )
+        async with self._search_semaphore:
+            return await self.search_provider.search(search_query)
 
-                # Yield retry event
-                yield SearchEvent(
-                    type="retry",
-                    data=RetryEventData(
-                        attempt=retry_count,
-                        reason=f"Max relevance score ({max_score:.2f}) below threshold ({threshold})",
-                        previous_max_score=max_score,
-                    ),
-                    agent_id=self.agent_id,
-                    agent_name=self.agent_name,
-                )
+    def _build_search_query(
+        self,
+        q: str,
+        filters: dict[str, Any] | None,
+        options: dict[str, Any],
+        is_retry: bool,
+    ) -> SearchQuery:
+        """
+        Build the provider query for one search attempt.
+        """
+        from ..config import settings
 
-                # Continue to next iteration
-                continue
-            else:
-                # Exit retry loop
-                logger.info(
-                    f"[{session_id}] Search complete. Max score: {max_score:.2f}, "
-                    f"retry_count: {retry_count}"
-                )
-                break
-
-        # ========================================
-        # Final: Yield citations event
-        # ========================================
-        yield SearchEvent(
-            type="citations",
-            data=CitationsEventData(
-                hits=evaluated_hits,
-                total=search_result.total if search_result else 0,
-                timing_ms=total_search_ms,
+        return SearchQuery(
+            q=q,
+            page=1,
+            size=options.get("max_results", settings.intaste_max_search_results),
+            language=options.get("language", "en"),
+            filters=filters,
+            timeout_ms=options.get(
+                "retry_search_timeout_ms" if is_retry else "search_timeout_ms",
+                settings.retry_search_timeout_ms if is_retry else self.search_timeout_ms,
             ),
-            agent_id=self.agent_id,
-            agent_name=self.agent_name,
         )
 
-        logger.debug(
-            f"[{session_id}] FessSearchAgent.search_stream completed: "
-            f"intent={total_intent_ms}ms, search={total_search_ms}ms, "
-            f"relevance={total_relevance_ms}ms, retry_count={retry_count}"
-        )
+    async def _take_speculative_result(
+        self,
+        task: asyncio.Task[SearchResult],
+        query: str,
+        search_query: SearchQuery,
+        options: dict[str, Any],
+        session_id: str,
+    ) -> SearchResult | None:
+        """
+        Resolve a speculative raw-query search started alongside intent extraction.
+
+        Returns:
+            The speculative result if it can stand in for search_query, otherwise
+            None (the task is cancelled and the caller runs the refined search)
+        """
+        similarity = _query_similarity(query, search_query.q)
+        if (
+            search_query.filters != options.get("filters")
+            or similarity < SPECULATIVE_REUSE_MIN_JACCARD
+        ):
+            logger.debug(
+                f"[{session_id}] Discarding speculative search: similarity={similarity:.2f}, "
+                f"filters={search_query.filters}"
+            )
+            task.cancel()
+            return None
+
+        try:
+            # Same deadline as a regular search; timing out fails the search step
+            async with asyncio.timeout(
+                search_query.timeout_ms / 1000 if search_query.timeout_ms else None
+            ):
+                result = await task
+        except TimeoutError:
+            task.cancel()
+            raise
+        except Exception as e:
+            logger.warning(f"[{session_id}] Speculative search failed, searching again: {e}")
+            return None
+
+        logger.debug(f"[{session_id}] Reusing speculative search (similarity={similarity:.2f})")
+        return result
 
     async def health(self) -> tuple[bool, dict[str, Any]]:
         """
@@ -414,8 +642,10 @@ class FessSearchAgent(BaseSearchAgent):
         Returns:
             Tuple of (is_healthy, details)
         """
-        search_healthy, search_details = await self.search_provider.health()
-        llm_healthy, llm_details = await self.llm_client.health()
+        # Probe both upstreams concurrently so a slow one doesn't add to the other
+        (search_healthy, search_details), (llm_healthy, llm_details) = await asyncio.gather(
+            self.search_provider.health(), self.llm_client.health()
+        )
 
         is_healthy = search_healthy and llm_healthy
         details = {
@@ -442,7 +672,10 @@ class FessSearchAgent(BaseSearchAgent):
         evaluation_count: int | None = None,
     ) -> list[SearchHit]:
         """
-        Evaluate relevance of search results in parallel and update relevance_score and relevance_reason fields.
+        Evaluate relevance of search results in parallel and fill in relevance_score and relevance_reason.
+
+        SearchHit is frozen, so scored hits are returned as copies and the given
+        hits are left untouched.
 
         Args:
             query: Original user query
@@ -483,7 +716,7 @@ class FessSearchAgent(BaseSearchAgent):
 
         async def evaluate_single_hit(
             hit: SearchHit, idx: int
-        ) -> tuple[SearchHit, Exception | None]:
+        ) -> tuple[SearchHit, RelevanceOutput | Exception]:
             """Evaluate a single hit with semaphore control."""
             async with semaphore:
                 try:
@@ -502,20 +735,12 @@ class FessSearchAgent(BaseSearchAgent):
                         timeout_ms=per_hit_timeout,
                     )
 
-                    # Create new SearchHit with relevance_score and relevance_reason
-                    evaluated_hit = hit.model_copy(
-                        update={
-                            "relevance_score": relevance_output.score,
-                            "relevance_reason": relevance_output.reason,
-                        }
-                    )
-
                     logger.debug(
                         f"[{session_id}] Hit #{idx} relevance: score={relevance_output.score:.2f}, "
                         f"reason={relevance_output.reason[:100]}"
                     )
 
-                    return (evaluated_hit, None)
+                    return (hit, relevance_output)
 
                 except Exception as e:
                     logger.warning(
@@ -548,10 +773,19 @@ class FessSearchAgent(BaseSearchAgent):
                 logger.error(f"[{session_id}] Unexpected evaluation error: {result}")
                 failed_count += 1
             elif isinstance(result, tuple):
-                evaluated_hit, error = result
-                evaluated_hits.append(evaluated_hit)
-                if error is not None:
+                # Scores are applied only once every evaluation is in, so a timeout
+                # above never leaves hits partially scored
+                evaluated_hit, outcome = result
+                if isinstance(outcome, Exception):
                     failed_count += 1
+                else:
+                    evaluated_hit = evaluated_hit.model_copy(
+                        update={
+                            "relevance_score": outcome.score,
+                            "relevance_reason": outcome.reason,
+                        }
+                    )
+                evaluated_hits.append(evaluated_hit)
 
         if failed_count > 0:
             logger.warning(
@@ -674,25 +908,21 @@ class FessSearchAgent(BaseSearchAgent):
         logger.debug(f"[{session_id}] Retry intent extraction started")
 
         try:
-            intent = await self.llm_client.intent(
-                query=query,
-                system_prompt=retry_template.system_prompt,
-                user_template=retry_template.user_template,
-                language=language,
-                filters=None,
-                query_history=None,
-                timeout_ms=timeout_ms,
-                template_params=template_params,
-            )
+            async with asyncio.timeout(timeout_ms / 1000):
+                intent = await self.llm_client.intent(
+                    query=query,
+                    system_prompt=retry_template.system_prompt,
+                    user_template=retry_template.user_template,
+                    language=language,
+                    filters=None,
+                    query_history=None,
+                    timeout_ms=timeout_ms,
+                    template_params=template_params,
+                )
             logger.info(f"[{session_id}] Retry intent extracted: {intent.normalized_query}")
             return intent
 
         except Exception as e:
             logger.error(f"[{session_id}] Retry intent extraction failed: {e}")
             # Fallback: use original query
-            return IntentOutput(
-                normalized_query=query.strip(),
-                filters=None,
-                followups=[],
-                ambiguity="medium",
-            )
+            return IntentOutput.fallback(query)
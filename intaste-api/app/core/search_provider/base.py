@@ -16,7 +16,7 @@ Base protocol for search providers.
 
 from typing import Any, Literal, Protocol
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class SearchHit(BaseModel):
@@ -24,6 +24,10 @@ class SearchHit(BaseModel):
     A single search result.
     """
 
+    # Immutable so one hit can be shared safely (e.g. across retries and caches);
+    # relevance evaluation returns scored copies via model_copy(update=...)
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     id: str
     title: str
     url: str
@@ -60,13 +60,13 @@ class SearchProviderFactory:
         Raises:
             ValueError: If provider_name is not registered
         """
-        if provider_name not in cls._registry:
+        constructor = cls._registry.get(provider_name)
+        if constructor is None:
             available = ", ".join(cls._registry.keys())
             raise ValueError(
                 f"Unknown search provider: {provider_name}. " f"Available providers: {available}"
             )
 
-        constructor = cls._registry[provider_name]
         return constructor(config)
 
     @classmethod
@@ -24,16 +24,27 @@ from .base import SearchHit, SearchQuery, SearchResult
 
 logger = logging.getLogger(__name__)
 
+# Connection pool for the long-lived client: keep warm connections to Fess
+# so requests skip the TCP handshake
+HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50, keepalive_expiry=30)
+
 
 class FessSearchProvider:
     """
     Fess OpenAPI search provider implementation.
     """
 
-    def __init__(self, base_url: str, timeout_ms: int = 2000):
+    def __init__(
+        self,
+        base_url: str,
+        timeout_ms: int = 2000,
+        client: httpx.AsyncClient | None = None,
+    ):
         self.base_url = base_url.rstrip("/")
         self.timeout_ms = timeout_ms
-        self.client = httpx.AsyncClient(timeout=timeout_ms / 1000.0)
+        # An injected client is owned by the caller and is not closed by close()
+        self._owns_client = client is None
+        self.client = client or httpx.AsyncClient(timeout=timeout_ms / 1000.0, limits=HTTP_LIMITS)
 
     async def search(self, query: SearchQuery) -> SearchResult:
         """
@@ -225,5 +236,6 @@ class FessSearchProvider:
             return (False, {"error": str(e)})
 
     async def close(self) -> None:
-        """Close HTTP client."""
-        await self.client.aclose()
+        """Close HTTP client if this provider created it."""
+        if self._owns_client:
+            await self.client.aclose()
@@ -15,6 +15,7 @@ API authentication using X-Intaste-Token header.
 """
 
 import hmac
+from functools import lru_cache
 
 from fastapi import Header, HTTPException, status
 
@@ -22,6 +23,12 @@ from ...i18n import _
 from ..config import settings
 
 
+@lru_cache(maxsize=1)
+def _encode_token(token: str) -> bytes:
+    """UTF-8 bytes of the configured token, encoded once per token value."""
+    return token.encode()
+
+
 async def verify_api_token(
     x_intaste_token: str | None = Header(None, alias="X-Intaste-Token")
 ) -> str:
@@ -48,8 +55,9 @@ async def verify_api_token(
             },
         )
 
-    # Use constant-time comparison to prevent timing attacks
-    if not hmac.compare_digest(x_intaste_token, settings.intaste_api_token):
+    # Use constant-time comparison to prevent timing attacks. Compare bytes:
+    # compare_digest rejects non-ASCII str, and headers may carry any latin-1
+    if not hmac.compare_digest(x_intaste_token.encode(), _encode_token(settings.intaste_api_token)):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail={
@@ -14,13 +14,15 @@
 Middleware for request tracking, CORS, and security headers.
 """
 
+import os
 import time
-import uuid
 from collections.abc import Awaitable, Callable
 
 from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from starlette.datastructures import Headers, MutableHeaders
 from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from ..config import settings
 
@@ -58,29 +60,40 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
         return response
 
 
-class RequestIDMiddleware(BaseHTTPMiddleware):
+class RequestIDMiddleware:
     """
     Add X-Request-ID to all requests and responses for tracing.
+
+    Implemented as plain ASGI rather than BaseHTTPMiddleware: it only needs to
+    tag the scope and the response start message, so it avoids the extra task
+    and Request/Response objects per request and never buffers streamed bodies.
     """
 
-    async def dispatch(
-        self, request: Request, call_next: Callable[[Request], Awaitable[Response]]
-    ) -> Response:
-        # Get or generate request ID
-        request_id = request.headers.get("X-Request-ID", str(uuid.uuid4()))
-        request.state.request_id = request_id
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # Get or generate request ID (request.state reads scope["state"]); a new ID
+        # is 128 random bits as 32 hex chars, without building a UUID object
+        request_id = Headers(scope=scope).get("x-request-id") or os.urandom(16).hex()
+        scope.setdefault("state", {})["request_id"] = request_id
 
         # Track timing
         start_time = time.time()
 
-        # Process request
-        response = await call_next(request)
-
-        # Add headers to response
-        response.headers["X-Request-ID"] = request_id
-        response.headers["X-Process-Time"] = f"{(time.time() - start_time) * 1000:.2f}ms"
+        async def send_with_request_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # Add headers to response
+                headers = MutableHeaders(scope=message)
+                headers["X-Request-ID"] = request_id
+                headers["X-Process-Time"] = f"{(time.time() - start_time) * 1000:.2f}ms"
+            await send(message)
 
-        return response
+        await self.app(scope, receive, send_with_request_id)
 
 
 def add_security_headers_middleware(app: FastAPI) -> None:
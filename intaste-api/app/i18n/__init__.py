@@ -18,7 +18,11 @@ Provides translation functionality using GNU gettext and Babel.
 
 import gettext
 import logging
+from collections.abc import Mapping
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
+from typing import Any
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +35,8 @@ _LOCALE_DIR = Path(__file__).parent.parent.parent / "locales"
 # Supported languages
 SUPPORTED_LANGUAGES = ["en", "ja", "zh_CN", "zh_TW", "de", "es", "fr"]
 
+_EMPTY_CATALOG: Mapping[Any, str] = MappingProxyType({})
+
 
 def setup_i18n(language: str = "en") -> gettext.GNUTranslations:
     """
@@ -80,6 +86,24 @@ def setup_i18n(language: str = "en") -> gettext.GNUTranslations:
         return null_translation  # type: ignore
 
 
+@lru_cache(maxsize=32)
+def _catalog_for(language: str) -> Mapping[Any, str]:
+    """
+    Resolve a request language code to its in-memory message catalog.
+
+    Cached per raw code, so the hot path skips normalization and the gettext
+    lookup chain; unsupported codes map to an empty catalog without touching
+    the filesystem or growing _translations.
+    """
+    normalized_lang = language.replace("-", "_")
+    if normalized_lang not in SUPPORTED_LANGUAGES:
+        return _EMPTY_CATALOG
+
+    translation = setup_i18n(normalized_lang)
+    # NullTranslations (missing .mo file) has no catalog
+    return getattr(translation, "_catalog", _EMPTY_CATALOG)
+
+
 def _(message: str, language: str = "en") -> str:
     """
     Get translated message for the given language.
@@ -98,19 +122,7 @@ def _(message: str, language: str = "en") -> str:
         >>> _("Unknown message", language="ja")
         'Unknown message'  # Falls back to original
     """
-    # Normalize language code
-    normalized_lang = language.replace("-", "_")
-
-    # Load translation if not cached
-    if normalized_lang not in _translations:
-        setup_i18n(normalized_lang)
-
-    translation = _translations.get(normalized_lang)
-    if translation:
-        return translation.gettext(message)
-
-    # Fallback to original message
-    return message
+    return _catalog_for(language).get(message, message)
 
 
 __all__ = ["_", "setup_i18n", "SUPPORTED_LANGUAGES"]
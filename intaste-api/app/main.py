@@ -18,10 +18,12 @@ import logging
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 
+import httpx
 from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
 
 from .core.config import settings
+from .core.health import HEALTH_HTTP_LIMITS
 from .core.llm.base import LLMClient
 from .core.llm.factory import LLMClientFactory
 from .core.search_agent.base import SearchAgent
@@ -49,6 +51,7 @@ search_provider: SearchProvider | None = None
 llm_client: LLMClient | None = None
 search_agent: SearchAgent | None = None
 assist_service: AssistService | None = None
+health_client: httpx.AsyncClient | None = None
 
 
 @asynccontextmanager
@@ -56,7 +59,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None]:
     """
     Application lifespan manager for startup and shutdown.
     """
-    global search_provider, llm_client, search_agent, assist_service
+    global search_provider, llm_client, search_agent, assist_service, health_client
 
     # Startup
     logger.info("Starting Intaste API...")
@@ -121,6 +124,9 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None]:
     )
     logger.debug("Assist service initialized")
 
+    # Shared client for dependency health probes (keeps connections across scrapes)
+    health_client = httpx.AsyncClient(limits=HEALTH_HTTP_LIMITS)
+
     # Warm up LLM model if enabled
     if settings.intaste_llm_warmup_enabled:
         logger.info("LLM warmup enabled, preloading model...")
@@ -154,6 +160,9 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None]:
         await search_agent.close()
         logger.debug("Search agent closed")
     # Note: search_provider and llm_client are closed via search_agent.close()
+    if health_client:
+        await health_client.aclose()
+        health_client = None
     logger.info("Intaste API shut down complete")
 
 
@@ -16,6 +16,7 @@ Health check endpoints with liveness and readiness probes.
 
 from datetime import UTC, datetime
 
+import httpx
 from fastapi import APIRouter, Response, status
 
 from ..core.config import settings
@@ -25,6 +26,13 @@ from ..schemas.common import DetailedHealthResponse, HealthResponse
 router = APIRouter(tags=["health"])
 
 
+def get_health_client() -> httpx.AsyncClient | None:
+    """Return the app-wide health probe client (None outside the app lifespan)."""
+    from app.main import health_client
+
+    return health_client
+
+
 @router.get(
     "/health",
     response_model=HealthResponse,
@@ -86,6 +94,7 @@ async def readiness_check(response: Response) -> HealthResponse:
     dependencies = await check_all_dependencies(
         fess_url=settings.fess_base_url,
         ollama_url=settings.ollama_base_url,
+        client=get_health_client(),
     )
 
     # Determine overall status
@@ -125,6 +134,7 @@ async def detailed_health_check(response: Response) -> DetailedHealthResponse:
     dependencies = await check_all_dependencies(
         fess_url=settings.fess_base_url,
         ollama_url=settings.ollama_base_url,
+        client=get_health_client(),
     )
 
     # Determine overall status
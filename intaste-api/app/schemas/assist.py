@@ -93,7 +93,7 @@ class AssistQueryRequest(BaseModel):
 
     query: str = Field(..., min_length=1, max_length=4096, description="Natural language query")
     session_id: str | None = Field(None, description="Session ID (UUID v4)")
-    query_history: list[QueryHistoryItem] | None = Field(
+    query_history: tuple[QueryHistoryItem, ...] | None = Field(
         None,
         max_length=10,
         description="Previous queries in this session (most recent first, max 10, each max 4096 chars)",
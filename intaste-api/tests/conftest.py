@@ -17,11 +17,15 @@
 import os
 os.environ.setdefault("INTASTE_API_TOKEN", "test-token-32-characters-long-secure")
 
+import asyncio
+import functools
+import inspect
+
 import pytest
 from typing import AsyncGenerator
 from httpx import AsyncClient
 from fastapi.testclient import TestClient
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from app.main import app
 from app.core.config import Settings
@@ -29,12 +33,69 @@ from app.core.search_agent.base import SearchAgent, SearchAgentResult, SearchAge
 from app.core.search_provider.base import SearchProvider, SearchResult, SearchQuery, SearchHit
 from app.core.llm.base import LLMClient, IntentOutput, ComposeOutput
 
+# Single source of truth for the test API token: the global settings read it
+# from the environment, and test_settings/auth_headers reuse the same value.
+TEST_API_TOKEN = os.environ["INTASTE_API_TOKEN"]
 
-@pytest.fixture
+
+# Upper bound for any single async test. A mock that is never resolved (or an
+# agent regression that awaits forever) then fails with TimeoutError instead of
+# hanging CI until the job timeout; hitting it almost always means a
+# misconfigured mock rather than a slow test.
+ASYNC_TEST_TIMEOUT_S = 10
+
+
+def _with_timeout(test, seconds: float):
+    """Wrap an async test function in asyncio.timeout (cooperative, no signals)."""
+
+    @functools.wraps(test)
+    async def wrapper(*args, **kwargs):
+        async with asyncio.timeout(seconds):
+            return await test(*args, **kwargs)
+
+    return wrapper
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption(
+        "--all-combinations",
+        action="store_true",
+        default=False,
+        help="Run every case of tests marked all_combinations (default: first case only)",
+    )
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    """Bound async tests by ASYNC_TEST_TIMEOUT_S; keep only the first all_combinations case."""
+    for item in items:
+        if isinstance(item, pytest.Function) and inspect.iscoroutinefunction(item.obj):
+            item.obj = _with_timeout(item.obj, ASYNC_TEST_TIMEOUT_S)
+
+    if config.getoption("--all-combinations"):
+        return
+
+    selected, deselected = [], []
+    for item in items:
+        callspec = getattr(item, "callspec", None)
+        if (
+            callspec is not None
+            and item.get_closest_marker("all_combinations") is not None
+            and any(index != 0 for index in callspec.indices.values())
+        ):
+            deselected.append(item)
+        else:
+            selected.append(item)
+
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
+
+
+@pytest.fixture(scope="session")
 def test_settings() -> Settings:
-    """Create test settings with safe defaults"""
+    """Test settings with safe defaults, validated once per session (treat as read-only)"""
     return Settings(
-        intaste_api_token="test-token-32-characters-long-secure",
+        intaste_api_token=TEST_API_TOKEN,
         fess_base_url="http://test-fess:8080",
         ollama_base_url="http://test-ollama:11434",
         req_timeout_ms=5000,
@@ -44,6 +105,32 @@ def test_settings() -> Settings:
     )
 
 
+# Trusted sample hits shared by the mock fixtures, built once without
+# validation (SearchHit is frozen, so the instances can be shared)
+_SAMPLE_HITS = (
+    SearchHit.model_construct(
+        id="doc1",
+        title="Test Document 1",
+        snippet="This is a <em>test</em> document snippet",
+        url="http://example.com/doc1",
+        score=0.95,
+        meta={"site": "example.com", "type": "html"},
+    ),
+    SearchHit.model_construct(
+        id="doc2",
+        title="Test Document 2",
+        snippet="Another test document with relevant information",
+        url="http://example.com/doc2",
+        score=0.85,
+        meta={"site": "example.com", "type": "pdf"},
+    ),
+)
+
+
+def _sample_hits() -> list[SearchHit]:
+    return list(_SAMPLE_HITS)
+
+
 @pytest.fixture
 def mock_search_provider() -> AsyncMock:
     """Mock SearchProvider for testing"""
@@ -51,24 +138,7 @@ def mock_search_provider() -> AsyncMock:
 
     # Default search response
     provider.search.return_value = SearchResult(
-        hits=[
-            SearchHit(
-                id="doc1",
-                title="Test Document 1",
-                snippet="This is a <em>test</em> document snippet",
-                url="http://example.com/doc1",
-                score=0.95,
-                meta={"site": "example.com", "type": "html"},
-            ),
-            SearchHit(
-                id="doc2",
-                title="Test Document 2",
-                snippet="Another test document with relevant information",
-                url="http://example.com/doc2",
-                score=0.85,
-                meta={"site": "example.com", "type": "pdf"},
-            ),
-        ],
+        hits=_sample_hits(),
         total=2,
         page=1,
         size=5,
@@ -115,24 +185,7 @@ def mock_search_agent(mock_search_provider: AsyncMock, mock_llm_client: AsyncMoc
 
     # Default search result
     agent.search.return_value = SearchAgentResult(
-        hits=[
-            SearchHit(
-                id="doc1",
-                title="Test Document 1",
-                snippet="This is a <em>test</em> document snippet",
-                url="http://example.com/doc1",
-                score=0.95,
-                meta={"site": "example.com", "type": "html"},
-            ),
-            SearchHit(
-                id="doc2",
-                title="Test Document 2",
-                snippet="Another test document with relevant information",
-                url="http://example.com/doc2",
-                score=0.85,
-                meta={"site": "example.com", "type": "pdf"},
-            ),
-        ],
+        hits=_sample_hits(),
         total=2,
         normalized_query="test query optimized",
         original_query="test query",
@@ -197,16 +250,7 @@ def mock_search_agent(mock_search_provider: AsyncMock, mock_llm_client: AsyncMoc
         else:
             # Default search result
             search_result = SearchResult(
-                hits=[
-                    SearchHit(
-                        id="doc1",
-                        title="Test Document 1",
-                        snippet="This is a <em>test</em> document snippet",
-                        url="http://example.com/doc1",
-                        score=0.95,
-                        meta={"site": "example.com", "type": "html"},
-                    ),
-                ],
+                hits=_sample_hits()[:1],
                 total=1,
                 page=1,
                 size=5,
@@ -242,15 +286,22 @@ def assist_service(mock_search_agent: AsyncMock, mock_llm_client: AsyncMock):
     )
 
 
+@pytest.fixture
+def patch_assist_service(assist_service):
+    """Install the mocked AssistService as the app-global service for one test"""
+    with patch("app.main.assist_service", assist_service):
+        yield assist_service
+
+
 @pytest.fixture
 def client() -> TestClient:
     """Create FastAPI test client"""
     return TestClient(app)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 async def async_client() -> AsyncGenerator[AsyncClient, None]:
-    """Create async HTTP client for testing"""
+    """Create async HTTP client shared by all tests in the session"""
     from httpx import ASGITransport
     async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
         yield client
@@ -0,0 +1,40 @@
+# Copyright (c) 2025 CodeLibs
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+SSE helpers shared by the streaming endpoint integration tests.
+"""
+
+import re
+
+import orjson
+
+# Matches one SSE frame as emitted by format_sse(): "event: <type>\ndata: <json>"
+SSE_EVENT = re.compile(rb"event: (?P<event>\S+)\ndata: (?P<data>.+)")
+
+
+def parse_sse_events(body: bytes) -> list[dict]:
+    """Parse an SSE response body into a list of {"event", "data"} dicts."""
+    return [
+        {"event": m["event"].decode(), "data": orjson.loads(m["data"])}
+        for m in SSE_EVENT.finditer(body)
+    ]
+
+
+def const_stream(*chunks: str):
+    """Build a compose_stream replacement that yields the given chunks."""
+
+    async def stream(*args, **kwargs):
+        for chunk in chunks:
+            yield chunk
+
+    return stream
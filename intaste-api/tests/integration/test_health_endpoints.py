@@ -20,7 +20,6 @@ from pytest_httpx import HTTPXMock
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
 async def test_health_check_basic(async_client: AsyncClient):
     """Test basic health check endpoint."""
     response = await async_client.get("/api/v1/health")
@@ -31,7 +30,6 @@ async def test_health_check_basic(async_client: AsyncClient):
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
 async def test_liveness_probe(async_client: AsyncClient):
     """Test liveness probe endpoint."""
     response = await async_client.get("/api/v1/health/live")
@@ -42,7 +40,6 @@ async def test_liveness_probe(async_client: AsyncClient):
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
 async def test_readiness_probe_healthy(
     async_client: AsyncClient,
     httpx_mock: HTTPXMock,
@@ -70,7 +67,6 @@ async def test_readiness_probe_healthy(
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
 async def test_readiness_probe_not_ready(
     async_client: AsyncClient,
     httpx_mock: HTTPXMock,
@@ -98,7 +94,6 @@ async def test_readiness_probe_not_ready(
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
 async def test_readiness_probe_degraded(
     async_client: AsyncClient,
     httpx_mock: HTTPXMock,
@@ -126,7 +121,6 @@ async def test_readiness_probe_degraded(
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
 async def test_detailed_health_all_healthy(
     async_client: AsyncClient,
     httpx_mock: HTTPXMock,
@@ -168,7 +162,6 @@ async def test_detailed_health_all_healthy(
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
 async def test_detailed_health_degraded(
     async_client: AsyncClient,
     httpx_mock: HTTPXMock,
@@ -199,7 +192,6 @@ async def test_detailed_health_degraded(
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
 async def test_detailed_health_unhealthy(
     async_client: AsyncClient,
     httpx_mock: HTTPXMock,
@@ -232,7 +224,6 @@ async def test_detailed_health_unhealthy(
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
 async def test_health_endpoints_no_auth_required(async_client: AsyncClient):
     """Test that health endpoints don't require authentication."""
     # Test basic health - no auth needed
@@ -14,8 +14,27 @@
 Integration tests for model management endpoints.
 """
 
+import asyncio
+import itertools
+import uuid
+
 import pytest
-from uuid import uuid4
+from pydantic import TypeAdapter
+
+from app.routers.models import selected_models
+from app.schemas.models import ModelsResponse
+
+# Validates the full /api/v1/models payload shape in one pydantic-core call
+_MODELS_RESPONSE = TypeAdapter(ModelsResponse)
+
+# Session IDs only need to be unique within the run, so a counter is enough
+_uuid_counter = itertools.count(1)
+
+
+@pytest.fixture(autouse=True)
+def fast_uuid(monkeypatch):
+    """Replace uuid4 with a deterministic counter (no os.urandom syscall)."""
+    monkeypatch.setattr("uuid.uuid4", lambda: uuid.UUID(int=next(_uuid_counter)))
 
 
 @pytest.mark.integration
@@ -27,13 +46,11 @@ class TestModelsListEndpoint:
         response = client.get("/api/v1/models", headers=auth_headers)
 
         assert response.status_code == 200
-        data = response.json()
+        models = _MODELS_RESPONSE.validate_python(response.json(), strict=True)
 
-        assert "default" in data
-        assert "available" in data
-        assert "selected_per_session" in data
-        assert isinstance(data["available"], list)
-        assert len(data["available"]) > 0
+        # Every field must be present in the payload, not filled from defaults
+        assert models.model_fields_set == set(ModelsResponse.model_fields)
+        assert len(models.available) > 0
 
     def test_list_models_without_auth(self, client):
         """Test listing models without authentication."""
@@ -65,9 +82,8 @@ class TestModelsListEndpoint:
         response = client.get("/api/v1/models", headers=auth_headers)
 
         assert response.status_code == 200
-        data = response.json()
-
-        assert isinstance(data["selected_per_session"], dict)
+        # Strict validation rejects anything but a str -> str mapping
+        _MODELS_RESPONSE.validate_python(response.json(), strict=True)
 
 
 @pytest.mark.integration
@@ -91,7 +107,7 @@ class TestModelsSelectEndpoint:
 
     def test_select_model_session_scope(self, client, auth_headers):
         """Test selecting model with session scope."""
-        session_id = str(uuid4())
+        session_id = str(uuid.uuid4())
 
         response = client.post(
             "/api/v1/models/select",
@@ -169,7 +185,7 @@ class TestModelsSelectEndpoint:
 
     def test_select_model_persistence_in_session(self, client, auth_headers):
         """Test that selected model persists in session."""
-        session_id = str(uuid4())
+        session_id = str(uuid.uuid4())
 
         # Select model for session
         response1 = client.post(
@@ -184,18 +200,13 @@ class TestModelsSelectEndpoint:
 
         assert response1.status_code == 200
 
-        # List models and check selected_per_session
-        response2 = client.get("/api/v1/models", headers=auth_headers)
-
-        assert response2.status_code == 200
-        data = response2.json()
-
-        assert session_id in data["selected_per_session"]
-        assert data["selected_per_session"][session_id] == "persistent-model"
+        # Check the stored per-session selection
+        assert session_id in selected_models
+        assert selected_models[session_id] == "persistent-model"
 
     def test_select_model_override_session(self, client, auth_headers):
         """Test overriding model selection for same session."""
-        session_id = str(uuid4())
+        session_id = str(uuid.uuid4())
 
         # First selection
         response1 = client.post(
@@ -224,38 +235,37 @@ class TestModelsSelectEndpoint:
         assert response2.status_code == 200
 
         # Verify override
-        response3 = client.get("/api/v1/models", headers=auth_headers)
-        data = response3.json()
+        assert selected_models[session_id] == "model-v2"
 
-        assert data["selected_per_session"][session_id] == "model-v2"
-
-    def test_select_model_multiple_sessions(self, client, auth_headers):
+    async def test_select_model_multiple_sessions(self, async_client, auth_headers):
         """Test selecting different models for different sessions."""
-        session_ids = [str(uuid4()) for _ in range(3)]
+        session_ids = [str(uuid.uuid4()) for _ in range(3)]
         models = ["model-1", "model-2", "model-3"]
 
-        # Select different models for each session
-        for session_id, model in zip(session_ids, models):
-            response = client.post(
-                "/api/v1/models/select",
-                json={
-                    "model": model,
-                    "scope": "session",
-                    "session_id": session_id,
-                },
-                headers=auth_headers,
-            )
+        # Select different models for each session concurrently
+        responses = await asyncio.gather(
+            *[
+                async_client.post(
+                    "/api/v1/models/select",
+                    json={
+                        "model": model,
+                        "scope": "session",
+                        "session_id": session_id,
+                    },
+                    headers=auth_headers,
+                )
+                for session_id, model in zip(session_ids, models, strict=True)
+            ]
+        )
 
+        for response in responses:
             assert response.status_code == 200
 
         # Verify all selections
-        response = client.get("/api/v1/models", headers=auth_headers)
-        data = response.json()
+        for session_id, model in zip(session_ids, models, strict=True):
+            assert selected_models[session_id] == model
 
-        for session_id, model in zip(session_ids, models):
-            assert data["selected_per_session"][session_id] == model
-
-    def test_select_model_with_special_characters(self, client, auth_headers):
+    async def test_select_model_with_special_characters(self, async_client, auth_headers):
         """Test selecting model with special characters in name."""
         special_models = [
             "model-with-dashes",
@@ -264,13 +274,18 @@ class TestModelsSelectEndpoint:
             "model:v1.0",
         ]
 
-        for model in special_models:
-            response = client.post(
-                "/api/v1/models/select",
-                json={"model": model, "scope": "default"},
-                headers=auth_headers,
-            )
+        responses = await asyncio.gather(
+            *[
+                async_client.post(
+                    "/api/v1/models/select",
+                    json={"model": model, "scope": "default"},
+                    headers=auth_headers,
+                )
+                for model in special_models
+            ]
+        )
 
+        for model, response in zip(special_models, responses, strict=True):
             # Should accept any string
             assert response.status_code == 200
             data = response.json()
@@ -14,16 +14,38 @@
 Integration tests for streaming edge cases and error scenarios.
 """
 
-import json
+from collections.abc import AsyncIterator
+from unittest.mock import AsyncMock
+
 import pytest
-from unittest.mock import AsyncMock, patch
+from httpx import Response
 
 from app.core.llm.base import IntentOutput
 from app.core.search_provider.base import SearchResult, SearchHit
+from tests.integration.sse_helpers import const_stream, parse_sse_events
+
+# Route requests to the mocked AssistService for every test in this module
+pytestmark = pytest.mark.usefixtures("patch_assist_service")
+
+# Shared zero-hit search result; tests only read it
+_EMPTY_SEARCH_RESULT = SearchResult(total=0, hits=[], page=1, size=5)
+
+async def _aiter_sse_events(response: Response) -> AsyncIterator[dict]:
+    """Incrementally parse SSE events from a streamed response without buffering it all."""
+    buffer = b""
+    async for raw in response.aiter_bytes():
+        buffer += raw
+        end = buffer.rfind(b"\n\n")
+        if end == -1:
+            continue
+        for event in parse_sse_events(buffer[:end]):
+            yield event
+        buffer = buffer[end + 2 :]
+    for event in parse_sse_events(buffer):
+        yield event
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
 async def test_stream_query_with_empty_chunks(
     async_client,
     mock_search_provider,
@@ -57,39 +79,18 @@ async def test_stream_query_with_empty_chunks(
     )
 
     # Mock streaming with empty chunks
-    async def mock_compose_stream(*args, **kwargs):
-        yield ""  # Empty chunk
-        yield "Text"
-        yield ""  # Another empty chunk
-        yield " content"
-
-    mock_llm_client.compose_stream = mock_compose_stream
+    mock_llm_client.compose_stream = const_stream("", "Text", "", " content")
 
-    with patch("app.main.assist_service", assist_service):
-        response = await async_client.post(
-            "/api/v1/assist/query",
-            json={"query": "test"},
-            headers={**auth_headers, "Accept": "text/event-stream"},
-        )
+    response = await async_client.post(
+        "/api/v1/assist/query",
+        json={"query": "test"},
+        headers={**auth_headers, "Accept": "text/event-stream"},
+    )
 
     assert response.status_code == 200
 
     # Parse events
-    events = []
-    for line in response.text.strip().split("\n\n"):
-        if line:
-            lines = line.split("\n")
-            event_type = None
-            event_data = None
-
-            for l in lines:
-                if l.startswith("event: "):
-                    event_type = l[7:]
-                elif l.startswith("data: "):
-                    event_data = json.loads(l[6:])
-
-            if event_type and event_data:
-                events.append({"event": event_type, "data": event_data})
+    events = parse_sse_events(response.content)
 
     # Should have chunk events (including empty ones or skipped)
     chunk_events = [e for e in events if e["event"] == "chunk"]
@@ -98,7 +99,6 @@ async def test_stream_query_with_empty_chunks(
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
 async def test_stream_query_with_search_agent_stream_failure(
     async_client,
     mock_search_provider,
@@ -138,12 +138,11 @@ async def test_stream_query_with_search_agent_stream_failure(
 
     assist_service.search_agent.search_stream = failing_search_stream
 
-    with patch("app.main.assist_service", assist_service):
-        response = await async_client.post(
-            "/api/v1/assist/query",
-            json={"query": "test"},
-            headers={**auth_headers, "Accept": "text/event-stream"},
-        )
+    response = await async_client.post(
+        "/api/v1/assist/query",
+        json={"query": "test"},
+        headers={**auth_headers, "Accept": "text/event-stream"},
+    )
 
     # Search stream failure should result in error
     # May be 500 status or error event in stream
@@ -151,7 +150,6 @@ async def test_stream_query_with_search_agent_stream_failure(
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
 async def test_stream_query_with_compose_failure(
     async_client,
     mock_search_provider,
@@ -191,18 +189,16 @@ async def test_stream_query_with_compose_failure(
 
     mock_llm_client.compose_stream = mock_compose_stream
 
-    with patch("app.main.assist_service", assist_service):
-        response = await async_client.post(
-            "/api/v1/assist/query",
-            json={"query": "test"},
-            headers={**auth_headers, "Accept": "text/event-stream"},
-        )
+    response = await async_client.post(
+        "/api/v1/assist/query",
+        json={"query": "test"},
+        headers={**auth_headers, "Accept": "text/event-stream"},
+    )
 
     assert response.status_code in [200, 500]
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
 async def test_stream_query_with_very_large_response(
     async_client,
     mock_search_provider,
@@ -225,41 +221,41 @@ async def test_stream_query_with_very_large_response(
             id=str(i),
             title=f"Document {i}",
             url=f"https://example.com/{i}",
-            snippet=f"Content {i}" * 100,  # Large snippet
+            snippet=f"Content {i}" * 40,  # Large snippet
             score=0.9,
         )
-        for i in range(50)  # Many hits
+        for i in range(8)  # Many hits
     ]
 
     mock_search_provider.search.return_value = SearchResult(
-        total=50,
+        total=len(hits),
         hits=hits,
         page=1,
-        size=50,
+        size=len(hits),
     )
 
     # Mock streaming with large response
-    async def mock_compose_stream(*args, **kwargs):
-        # Generate large chunks
-        for i in range(100):
-            yield f"Chunk {i} with some content. " * 10
-
-    mock_llm_client.compose_stream = mock_compose_stream
+    mock_llm_client.compose_stream = const_stream(
+        *(f"Chunk {i} with some content. " * 4 for i in range(16))
+    )
 
-    with patch("app.main.assist_service", assist_service):
-        response = await async_client.post(
-            "/api/v1/assist/query",
-            json={"query": "test", "options": {"max_results": 50}},
-            headers={**auth_headers, "Accept": "text/event-stream"},
-        )
+    async with async_client.stream(
+        "POST",
+        "/api/v1/assist/query",
+        json={"query": "test", "options": {"max_results": 50}},
+        headers={**auth_headers, "Accept": "text/event-stream"},
+    ) as response:
+        assert response.status_code == 200
+        events = [event async for event in _aiter_sse_events(response)]
+        received_bytes = response.num_bytes_downloaded
 
     # Should handle large response
-    assert response.status_code == 200
-    assert len(response.text) > 10000  # Should be large
+    assert received_bytes > 10000  # Should be large
+    assert len([e for e in events if e["event"] == "chunk"]) == 16
+    assert events[-1]["event"] == "complete"
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
 async def test_stream_query_with_unicode_content(
     async_client,
     mock_search_provider,
@@ -293,38 +289,18 @@ async def test_stream_query_with_unicode_content(
     )
 
     # Mock streaming with Unicode
-    async def mock_compose_stream(*args, **kwargs):
-        yield "これは"
-        yield "回答です。"
-        yield "🚀"
-
-    mock_llm_client.compose_stream = mock_compose_stream
+    mock_llm_client.compose_stream = const_stream("これは", "回答です。", "🚀")
 
-    with patch("app.main.assist_service", assist_service):
-        response = await async_client.post(
-            "/api/v1/assist/query",
-            json={"query": "日本語クエリ"},
-            headers={**auth_headers, "Accept": "text/event-stream"},
-        )
+    response = await async_client.post(
+        "/api/v1/assist/query",
+        json={"query": "日本語クエリ"},
+        headers={**auth_headers, "Accept": "text/event-stream"},
+    )
 
     assert response.status_code == 200
 
     # Parse and verify Unicode handling
-    events = []
-    for line in response.text.strip().split("\n\n"):
-        if line:
-            lines = line.split("\n")
-            event_type = None
-            event_data = None
-
-            for l in lines:
-                if l.startswith("event: "):
-                    event_type = l[7:]
-                elif l.startswith("data: "):
-                    event_data = json.loads(l[6:])
-
-            if event_type and event_data:
-                events.append({"event": event_type, "data": event_data})
+    events = parse_sse_events(response.content)
 
     # Verify Unicode in citations
     citations_event = next((e for e in events if e["event"] == "citations"), None)
@@ -333,55 +309,51 @@ async def test_stream_query_with_unicode_content(
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
+@pytest.mark.all_combinations
+@pytest.mark.parametrize(
+    "special_query",
+    [
+        "query with <script>alert('xss')</script>",
+        "query with SQL' OR '1'='1",
+        "query with newlines\nand\ttabs",
+        "query with emoji 🔍 and symbols !@#$%",
+    ],
+    ids=["xss", "sqli", "newlines", "emoji"],
+)
 async def test_stream_query_with_special_characters_in_query(
     async_client,
     mock_search_provider,
     mock_llm_client,
     assist_service,
     auth_headers,
+    special_query,
 ):
     """Test streaming query with special characters."""
-    special_queries = [
-        "query with <script>alert('xss')</script>",
-        "query with SQL' OR '1'='1",
-        "query with newlines\nand\ttabs",
-        "query with emoji 🔍 and symbols !@#$%",
-    ]
-
-    for special_query in special_queries:
-        # Mock intent extraction
-        mock_llm_client.intent.return_value = IntentOutput(
-            normalized_query=special_query,
-            filters=None,
-            followups=[],
-            ambiguity="low",
-        )
-
-        # Mock search
-        mock_search_provider.search.return_value = SearchResult(
-            total=0, hits=[], page=1, size=5
-        )
+    # Mock intent extraction
+    mock_llm_client.intent.return_value = IntentOutput(
+        normalized_query=special_query,
+        filters=None,
+        followups=[],
+        ambiguity="low",
+    )
 
-        # Mock streaming
-        async def mock_compose_stream(*args, **kwargs):
-            yield "No results."
+    # Mock search
+    mock_search_provider.search.return_value = _EMPTY_SEARCH_RESULT
 
-        mock_llm_client.compose_stream = mock_compose_stream
+    # Mock streaming
+    mock_llm_client.compose_stream = const_stream("No results.")
 
-        with patch("app.main.assist_service", assist_service):
-            response = await async_client.post(
-                "/api/v1/assist/query",
-                json={"query": special_query},
-                headers={**auth_headers, "Accept": "text/event-stream"},
-            )
+    response = await async_client.post(
+        "/api/v1/assist/query",
+        json={"query": special_query},
+        headers={**auth_headers, "Accept": "text/event-stream"},
+    )
 
-        # Should handle special characters
-        assert response.status_code in [200, 422]
+    # Should handle special characters
+    assert response.status_code in [200, 422]
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
 async def test_stream_query_with_zero_results(
     async_client,
     mock_search_provider,
@@ -399,41 +371,21 @@ async def test_stream_query_with_zero_results(
     )
 
     # Mock search with zero results
-    mock_search_provider.search.return_value = SearchResult(
-        total=0, hits=[], page=1, size=5
-    )
+    mock_search_provider.search.return_value = _EMPTY_SEARCH_RESULT
 
     # Mock streaming
-    async def mock_compose_stream(*args, **kwargs):
-        yield "No results found."
-
-    mock_llm_client.compose_stream = mock_compose_stream
+    mock_llm_client.compose_stream = const_stream("No results found.")
 
-    with patch("app.main.assist_service", assist_service):
-        response = await async_client.post(
-            "/api/v1/assist/query",
-            json={"query": "nonexistent"},
-            headers={**auth_headers, "Accept": "text/event-stream"},
-        )
+    response = await async_client.post(
+        "/api/v1/assist/query",
+        json={"query": "nonexistent"},
+        headers={**auth_headers, "Accept": "text/event-stream"},
+    )
 
     assert response.status_code == 200
 
     # Parse events
-    events = []
-    for line in response.text.strip().split("\n\n"):
-        if line:
-            lines = line.split("\n")
-            event_type = None
-            event_data = None
-
-            for l in lines:
-                if l.startswith("event: "):
-                    event_type = l[7:]
-                elif l.startswith("data: "):
-                    event_data = json.loads(l[6:])
-
-            if event_type and event_data:
-                events.append({"event": event_type, "data": event_data})
+    events = parse_sse_events(response.content)
 
     # Should have citations event with empty hits
     citations_event = next((e for e in events if e["event"] == "citations"), None)
@@ -442,7 +394,6 @@ async def test_stream_query_with_zero_results(
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
 async def test_stream_query_connection_headers(
     async_client,
     mock_search_provider,
@@ -476,17 +427,13 @@ async def test_stream_query_connection_headers(
     )
 
     # Mock streaming
-    async def mock_compose_stream(*args, **kwargs):
-        yield "Test response"
+    mock_llm_client.compose_stream = const_stream("Test response")
 
-    mock_llm_client.compose_stream = mock_compose_stream
-
-    with patch("app.main.assist_service", assist_service):
-        response = await async_client.post(
-            "/api/v1/assist/query",
-            json={"query": "test"},
-            headers={**auth_headers, "Accept": "text/event-stream"},
-        )
+    response = await async_client.post(
+        "/api/v1/assist/query",
+        json={"query": "test"},
+        headers={**auth_headers, "Accept": "text/event-stream"},
+    )
 
     # Verify SSE headers
     assert response.headers["content-type"] == "text/event-stream; charset=utf-8"
@@ -14,7 +14,6 @@
 Integration tests for streaming API endpoint.
 """
 
-import json
 from unittest.mock import AsyncMock
 
 import pytest
@@ -22,10 +21,13 @@ from httpx import AsyncClient
 
 from app.core.llm.base import IntentOutput
 from app.core.search_provider.base import SearchResult, SearchHit
+from tests.integration.sse_helpers import const_stream, parse_sse_events
+
+# Route requests to the mocked AssistService for every test in this module
+pytestmark = pytest.mark.usefixtures("patch_assist_service")
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
 async def test_stream_query_success(
     async_client: AsyncClient,
     mock_search_provider: AsyncMock,
@@ -59,26 +61,17 @@ async def test_stream_query_success(
     )
 
     # Mock streaming response
-    async def mock_compose_stream(*args, **kwargs):
-        yield "This "
-        yield "is "
-        yield "a "
-        yield "test."
-
-    mock_llm_client.compose_stream = mock_compose_stream
-
-    # Patch the assist service
-    from unittest.mock import patch
-    with patch("app.main.assist_service", assist_service):
-        # Make streaming request
-        response = await async_client.post(
-            "/api/v1/assist/query",
-            json={"query": "What is a test?"},
-            headers={
-                **auth_headers,
-                "Accept": "text/event-stream",
-            },
-        )
+    mock_llm_client.compose_stream = const_stream("This ", "is ", "a ", "test.")
+
+    # Make streaming request
+    response = await async_client.post(
+        "/api/v1/assist/query",
+        json={"query": "What is a test?"},
+        headers={
+            **auth_headers,
+            "Accept": "text/event-stream",
+        },
+    )
 
     assert response.status_code == 200
     assert response.headers["content-type"] == "text/event-stream; charset=utf-8"
@@ -86,21 +79,7 @@ async def test_stream_query_success(
     assert response.headers["connection"] == "keep-alive"
 
     # Parse SSE events
-    events = []
-    for line in response.text.strip().split("\n\n"):
-        if line:
-            lines = line.split("\n")
-            event_type = None
-            event_data = None
-
-            for l in lines:
-                if l.startswith("event: "):
-                    event_type = l[7:]
-                elif l.startswith("data: "):
-                    event_data = json.loads(l[6:])
-
-            if event_type and event_data:
-                events.append({"event": event_type, "data": event_data})
+    events = parse_sse_events(response.content)
 
     # Verify event sequence
     event_types = [e["event"] for e in events]
@@ -121,46 +100,83 @@ async def test_stream_query_success(
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
 async def test_stream_query_no_auth(
     async_client: AsyncClient,
     assist_service,
 ):
     """Test streaming query without authentication."""
-    from unittest.mock import patch
-
-    with patch("app.main.assist_service", assist_service):
-        response = await async_client.post(
-            "/api/v1/assist/query",
-            json={"query": "test"},
-            headers={"Accept": "text/event-stream"},
-        )
+    response = await async_client.post(
+        "/api/v1/assist/query",
+        json={"query": "test"},
+        headers={"Accept": "text/event-stream"},
+    )
 
     assert response.status_code == 401
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
 async def test_stream_query_empty_query(
     async_client: AsyncClient,
     assist_service,
     auth_headers: dict,
 ):
     """Test streaming query with empty query string."""
-    from unittest.mock import patch
-
-    with patch("app.main.assist_service", assist_service):
-        response = await async_client.post(
-            "/api/v1/assist/query",
-            json={"query": ""},
-            headers={**auth_headers, "Accept": "text/event-stream"},
-        )
+    response = await async_client.post(
+        "/api/v1/assist/query",
+        json={"query": ""},
+        headers={**auth_headers, "Accept": "text/event-stream"},
+    )
 
     assert response.status_code == 422  # Validation error
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "raw_body, expected_loc, expected_type",
+    [
+        (b'{"query": ""}', ["body", "query"], "string_too_short"),
+        (b'{"options": {}}', ["body", "query"], "missing"),
+        (b'{"query": "test",', ["body", 17], "json_invalid"),
+    ],
+    ids=["empty_query", "missing_query", "malformed_json"],
+)
+async def test_stream_query_raw_json_validation_error(
+    async_client: AsyncClient,
+    assist_service,
+    auth_headers: dict,
+    raw_body: bytes,
+    expected_loc: list,
+    expected_type: str,
+):
+    """Test that a raw JSON body is validated with FastAPI's 422 error mapping."""
+    response = await async_client.post(
+        "/api/v1/assist/query",
+        content=raw_body,
+        headers={**auth_headers, "Content-Type": "application/json"},
+    )
+
+    assert response.status_code == 422
+    errors = response.json()["detail"]
+    assert [(error["loc"], error["type"]) for error in errors] == [(expected_loc, expected_type)]
+
+
+@pytest.mark.integration
+async def test_stream_query_rejects_non_json_content_type(
+    async_client: AsyncClient,
+    assist_service,
+    auth_headers: dict,
+):
+    """Test that a JSON body sent as text/plain is not parsed."""
+    response = await async_client.post(
+        "/api/v1/assist/query",
+        content=b'{"query": "test"}',
+        headers={**auth_headers, "Content-Type": "text/plain"},
+    )
+
+    assert response.status_code == 422
+
+
+@pytest.mark.integration
 async def test_stream_query_intent_fallback(
     async_client: AsyncClient,
     mock_search_provider: AsyncMock,
@@ -189,42 +205,22 @@ async def test_stream_query_intent_fallback(
     )
 
     # Mock streaming response
-    async def mock_compose_stream(*args, **kwargs):
-        yield "Fallback answer."
-
-    mock_llm_client.compose_stream = mock_compose_stream
-
-    # Patch the assist service
-    from unittest.mock import patch
-    with patch("app.main.assist_service", assist_service):
-        # Make streaming request
-        response = await async_client.post(
-            "/api/v1/assist/query",
-            json={"query": "test fallback"},
-            headers={
-                **auth_headers,
-                "Accept": "text/event-stream",
-            },
-        )
+    mock_llm_client.compose_stream = const_stream("Fallback answer.")
+
+    # Make streaming request
+    response = await async_client.post(
+        "/api/v1/assist/query",
+        json={"query": "test fallback"},
+        headers={
+            **auth_headers,
+            "Accept": "text/event-stream",
+        },
+    )
 
     assert response.status_code == 200
 
     # Parse SSE events
-    events = []
-    for line in response.text.strip().split("\n\n"):
-        if line:
-            lines = line.split("\n")
-            event_type = None
-            event_data = None
-
-            for l in lines:
-                if l.startswith("event: "):
-                    event_type = l[7:]
-                elif l.startswith("data: "):
-                    event_data = json.loads(l[6:])
-
-            if event_type and event_data:
-                events.append({"event": event_type, "data": event_data})
+    events = parse_sse_events(response.content)
 
     # Intent event SHOULD be present even with fallback behavior
     event_types = [e["event"] for e in events]
@@ -243,7 +239,6 @@ async def test_stream_query_intent_fallback(
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
 async def test_stream_query_with_session(
     async_client: AsyncClient,
     mock_search_provider: AsyncMock,
@@ -279,42 +274,22 @@ async def test_stream_query_with_session(
     )
 
     # Mock streaming response
-    async def mock_compose_stream(*args, **kwargs):
-        yield "Session answer."
-
-    mock_llm_client.compose_stream = mock_compose_stream
-
-    # Patch the assist service
-    from unittest.mock import patch
-    with patch("app.main.assist_service", assist_service):
-        # Make streaming request
-        response = await async_client.post(
-            "/api/v1/assist/query",
-            json={"query": "test with session", "session_id": session_id},
-            headers={
-                **auth_headers,
-                "Accept": "text/event-stream",
-            },
-        )
+    mock_llm_client.compose_stream = const_stream("Session answer.")
+
+    # Make streaming request
+    response = await async_client.post(
+        "/api/v1/assist/query",
+        json={"query": "test with session", "session_id": session_id},
+        headers={
+            **auth_headers,
+            "Accept": "text/event-stream",
+        },
+    )
 
     assert response.status_code == 200
 
     # Parse SSE events
-    events = []
-    for line in response.text.strip().split("\n\n"):
-        if line:
-            lines = line.split("\n")
-            event_type = None
-            event_data = None
-
-            for l in lines:
-                if l.startswith("event: "):
-                    event_type = l[7:]
-                elif l.startswith("data: "):
-                    event_data = json.loads(l[6:])
-
-            if event_type and event_data:
-                events.append({"event": event_type, "data": event_data})
+    events = parse_sse_events(response.content)
 
     # Verify complete event contains session info
     complete_event = next(e for e in events if e["event"] == "complete")
@@ -322,7 +297,6 @@ async def test_stream_query_with_session(
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
 async def test_stream_query_error_handling(
     async_client: AsyncClient,
     mock_search_provider: AsyncMock,
@@ -351,38 +325,18 @@ async def test_stream_query_error_handling(
     )
 
     # Mock streaming response for fallback
-    async def mock_compose_stream(*args, **kwargs):
-        yield "Fallback answer."
+    mock_llm_client.compose_stream = const_stream("Fallback answer.")
 
-    mock_llm_client.compose_stream = mock_compose_stream
-
-    from unittest.mock import patch
-
-    with patch("app.main.assist_service", assist_service):
-        response = await async_client.post(
-            "/api/v1/assist/query",
-            json={"query": "test"},
-            headers={**auth_headers, "Accept": "text/event-stream"},
-        )
+    response = await async_client.post(
+        "/api/v1/assist/query",
+        json={"query": "test"},
+        headers={**auth_headers, "Accept": "text/event-stream"},
+    )
 
     assert response.status_code == 200
 
     # Parse events
-    events = []
-    for line in response.text.strip().split("\n\n"):
-        if line:
-            lines = line.split("\n")
-            event_type = None
-            event_data = None
-
-            for l in lines:
-                if l.startswith("event: "):
-                    event_type = l[7:]
-                elif l.startswith("data: "):
-                    event_data = json.loads(l[6:])
-
-            if event_type and event_data:
-                events.append({"event": event_type, "data": event_data})
+    events = parse_sse_events(response.content)
 
     # Intent extraction error should not produce error event, but use fallback
     event_types = [e["event"] for e in events]
@@ -402,7 +356,6 @@ async def test_stream_query_error_handling(
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
 async def test_stream_query_with_language_option(
     async_client, auth_headers, mock_search_provider, mock_llm_client
 ):
@@ -484,21 +437,7 @@ async def test_stream_query_with_language_option(
     assert response.status_code == 200
 
     # Parse events
-    events = []
-    for line in response.text.strip().split("\n\n"):
-        if line:
-            lines = line.split("\n")
-            event_type = None
-            event_data = None
-
-            for l in lines:
-                if l.startswith("event: "):
-                    event_type = l.replace("event: ", "").strip()
-                elif l.startswith("data: "):
-                    event_data = json.loads(l.replace("data: ", ""))
-
-            if event_type and event_data:
-                events.append({"event": event_type, "data": event_data})
+    events = parse_sse_events(response.content)
 
     # Verify events were emitted
     event_types = [e["event"] for e in events]
@@ -14,8 +14,11 @@
 Unit tests for AssistService.
 """
 
+import asyncio
+from types import MappingProxyType
+
 import pytest
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock
 from uuid import uuid4
 
 from app.services.assist import AssistService
@@ -23,6 +26,43 @@ from app.core.search_agent.base import SearchAgent
 from app.core.llm.base import LLMClient
 
 
+# Read-only session payload shared by the session storage tests
+_SAMPLE_SESSION = MappingProxyType(
+    {
+        "turn": 1,
+        "queries": ("query1", "query2"),
+        "metadata": MappingProxyType(
+            {"user_id": "test-user", "started_at": "2025-01-01T00:00:00Z"}
+        ),
+    }
+)
+
+
+@pytest.fixture(scope="module")
+def mock_search_agent() -> AsyncMock:
+    """Module-wide SearchAgent mock, reset before every test by _reset_mocks."""
+    return AsyncMock(spec=SearchAgent)
+
+
+@pytest.fixture(scope="module")
+def mock_llm_client() -> AsyncMock:
+    """Module-wide LLMClient mock, reset before every test by _reset_mocks."""
+    return AsyncMock(spec=LLMClient)
+
+
+@pytest.fixture
+def service(mock_search_agent: AsyncMock, mock_llm_client: AsyncMock) -> AssistService:
+    """Fresh AssistService (with empty sessions) over the shared mocks."""
+    return AssistService(search_agent=mock_search_agent, llm_client=mock_llm_client)
+
+
+@pytest.fixture(autouse=True)
+def _reset_mocks(mock_search_agent: AsyncMock, mock_llm_client: AsyncMock) -> None:
+    """Clear calls, return values and side effects left by the previous test."""
+    mock_search_agent.reset_mock(return_value=True, side_effect=True)
+    mock_llm_client.reset_mock(return_value=True, side_effect=True)
+
+
 @pytest.mark.unit
 class TestAssistServiceInitialization:
     """Test cases for AssistService initialization."""
@@ -36,8 +76,8 @@ class TestAssistServiceInitialization:
             llm_client=mock_llm_client,
         )
 
-        assert service.search_agent == mock_search_agent
-        assert service.llm_client == mock_llm_client
+        assert service.search_agent is mock_search_agent
+        assert service.llm_client is mock_llm_client
         assert isinstance(service.sessions, dict)
         assert len(service.sessions) == 0
 
@@ -57,73 +97,39 @@ class TestAssistServiceInitialization:
 class TestAssistServiceWarmup:
     """Test cases for AssistService warmup functionality."""
 
-    @pytest.mark.asyncio
-    async def test_warmup_success(
-        self, mock_search_agent: AsyncMock, mock_llm_client: AsyncMock
-    ):
-        """Test successful warmup."""
-        mock_llm_client.warmup = AsyncMock(return_value=True)
-
-        service = AssistService(
-            search_agent=mock_search_agent,
-            llm_client=mock_llm_client,
-        )
-
-        result = await service.warmup()
-
-        assert result is True
-        mock_llm_client.warmup.assert_called_once_with(timeout_ms=30000)
-
-    @pytest.mark.asyncio
-    async def test_warmup_failure(
-        self, mock_search_agent: AsyncMock, mock_llm_client: AsyncMock
-    ):
-        """Test warmup failure."""
-        mock_llm_client.warmup = AsyncMock(return_value=False)
-
-        service = AssistService(
-            search_agent=mock_search_agent,
-            llm_client=mock_llm_client,
-        )
-
-        result = await service.warmup()
-
-        assert result is False
-        mock_llm_client.warmup.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_warmup_with_custom_timeout(
-        self, mock_search_agent: AsyncMock, mock_llm_client: AsyncMock
-    ):
-        """Test warmup with custom timeout."""
-        mock_llm_client.warmup = AsyncMock(return_value=True)
-
-        service = AssistService(
-            search_agent=mock_search_agent,
-            llm_client=mock_llm_client,
-        )
-
-        result = await service.warmup(timeout_ms=60000)
-
-        assert result is True
-        mock_llm_client.warmup.assert_called_once_with(timeout_ms=60000)
-
-    @pytest.mark.asyncio
-    async def test_warmup_exception_handling(
-        self, mock_search_agent: AsyncMock, mock_llm_client: AsyncMock
+    @pytest.mark.parametrize(
+        "return_value, side_effect, warmup_kwargs, expected_result, expected_timeout_ms",
+        [
+            (True, None, {}, True, 30000),
+            (False, None, {}, False, 30000),
+            (True, None, {"timeout_ms": 60000}, True, 60000),
+            (None, Exception("Warmup failed"), {}, False, 30000),
+        ],
+        ids=["success", "failure", "custom_timeout", "exception"],
+    )
+    async def test_warmup(
+        self,
+        mock_search_agent: AsyncMock,
+        mock_llm_client: AsyncMock,
+        return_value,
+        side_effect,
+        warmup_kwargs,
+        expected_result,
+        expected_timeout_ms,
     ):
-        """Test warmup handles exceptions gracefully."""
-        mock_llm_client.warmup = AsyncMock(side_effect=Exception("Warmup failed"))
+        """Test warmup result and exception handling for LLM warmup outcomes."""
+        mock_llm_client.warmup.return_value = return_value
+        mock_llm_client.warmup.side_effect = side_effect
 
         service = AssistService(
             search_agent=mock_search_agent,
             llm_client=mock_llm_client,
         )
 
-        result = await service.warmup()
+        result = await service.warmup(**warmup_kwargs)
 
-        assert result is False
-        mock_llm_client.warmup.assert_called_once()
+        assert result is expected_result
+        mock_llm_client.warmup.assert_called_once_with(timeout_ms=expected_timeout_ms)
 
 
 @pytest.mark.unit
@@ -151,35 +157,17 @@ class TestAssistServiceSessionManagement:
         assert session_id not in service2.sessions
         assert len(service2.sessions) == 0
 
-    def test_sessions_can_store_arbitrary_data(
-        self, mock_search_agent: AsyncMock, mock_llm_client: AsyncMock
-    ):
+    def test_sessions_can_store_arbitrary_data(self, service: AssistService):
         """Test that sessions can store arbitrary data."""
-        service = AssistService(
-            search_agent=mock_search_agent,
-            llm_client=mock_llm_client,
-        )
-
         session_id = str(uuid4())
-        service.sessions[session_id] = {
-            "turn": 1,
-            "queries": ["query1", "query2"],
-            "metadata": {"user_id": "test-user", "started_at": "2025-01-01T00:00:00Z"},
-        }
+        service.sessions[session_id] = dict(_SAMPLE_SESSION)
 
         assert service.sessions[session_id]["turn"] == 1
         assert len(service.sessions[session_id]["queries"]) == 2
         assert service.sessions[session_id]["metadata"]["user_id"] == "test-user"
 
-    def test_multiple_sessions_management(
-        self, mock_search_agent: AsyncMock, mock_llm_client: AsyncMock
-    ):
+    def test_multiple_sessions_management(self, service: AssistService):
         """Test managing multiple sessions simultaneously."""
-        service = AssistService(
-            search_agent=mock_search_agent,
-            llm_client=mock_llm_client,
-        )
-
         # Create multiple sessions
         session_ids = [str(uuid4()) for _ in range(5)]
         for idx, session_id in enumerate(session_ids):
@@ -190,15 +178,8 @@ class TestAssistServiceSessionManagement:
         for idx, session_id in enumerate(session_ids):
             assert service.sessions[session_id]["turn"] == idx + 1
 
-    def test_session_update(
-        self, mock_search_agent: AsyncMock, mock_llm_client: AsyncMock
-    ):
+    def test_session_update(self, service: AssistService):
         """Test updating existing session."""
-        service = AssistService(
-            search_agent=mock_search_agent,
-            llm_client=mock_llm_client,
-        )
-
         session_id = str(uuid4())
         service.sessions[session_id] = {"turn": 1, "queries": ["query1"]}
 
@@ -209,15 +190,8 @@ class TestAssistServiceSessionManagement:
         assert service.sessions[session_id]["turn"] == 2
         assert len(service.sessions[session_id]["queries"]) == 2
 
-    def test_session_deletion(
-        self, mock_search_agent: AsyncMock, mock_llm_client: AsyncMock
-    ):
+    def test_session_deletion(self, service: AssistService):
         """Test deleting a session."""
-        service = AssistService(
-            search_agent=mock_search_agent,
-            llm_client=mock_llm_client,
-        )
-
         session_id = str(uuid4())
         service.sessions[session_id] = {"turn": 1}
 
@@ -230,56 +204,35 @@ class TestAssistServiceSessionManagement:
         # Verify session is deleted
         assert session_id not in service.sessions
 
-    def test_session_retrieval_nonexistent(
-        self, mock_search_agent: AsyncMock, mock_llm_client: AsyncMock
-    ):
+    def test_session_retrieval_nonexistent(self, service: AssistService):
         """Test retrieving non-existent session."""
-        service = AssistService(
-            search_agent=mock_search_agent,
-            llm_client=mock_llm_client,
-        )
-
         session_id = str(uuid4())
 
         # Should not raise error, just return None
         result = service.sessions.get(session_id)
         assert result is None
 
-    def test_session_id_uniqueness(
-        self, mock_search_agent: AsyncMock, mock_llm_client: AsyncMock
-    ):
-        """Test that session IDs are unique."""
-        service = AssistService(
-            search_agent=mock_search_agent,
-            llm_client=mock_llm_client,
-        )
-
-        # Generate multiple session IDs
-        session_ids = [str(uuid4()) for _ in range(100)]
-
-        # Verify all are unique
-        assert len(session_ids) == len(set(session_ids))
+    def test_session_id_uniqueness(self, service: AssistService):
+        """Test that generated session IDs never collide in the session store."""
+        session_ids = [str(uuid4()) for _ in range(8)]
 
         # Store all sessions
         for session_id in session_ids:
             service.sessions[session_id] = {"turn": 1}
 
-        # Verify all are stored
-        assert len(service.sessions) == 100
+        # Verify none overwrote another
+        assert len(service.sessions) == 8
 
 
 @pytest.mark.unit
 class TestAssistServiceConcurrency:
     """Test cases for concurrent session access."""
 
-    @pytest.mark.asyncio
     async def test_concurrent_warmup_calls(
         self, mock_search_agent: AsyncMock, mock_llm_client: AsyncMock
     ):
         """Test multiple concurrent warmup calls."""
-        import asyncio
-
-        mock_llm_client.warmup = AsyncMock(return_value=True)
+        mock_llm_client.warmup.return_value = True
 
         service = AssistService(
             search_agent=mock_search_agent,
@@ -287,8 +240,9 @@ class TestAssistServiceConcurrency:
         )
 
         # Call warmup concurrently
-        tasks = [service.warmup() for _ in range(5)]
-        results = await asyncio.gather(*tasks)
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(service.warmup()) for _ in range(5)]
+        results = [task.result() for task in tasks]
 
         # All should succeed
         assert all(result is True for result in results)
@@ -296,15 +250,8 @@ class TestAssistServiceConcurrency:
         # Warmup should be called 5 times
         assert mock_llm_client.warmup.call_count == 5
 
-    def test_concurrent_session_modifications(
-        self, mock_search_agent: AsyncMock, mock_llm_client: AsyncMock
-    ):
+    def test_concurrent_session_modifications(self, service: AssistService):
         """Test concurrent modifications to different sessions (thread-safe at dict level)."""
-        service = AssistService(
-            search_agent=mock_search_agent,
-            llm_client=mock_llm_client,
-        )
-
         # Create multiple sessions concurrently (simulated)
         session_ids = [str(uuid4()) for _ in range(10)]
         for session_id in session_ids:
@@ -314,32 +261,3 @@ class TestAssistServiceConcurrency:
         assert len(service.sessions) == 10
         for session_id in session_ids:
             assert session_id in service.sessions
-
-
-@pytest.mark.unit
-class TestAssistServiceIntegration:
-    """Test cases for AssistService integration with dependencies."""
-
-    def test_service_has_search_agent_access(
-        self, mock_search_agent: AsyncMock, mock_llm_client: AsyncMock
-    ):
-        """Test that service can access search agent."""
-        service = AssistService(
-            search_agent=mock_search_agent,
-            llm_client=mock_llm_client,
-        )
-
-        assert service.search_agent is not None
-        assert isinstance(service.search_agent, (AsyncMock, SearchAgent))
-
-    def test_service_has_llm_client_access(
-        self, mock_search_agent: AsyncMock, mock_llm_client: AsyncMock
-    ):
-        """Test that service can access LLM client."""
-        service = AssistService(
-            search_agent=mock_search_agent,
-            llm_client=mock_llm_client,
-        )
-
-        assert service.llm_client is not None
-        assert isinstance(service.llm_client, (AsyncMock, LLMClient))
@@ -12,21 +12,28 @@
 
 """
 Unit tests for configuration management.
+
+Tests that only read default values use ``default_settings``, which is built
+with ``Settings.model_construct()`` and so skips validation and env loading.
+Tests that exercise validation or env parsing must build ``Settings()``.
 """
 
+import os
+from collections.abc import Iterator, MutableMapping
+from contextlib import contextmanager
+
 import pytest
 from pydantic import ValidationError
 
 from app.core.config import Settings
 
+_TEST_TOKEN = "test-token-32-characters-long-secure"
 
-@pytest.fixture
-def clean_env(monkeypatch):
-    """Provide a clean environment for Settings tests."""
-    # Set only the required token
-    monkeypatch.setenv("INTASTE_API_TOKEN", "test-token-32-characters-long-secure")
-    # Clear other potentially interfering env vars
-    for key in [
+_LOCALHOST_ORIGINS = ("http://localhost:3000", "http://localhost:3001")
+
+# Env vars that would leak host/CI configuration into Settings()
+_ENV_KEYS_TO_CLEAR = frozenset(
+    {
         "FESS_BASE_URL",
         "OLLAMA_BASE_URL",
         "CORS_ORIGINS",
@@ -38,8 +45,47 @@ def clean_env(monkeypatch):
         "LOG_LEVEL",
         "LOG_FORMAT",
         "DEBUG",
-    ]:
-        monkeypatch.delenv(key, raising=False)
+    }
+)
+
+
+@contextmanager
+def _env_snapshot() -> Iterator[MutableMapping[str, str]]:
+    """Snapshot os.environ once and restore it wholesale on exit."""
+    snapshot = os.environ.copy()
+    try:
+        yield os.environ
+    finally:
+        os.environ.clear()
+        os.environ.update(snapshot)
+
+
+def _apply_clean_env(environ: MutableMapping[str, str]) -> None:
+    # Set only the required token
+    environ["INTASTE_API_TOKEN"] = _TEST_TOKEN
+    # Clear other potentially interfering env vars (only those actually set)
+    for key in environ.keys() & _ENV_KEYS_TO_CLEAR:
+        del environ[key]
+
+
+@pytest.fixture(autouse=True)
+def env() -> Iterator[MutableMapping[str, str]]:
+    """Provide os.environ with the required API token, restored after each test."""
+    with _env_snapshot() as environ:
+        environ["INTASTE_API_TOKEN"] = _TEST_TOKEN
+        yield environ
+
+
+@pytest.fixture
+def clean_env(env):
+    """Provide a clean environment for Settings tests."""
+    _apply_clean_env(env)
+
+
+@pytest.fixture(scope="module")
+def default_settings() -> Settings:
+    """Unvalidated Settings holding field defaults, built once per module (read-only use)."""
+    return Settings.model_construct(intaste_api_token=_TEST_TOKEN)
 
 
 @pytest.mark.unit
@@ -50,14 +96,14 @@ class TestSettingsValidation:
         """Test Settings with valid configuration."""
         settings = Settings()
 
-        assert settings.intaste_api_token == "test-token-32-characters-long-secure"
+        assert settings.intaste_api_token == _TEST_TOKEN
         assert settings.api_version == "1.0.0"
         assert settings.debug is False
 
-    def test_api_token_required(self, monkeypatch):
+    def test_api_token_required(self, env):
         """Test that INTASTE_API_TOKEN is required."""
         # Clear environment variable
-        monkeypatch.delenv("INTASTE_API_TOKEN", raising=False)
+        env.pop("INTASTE_API_TOKEN", None)
 
         with pytest.raises(ValidationError) as exc_info:
             Settings()
@@ -70,18 +116,15 @@ class TestSettingsValidation:
             for error in errors
         ), f"Should fail on missing INTASTE_API_TOKEN, got errors: {errors}"
 
-    def test_api_token_min_length(self, monkeypatch):
+    def test_api_token_min_length(self, env):
         """Test INTASTE_API_TOKEN minimum length (min_length=32)."""
-        # Clear env first
-        monkeypatch.delenv("INTASTE_API_TOKEN", raising=False)
-
         # Valid: exactly 32 characters
-        monkeypatch.setenv("INTASTE_API_TOKEN", "a" * 32)
+        env["INTASTE_API_TOKEN"] = "a" * 32
         settings = Settings()
         assert len(settings.intaste_api_token) == 32
 
         # Invalid: 31 characters
-        monkeypatch.setenv("INTASTE_API_TOKEN", "a" * 31)
+        env["INTASTE_API_TOKEN"] = "a" * 31
         with pytest.raises(ValidationError) as exc_info:
             Settings()
 
@@ -93,9 +136,9 @@ class TestSettingsValidation:
 class TestSettingsDefaults:
     """Test cases for Settings default values."""
 
-    def test_default_values(self, clean_env):
+    def test_default_values(self, default_settings):
         """Test Settings default values."""
-        settings = Settings()
+        settings = default_settings
 
         # API defaults
         assert settings.api_version == "1.0.0"
@@ -112,103 +155,58 @@ class TestSettingsDefaults:
         assert settings.ollama_base_url == "http://ollama:11434"
         assert settings.intaste_llm_timeout_ms == 3000
 
-    def test_timeout_budget_properties(self, monkeypatch):
-        """Test timeout budget calculation properties."""
-        monkeypatch.setenv("INTASTE_API_TOKEN", "test-token-32-characters-long-secure")
-        monkeypatch.setenv("REQ_TIMEOUT_MS", "15000")
-
-        settings = Settings()
-
-        # Intent: 20% of total
-        assert settings.intent_timeout_ms == 3000
-
-        # Search: 15% of total
-        assert settings.search_timeout_ms == 2250
-
-        # Relevance: 25% of total (increased for detailed reasoning)
-        assert settings.relevance_timeout_ms == 3750
-
-        # Retry budget: 20% of total (reduced to accommodate relevance increase)
-        assert settings.retry_budget_ms == 3000
-
-        # Compose: 15% of total (increased for detailed explanations)
-        assert settings.compose_timeout_ms == 2250
-
-    def test_timeout_budget_custom_total(self, monkeypatch):
-        """Test timeout budget with custom total."""
-        monkeypatch.setenv("INTASTE_API_TOKEN", "test-token-32-characters-long-secure")
-        monkeypatch.setenv("REQ_TIMEOUT_MS", "30000")
-
+    @pytest.mark.parametrize(
+        "total, intent, search, relevance, retry, compose",
+        [
+            (15000, 3000, 2250, 3750, 3000, 2250),
+            (30000, 6000, 4500, 7500, 6000, 4500),
+        ],
+    )
+    def test_timeout_budget(self, clean_env, env, total, intent, search, relevance, retry, compose):
+        """Test timeout budget split: intent 20%, search 15%, relevance 25%, retry 20%, compose 15%."""
+        env["REQ_TIMEOUT_MS"] = str(total)
         settings = Settings()
 
-        assert settings.intent_timeout_ms == 6000  # 20%
-        assert settings.search_timeout_ms == 4500  # 15%
-        assert settings.relevance_timeout_ms == 7500  # 25%
-        assert settings.retry_budget_ms == 6000  # 20%
-        assert settings.compose_timeout_ms == 4500  # 15%
+        assert settings.intent_timeout_ms == intent
+        assert settings.search_timeout_ms == search
+        assert settings.relevance_timeout_ms == relevance
+        assert settings.retry_budget_ms == retry
+        assert settings.compose_timeout_ms == compose
 
 
 @pytest.mark.unit
 class TestCORSOriginsValidation:
     """Test cases for CORS origins validation."""
 
-    def test_cors_origins_as_list(self, monkeypatch):
-        """Test CORS origins as list."""
-        monkeypatch.setenv("INTASTE_API_TOKEN", "test-token-32-characters-long-secure")
-        monkeypatch.setenv("CORS_ORIGINS", "http://localhost:3000,http://localhost:3001")
-
-        settings = Settings()
-
-        assert settings.cors_origins == ["http://localhost:3000", "http://localhost:3001"]
-
-    def test_cors_origins_as_comma_separated_string(self, monkeypatch):
-        """Test CORS origins as comma-separated string."""
-        monkeypatch.setenv("INTASTE_API_TOKEN", "test-token-32-characters-long-secure")
-        monkeypatch.setenv("CORS_ORIGINS", "http://localhost:3000,http://localhost:3001")
-
-        settings = Settings()
-
-        assert settings.cors_origins == ["http://localhost:3000", "http://localhost:3001"]
-
-    def test_cors_origins_with_whitespace(self, monkeypatch):
-        """Test CORS origins with whitespace are trimmed."""
-        monkeypatch.setenv("INTASTE_API_TOKEN", "test-token-32-characters-long-secure")
-        monkeypatch.setenv("CORS_ORIGINS", "http://localhost:3000 , http://localhost:3001 ")
-
+    @pytest.mark.parametrize(
+        "raw, expected",
+        [
+            (",".join(_LOCALHOST_ORIGINS), _LOCALHOST_ORIGINS),
+            (" , ".join(_LOCALHOST_ORIGINS) + " ", _LOCALHOST_ORIGINS),
+            ("", ()),
+            ("http://example.com", ("http://example.com",)),
+        ],
+        ids=["comma_separated", "whitespace", "empty", "single_value"],
+    )
+    def test_cors_origins_from_env(self, clean_env, env, raw, expected):
+        """Test CORS_ORIGINS parsing from a comma-separated string."""
+        env["CORS_ORIGINS"] = raw
         settings = Settings()
 
-        assert settings.cors_origins == ["http://localhost:3000", "http://localhost:3001"]
-
-    def test_cors_origins_empty_string(self, monkeypatch):
-        """Test CORS origins with empty string."""
-        monkeypatch.setenv("INTASTE_API_TOKEN", "test-token-32-characters-long-secure")
-        monkeypatch.setenv("CORS_ORIGINS", "")
-
-        settings = Settings()
-
-        assert settings.cors_origins == []
-
-    def test_cors_origins_single_value(self, monkeypatch):
-        """Test CORS origins with single value."""
-        monkeypatch.setenv("INTASTE_API_TOKEN", "test-token-32-characters-long-secure")
-        monkeypatch.setenv("CORS_ORIGINS", "http://example.com")
-
-        settings = Settings()
-
-        assert settings.cors_origins == ["http://example.com"]
+        assert settings.cors_origins == list(expected)
 
 
 @pytest.mark.unit
 class TestSettingsEnvironmentVariables:
     """Test cases for Settings from environment variables."""
 
-    def test_settings_from_env_vars(self, monkeypatch):
+    def test_settings_from_env_vars(self, clean_env, env):
         """Test Settings loaded from environment variables."""
-        monkeypatch.setenv("INTASTE_API_TOKEN", "env-token-32-characters-long-secure")
-        monkeypatch.setenv("FESS_BASE_URL", "http://custom-fess:9000")
-        monkeypatch.setenv("OLLAMA_BASE_URL", "http://custom-ollama:12345")
-        monkeypatch.setenv("REQ_TIMEOUT_MS", "20000")
-        monkeypatch.setenv("LOG_LEVEL", "DEBUG")
+        env["INTASTE_API_TOKEN"] = "env-token-32-characters-long-secure"
+        env["FESS_BASE_URL"] = "http://custom-fess:9000"
+        env["OLLAMA_BASE_URL"] = "http://custom-ollama:12345"
+        env["REQ_TIMEOUT_MS"] = "20000"
+        env["LOG_LEVEL"] = "DEBUG"
 
         settings = Settings()
 
@@ -223,56 +221,21 @@ class TestSettingsEnvironmentVariables:
 class TestSettingsLiteralFields:
     """Test cases for Literal field validation."""
 
-    def test_search_provider_literal(self, monkeypatch):
-        """Test intaste_search_provider Literal validation."""
-        # Valid: "fess"
-        monkeypatch.setenv("INTASTE_API_TOKEN", "test-token-32-characters-long-secure")
-        monkeypatch.setenv("INTASTE_SEARCH_PROVIDER", "fess")
-
-        settings = Settings()
-        assert settings.intaste_search_provider == "fess"
-
-        # Invalid: other value
-        monkeypatch.setenv("INTASTE_SEARCH_PROVIDER", "elasticsearch")
-        with pytest.raises(ValidationError) as exc_info:
-            Settings()
-
-        errors = exc_info.value.errors()
-        assert any("literal_error" in error["type"] or "enum" in error["type"] for error in errors)
-
-    def test_llm_provider_literal(self, monkeypatch):
-        """Test intaste_llm_provider Literal validation."""
-        # Valid: "ollama"
-        monkeypatch.setenv("INTASTE_API_TOKEN", "test-token-32-characters-long-secure")
-        monkeypatch.setenv("INTASTE_LLM_PROVIDER", "ollama")
-
-        settings = Settings()
-        assert settings.intaste_llm_provider == "ollama"
-
-        # Invalid: other value
-        monkeypatch.setenv("INTASTE_LLM_PROVIDER", "openai")
-        with pytest.raises(ValidationError) as exc_info:
-            Settings()
-
-        errors = exc_info.value.errors()
-        assert any("literal_error" in error["type"] or "enum" in error["type"] for error in errors)
-
-    def test_log_format_literal(self, monkeypatch):
-        """Test log_format Literal validation."""
-        # Valid: "text"
-        monkeypatch.setenv("INTASTE_API_TOKEN", "test-token-32-characters-long-secure")
-        monkeypatch.setenv("LOG_FORMAT", "text")
-
-        settings = Settings()
-        assert settings.log_format == "text"
-
-        # Valid: "json"
-        monkeypatch.setenv("LOG_FORMAT", "json")
-        settings = Settings()
-        assert settings.log_format == "json"
-
-        # Invalid: other value
-        monkeypatch.setenv("LOG_FORMAT", "xml")
+    @pytest.mark.parametrize(
+        "env_var, field, valid, invalid",
+        [
+            ("INTASTE_SEARCH_PROVIDER", "intaste_search_provider", ["fess"], "elasticsearch"),
+            ("INTASTE_LLM_PROVIDER", "intaste_llm_provider", ["ollama"], "openai"),
+            ("LOG_FORMAT", "log_format", ["text", "json"], "xml"),
+        ],
+    )
+    def test_literal_field(self, clean_env, env, env_var, field, valid, invalid):
+        """Test Literal fields accept their allowed values and reject others."""
+        for value in valid:
+            env[env_var] = value
+            assert getattr(Settings(), field) == value
+
+        env[env_var] = invalid
         with pytest.raises(ValidationError) as exc_info:
             Settings()
 
@@ -284,12 +247,11 @@ class TestSettingsLiteralFields:
 class TestSettingsNumericValidation:
     """Test cases for numeric field validation."""
 
-    def test_explicit_timeout_values(self, monkeypatch):
+    def test_explicit_timeout_values(self, env):
         """Test that explicit timeout values are accepted."""
-        monkeypatch.setenv("INTASTE_API_TOKEN", "test-token-32-characters-long-secure")
-        monkeypatch.setenv("FESS_TIMEOUT_MS", "5000")
-        monkeypatch.setenv("INTASTE_LLM_TIMEOUT_MS", "10000")
-        monkeypatch.setenv("REQ_TIMEOUT_MS", "30000")
+        env["FESS_TIMEOUT_MS"] = "5000"
+        env["INTASTE_LLM_TIMEOUT_MS"] = "10000"
+        env["REQ_TIMEOUT_MS"] = "30000"
 
         settings = Settings()
 
@@ -298,34 +260,30 @@ class TestSettingsNumericValidation:
         assert settings.intaste_llm_timeout_ms == 10000
         assert settings.req_timeout_ms == 30000
 
-    def test_temperature_range(self, monkeypatch):
+    def test_temperature_range(self, env):
         """Test LLM temperature value range."""
-        monkeypatch.setenv("INTASTE_API_TOKEN", "test-token-32-characters-long-secure")
-
         # Common range: 0.0 to 2.0 (OpenAI/Ollama)
-        monkeypatch.setenv("INTASTE_LLM_TEMPERATURE", "0.0")
+        env["INTASTE_LLM_TEMPERATURE"] = "0.0"
         settings = Settings()
         assert settings.intaste_llm_temperature == 0.0
 
-        monkeypatch.setenv("INTASTE_LLM_TEMPERATURE", "2.0")
+        env["INTASTE_LLM_TEMPERATURE"] = "2.0"
         settings = Settings()
         assert settings.intaste_llm_temperature == 2.0
 
         # Note: No validation for out-of-range values currently
-        monkeypatch.setenv("INTASTE_LLM_TEMPERATURE", "5.0")
+        env["INTASTE_LLM_TEMPERATURE"] = "5.0"
         settings = Settings()
         assert settings.intaste_llm_temperature == 5.0
 
-    def test_top_p_range(self, monkeypatch):
+    def test_top_p_range(self, env):
         """Test LLM top_p value range."""
-        monkeypatch.setenv("INTASTE_API_TOKEN", "test-token-32-characters-long-secure")
-
         # Common range: 0.0 to 1.0
-        monkeypatch.setenv("INTASTE_LLM_TOP_P", "0.0")
+        env["INTASTE_LLM_TOP_P"] = "0.0"
         settings = Settings()
         assert settings.intaste_llm_top_p == 0.0
 
-        monkeypatch.setenv("INTASTE_LLM_TOP_P", "1.0")
+        env["INTASTE_LLM_TOP_P"] = "1.0"
         settings = Settings()
         assert settings.intaste_llm_top_p == 1.0
 
@@ -334,38 +292,32 @@ class TestSettingsNumericValidation:
 class TestSettingsBooleanFields:
     """Test cases for boolean field validation."""
 
-    def test_debug_mode(self, monkeypatch):
+    def test_debug_mode(self, env):
         """Test debug mode flag."""
-        monkeypatch.setenv("INTASTE_API_TOKEN", "test-token-32-characters-long-secure")
-
-        monkeypatch.setenv("DEBUG", "true")
+        env["DEBUG"] = "true"
         settings = Settings()
         assert settings.debug is True
 
-        monkeypatch.setenv("DEBUG", "false")
+        env["DEBUG"] = "false"
         settings = Settings()
         assert settings.debug is False
 
-    def test_llm_warmup_enabled(self, monkeypatch):
+    def test_llm_warmup_enabled(self, env):
         """Test LLM warmup enabled flag."""
-        monkeypatch.setenv("INTASTE_API_TOKEN", "test-token-32-characters-long-secure")
-
-        monkeypatch.setenv("INTASTE_LLM_WARMUP_ENABLED", "false")
+        env["INTASTE_LLM_WARMUP_ENABLED"] = "false"
         settings = Settings()
         assert settings.intaste_llm_warmup_enabled is False
 
-        monkeypatch.setenv("INTASTE_LLM_WARMUP_ENABLED", "true")
+        env["INTASTE_LLM_WARMUP_ENABLED"] = "true"
         settings = Settings()
         assert settings.intaste_llm_warmup_enabled is True
 
-    def test_log_pii_masking(self, monkeypatch):
+    def test_log_pii_masking(self, env):
         """Test PII masking flag."""
-        monkeypatch.setenv("INTASTE_API_TOKEN", "test-token-32-characters-long-secure")
-
-        monkeypatch.setenv("LOG_PII_MASKING", "false")
+        env["LOG_PII_MASKING"] = "false"
         settings = Settings()
         assert settings.log_pii_masking is False
 
-        monkeypatch.setenv("LOG_PII_MASKING", "true")
+        env["LOG_PII_MASKING"] = "true"
         settings = Settings()
         assert settings.log_pii_masking is True
@@ -14,67 +14,265 @@
 Unit tests for FessSearchAgent.
 """
 
-from unittest.mock import AsyncMock, MagicMock
+import asyncio
+from dataclasses import dataclass
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from pydantic import ValidationError
 
-from app.core.llm.base import IntentOutput
-from app.core.search_agent.fess import FessSearchAgent
+from app.core.llm.base import IntentOutput, RelevanceOutput
+from app.core.llm.intent_cache import IntentCache
+from app.core.llm.ollama import OllamaClient
+from app.core.search_agent.fess import FessSearchAgent, _query_similarity
 from app.core.search_provider.base import SearchHit, SearchResult
+from app.core.search_provider.fess import HTTP_LIMITS, FessSearchProvider
+
+pytestmark = pytest.mark.unit
+
+
+class _AsyncMethod:
+    """
+    Minimal awaitable stand-in for one async method.
+
+    Records each call in ``calls`` and returns ``return_value`` unless
+    ``side_effect`` is set to an exception, an async callable, or a list of
+    results/exceptions consumed one per call.
+    """
+
+    def __init__(self, return_value: Any = None):
+        self.return_value = return_value
+        self.side_effect: Any = None
+        self.calls: list[tuple[tuple[Any, ...], dict[str, Any]]] = []
+
+    @property
+    def call_count(self) -> int:
+        return len(self.calls)
+
+    async def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        self.calls.append((args, kwargs))
+        effect = self.side_effect
+        if effect is None:
+            return self.return_value
+        if isinstance(effect, BaseException):
+            raise effect
+        if callable(effect):
+            return await effect(*args, **kwargs)
+        if isinstance(effect, list):
+            effect = self.side_effect = iter(effect)
+        result = next(effect)
+        if isinstance(result, BaseException):
+            raise result
+        return result
+
+
+class StubSearchProvider:
+    """Hand-written SearchProvider double (much cheaper than AsyncMock)."""
+
+    def __init__(self) -> None:
+        self.search = _AsyncMethod()
+        self.health = _AsyncMethod((True, {"status": "healthy"}))
+        self.close = _AsyncMethod()
+
+
+class StubLLM:
+    """Hand-written LLMClient double covering the methods the agent calls."""
+
+    def __init__(self) -> None:
+        self.intent = _AsyncMethod()
+        self.relevance = _AsyncMethod()
+        self.health = _AsyncMethod((True, {"status": "healthy"}))
+        self.close = _AsyncMethod()
+
+
+# Trusted test input, so skip validation. SearchHit is frozen, so tests can
+# share these instances
+_HITS_10 = tuple(
+    SearchHit.model_construct(
+        id=str(i),
+        title=f"Doc {i}",
+        url=f"https://example.com/{i}",
+        snippet=f"snippet {i}",
+        score=0.95 - i * 0.05,
+    )
+    for i in range(10)
+)
+
+
+def _hits(n: int) -> list[SearchHit]:
+    """The first n shared hits, in a new list."""
+    return list(_HITS_10[:n])
 
 
 @pytest.fixture
-def mock_search_provider():
-    """Create mock search provider."""
-    provider = AsyncMock()
-    provider.health = AsyncMock(return_value=(True, {"status": "healthy"}))
-    provider.close = AsyncMock()
-    return provider
+def make_intent():
+    """Factory for IntentOutput test values (unvalidated; defaults to a plain 'test query')."""
+
+    def make(**overrides: Any) -> IntentOutput:
+        fields = {
+            "normalized_query": "test query",
+            "filters": None,
+            "followups": [],
+            "ambiguity": "low",
+        }
+        return IntentOutput.model_construct(**(fields | overrides))
+
+    return make
 
 
 @pytest.fixture
-def mock_llm_client():
-    """Create mock LLM client."""
-    client = AsyncMock()
-    client.health = AsyncMock(return_value=(True, {"status": "healthy"}))
-    client.close = AsyncMock()
-    return client
+def make_hit():
+    """Factory for SearchHit test values (unvalidated)."""
+
+    def make(**overrides: Any) -> SearchHit:
+        fields = {"id": "1", "title": "Doc", "url": "https://example.com/1", "score": 0.9}
+        return SearchHit.model_construct(**(fields | overrides))
+
+    return make
 
 
 @pytest.fixture
-def search_agent(mock_search_provider, mock_llm_client):
-    """Create FessSearchAgent with mocked dependencies."""
-    return FessSearchAgent(
-        search_provider=mock_search_provider,
-        llm_client=mock_llm_client,
-        intent_timeout_ms=2000,
-        search_timeout_ms=2000,
-    )
+def make_result():
+    """Factory for SearchResult test values (unvalidated; total defaults to len(hits))."""
 
+    def make(**overrides: Any) -> SearchResult:
+        hits = overrides.pop("hits", [])
+        fields = {"total": len(hits), "hits": hits, "took_ms": 10, "page": 1, "size": 5}
+        return SearchResult.model_construct(**(fields | overrides))
 
-@pytest.mark.asyncio
-async def test_search_stream_success(search_agent, mock_llm_client, mock_search_provider):
-    """Test successful search_stream execution."""
-    from app.core.llm.base import RelevanceOutput
+    return make
 
-    # Mock intent extraction
-    mock_llm_client.intent.return_value = IntentOutput(
-        normalized_query="test query",
-        filters={"site": "example.com"},
-        followups=["related question?"],
-        ambiguity="low",
-    )
 
-    # Mock relevance evaluation (high score to avoid retry)
-    mock_llm_client.relevance.return_value = RelevanceOutput(
-        score=0.9, reason="Highly relevant"
+@pytest.fixture
+def make_relevance():
+    """Factory for RelevanceOutput test values (unvalidated)."""
+
+    def make(score: float, reason: str = "Relevant") -> RelevanceOutput:
+        return RelevanceOutput.model_construct(score=score, reason=reason)
+
+    return make
+
+
+@pytest.fixture
+def mock_search_provider() -> StubSearchProvider:
+    """Create stub search provider."""
+    return StubSearchProvider()
+
+
+@pytest.fixture
+def mock_llm_client() -> StubLLM:
+    """Create stub LLM client."""
+    return StubLLM()
+
+
+@pytest.fixture(scope="module")
+def search_agent():
+    """FessSearchAgent shared by the module; _bind_stubs gives each test fresh doubles."""
+    return FessSearchAgent(
+        search_provider=StubSearchProvider(),
+        llm_client=StubLLM(),
+        intent_timeout_ms=2000,
+        search_timeout_ms=2000,
     )
 
-    # Mock search results
-    mock_search_provider.search.return_value = SearchResult(
+
+@pytest.fixture(autouse=True)
+def _bind_stubs(search_agent, mock_search_provider, mock_llm_client):
+    """Point the shared agent at this test's stubs and forget earlier refinements."""
+    search_agent.search_provider = mock_search_provider
+    search_agent.llm_client = mock_llm_client
+    search_agent._refinement_cache.clear()
+
+
+@dataclass(frozen=True)
+class StreamCase:
+    """One scripted search_stream run: LLM behaviour in, expected events out."""
+
+    intent_return: IntentOutput | None
+    intent_side_effect: Exception | None
+    relevance_score: float
+    expected_shape: tuple[tuple[str, str | None], ...]
+    expected_normalized_query: str
+    expected_ambiguity: str
+    expected_intent_calls: int = 1
+
+
+_TEST_INTENT = IntentOutput.model_construct(
+    normalized_query="test query",
+    filters={"site": "example.com"},
+    followups=["related question?"],
+    ambiguity="low",
+)
+
+_SINGLE_ATTEMPT_SHAPE = (
+    ("status", "intent"),
+    ("intent", None),
+    ("status", "search"),
+    ("status", "relevance"),
+    ("relevance", None),
+    ("citations", None),
+)
+
+
+def _shape(events) -> list[tuple[str, str | None]]:
+    """Reduce events to (type, status phase) pairs for one structural comparison."""
+    return [(e.type, getattr(e.data, "phase", None)) for e in events]
+
+
+STREAM_CASES = [
+    StreamCase(
+        intent_return=_TEST_INTENT,
+        intent_side_effect=None,
+        relevance_score=0.9,
+        expected_shape=_SINGLE_ATTEMPT_SHAPE,
+        expected_normalized_query="test query",
+        expected_ambiguity="low",
+    ),
+    StreamCase(
+        intent_return=None,
+        intent_side_effect=TimeoutError("LLM timeout"),
+        relevance_score=0.8,
+        expected_shape=_SINGLE_ATTEMPT_SHAPE,
+        expected_normalized_query="user query",  # Original query used
+        expected_ambiguity="medium",
+    ),
+    StreamCase(
+        intent_return=_TEST_INTENT,
+        intent_side_effect=None,
+        relevance_score=0.1,
+        expected_shape=(*_SINGLE_ATTEMPT_SHAPE[:-1], ("retry", None), *_SINGLE_ATTEMPT_SHAPE),
+        expected_normalized_query="test query",
+        expected_ambiguity="low",
+        expected_intent_calls=2,
+    ),
+    StreamCase(
+        intent_return=_TEST_INTENT,
+        intent_side_effect=None,
+        relevance_score=0.4,
+        expected_shape=_SINGLE_ATTEMPT_SHAPE,
+        expected_normalized_query="test query",
+        expected_ambiguity="low",
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "case",
+    STREAM_CASES,
+    ids=["success", "intent_fallback", "retry_on_low_relevance", "no_retry_on_good_relevance"],
+)
+async def test_search_stream(
+    search_agent, mock_llm_client, mock_search_provider, case, make_result, make_hit, make_relevance
+):
+    """Test search_stream event sequence across intent, fallback and retry outcomes."""
+    mock_llm_client.intent.return_value = case.intent_return
+    mock_llm_client.intent.side_effect = case.intent_side_effect
+    mock_llm_client.relevance.return_value = make_relevance(case.relevance_score, "Scored")
+    mock_search_provider.search.return_value = make_result(
         total=10,
         hits=[
-            SearchHit(
+            make_hit(
                 id="1",
                 title="Test Document",
                 url="https://example.com/doc1",
@@ -88,106 +286,406 @@ async def test_search_stream_success(search_agent, mock_llm_client, mock_search_
         size=5,
     )
 
-    # Execute search_stream
-    events = []
-    async for event in search_agent.search_stream("user query", {"session_id": "test"}):
-        events.append(event)
-
-    # Verify events (now includes status and relevance events)
-    # Expected: status(intent), intent, status(search), status(relevance), relevance, citations
-    assert len(events) == 6
-    assert events[0].type == "status"
-    assert events[0].status_data.phase == "intent"
-    assert events[1].type == "intent"
-    assert events[1].intent_data.normalized_query == "test query"
-    assert events[1].intent_data.filters == {"site": "example.com"}
-    assert events[2].type == "status"
-    assert events[2].status_data.phase == "search"
-    assert events[3].type == "status"
-    assert events[3].status_data.phase == "relevance"
-    assert events[4].type == "relevance"
-    assert events[4].relevance_data.max_score == 0.9
-    assert events[5].type == "citations"
-    assert len(events[5].citations_data.hits) == 1
-    assert events[5].citations_data.total == 10
-
-
-@pytest.mark.asyncio
-async def test_search_stream_intent_fallback(search_agent, mock_llm_client, mock_search_provider):
-    """Test search_stream with intent extraction failure (fallback)."""
-    from app.core.llm.base import RelevanceOutput
-
-    # Mock intent extraction failure
-    mock_llm_client.intent.side_effect = TimeoutError("LLM timeout")
-
-    # Mock relevance evaluation (high score to avoid retry)
-    mock_llm_client.relevance.return_value = RelevanceOutput(
-        score=0.8, reason="Relevant"
+    options = {"session_id": "test", "max_retries": 1, "relevance_threshold": 0.3}
+    events = [e async for e in search_agent.search_stream("user query", options)]
+
+    assert _shape(events) == list(case.expected_shape)
+    assert events[1].intent_data.normalized_query == case.expected_normalized_query
+    assert events[1].intent_data.ambiguity == case.expected_ambiguity
+    assert events[4].relevance_data.max_score == case.relevance_score
+    assert len(events[-1].citations_data.hits) == 1
+    assert events[-1].citations_data.total == 10
+    assert mock_llm_client.intent.call_count == case.expected_intent_calls
+    assert mock_search_provider.search.call_count == case.expected_intent_calls
+
+
+async def test_search_stream_intent_cache(
+    mock_llm_client, mock_search_provider, make_intent, make_result, make_hit, make_relevance
+):
+    """Test repeated queries reuse the cached intent instead of calling the LLM."""
+    agent = FessSearchAgent(
+        search_provider=mock_search_provider,
+        llm_client=mock_llm_client,
+        intent_cache=IntentCache(),
     )
+    mock_llm_client.intent.return_value = make_intent()
+    mock_llm_client.relevance.return_value = make_relevance(0.9, "Relevant")
+    mock_search_provider.search.return_value = make_result(hits=[make_hit()])
 
-    # Mock search results
-    mock_search_provider.search.return_value = SearchResult(
-        total=5,
-        hits=[
-            SearchHit(
-                id="1",
-                title="Fallback Document",
-                url="https://example.com/doc1",
-                snippet="Fallback snippet",
-                score=0.8,
-            )
-        ],
-        took_ms=40,
+    for _ in range(2):
+        events = [e async for e in agent.search_stream("user query", {"session_id": "test"})]
+        assert events[1].intent_data.normalized_query == "test query"
+
+    assert mock_llm_client.intent.call_count == 1
+    assert mock_search_provider.search.call_count == 2
+
+    # Conversation context makes the intent request-specific, so it bypasses the cache
+    options = {"session_id": "test", "query_history": ["earlier question"]}
+    async for _ in agent.search_stream("user query", options):
+        pass
+
+    assert mock_llm_client.intent.call_count == 2
+
+
+async def test_search_stream_does_not_cache_fallback_intent(mock_search_provider, make_result):
+    """Test an intent synthesized from unparseable LLM output is not cached."""
+    llm_client = OllamaClient(base_url="http://test-ollama:11434", model="test-model")
+    agent = FessSearchAgent(
+        search_provider=mock_search_provider,
+        llm_client=llm_client,
+        intent_cache=IntentCache(),
+    )
+    mock_search_provider.search.return_value = make_result(hits=[])
+    good_json = '{"normalized_query": "normalized", "followups": [], "ambiguity": "low"}'
+
+    # The first request gets bad JSON twice (initial + client retry), so the client
+    # falls back; the identical second request must still reach the LLM
+    with patch.object(
+        llm_client, "_complete", side_effect=["not json", "still not json", good_json]
+    ) as complete:
+        for _ in range(2):
+            async for _event in agent.search_stream(
+                "user query", {"session_id": "test", "max_retries": 0}
+            ):
+                pass
+
+    assert complete.call_count == 3
+    assert [args[0].q for args, _ in mock_search_provider.search.calls] == [
+        "user query",
+        "normalized",
+    ]
+    await llm_client.close()
+
+
+async def test_search_stream_zero_hit_retry_bypasses_intent_cache(
+    mock_llm_client, mock_search_provider, make_intent, make_result
+):
+    """Test each zero-hit retry asks the LLM again instead of reusing the cached intent."""
+    agent = FessSearchAgent(
+        search_provider=mock_search_provider,
+        llm_client=mock_llm_client,
+        intent_cache=IntentCache(),
+    )
+    mock_llm_client.intent.side_effect = [
+        make_intent(normalized_query="q1"),
+        make_intent(normalized_query="q2"),
+        make_intent(normalized_query="q3"),
+    ]
+    mock_search_provider.search.return_value = make_result(hits=[])
+
+    options = {"session_id": "test", "max_retries": 2}
+    async for _ in agent.search_stream("user query", options):
+        pass
+
+    assert [args[0].q for args, _ in mock_search_provider.search.calls] == ["q1", "q2", "q3"]
+    assert mock_llm_client.intent.call_count == 3
+
+
+async def test_search_stream_reuses_retry_refinement(
+    search_agent,
+    mock_llm_client,
+    mock_search_provider,
+    make_intent,
+    make_result,
+    make_hit,
+    make_relevance,
+):
+    """Test a repeated query starts from the intent its earlier retry refined."""
+    mock_llm_client.intent.return_value = make_intent()
+    # Initial attempt scores poorly, the refined retry (and its replay) score well
+    mock_llm_client.relevance.side_effect = [
+        make_relevance(0.1, "Poor"),
+        make_relevance(0.8, "Relevant"),
+        make_relevance(0.8, "Relevant"),
+    ]
+    mock_search_provider.search.return_value = make_result(hits=[make_hit()])
+
+    options = {"session_id": "test", "max_retries": 1, "relevance_threshold": 0.3}
+    for _ in range(2):
+        async for _event in search_agent.search_stream("user query", options):
+            pass
+
+    # First run: initial + retry intent; second run: cached refinement, no LLM call
+    assert mock_llm_client.intent.call_count == 2
+    assert mock_search_provider.search.call_count == 3
+
+
+async def test_search_stream_does_not_reuse_tied_refinement(
+    search_agent,
+    mock_llm_client,
+    mock_search_provider,
+    make_intent,
+    make_result,
+    make_hit,
+    make_relevance,
+):
+    """Test a refinement that scored no better than the original attempt is not replayed."""
+    mock_llm_client.intent.return_value = make_intent()
+    mock_llm_client.relevance.return_value = make_relevance(0.1, "Poor")
+    mock_search_provider.search.return_value = make_result(hits=[make_hit()])
+
+    options = {"session_id": "test", "max_retries": 1, "relevance_threshold": 0.3}
+    for _ in range(2):
+        async for _event in search_agent.search_stream("user query", options):
+            pass
+
+    # Both runs: initial + retry intent
+    assert mock_llm_client.intent.call_count == 4
+    assert mock_search_provider.search.call_count == 4
+
+
+async def test_search_stream_speculative_search_reused(
+    mock_llm_client, mock_search_provider, make_intent, make_result, make_hit, make_relevance
+):
+    """Test a speculative raw-query search is reused when the normalized query matches."""
+    agent = FessSearchAgent(
+        search_provider=mock_search_provider,
+        llm_client=mock_llm_client,
+        speculative_search=True,
+    )
+    mock_llm_client.intent.return_value = make_intent(
+        normalized_query="User Query", filters=None, followups=[], ambiguity="low"
+    )
+    mock_llm_client.relevance.return_value = make_relevance(0.9, "Relevant")
+    mock_search_provider.search.return_value = make_result(hits=[make_hit()])
+
+    events = [e async for e in agent.search_stream("user query", {"session_id": "test"})]
+
+    assert [e.type for e in events] == [
+        "status",
+        "intent",
+        "status",
+        "status",
+        "relevance",
+        "citations",
+    ]
+    assert mock_search_provider.search.call_count == 1
+    assert mock_search_provider.search.calls[-1][0][0].q == "user query"
+
+
+async def test_search_stream_speculative_search_cancelled(
+    mock_llm_client, mock_search_provider, make_intent, make_result, make_hit, make_relevance
+):
+    """Test a speculative search is cancelled when the normalized query differs."""
+    agent = FessSearchAgent(
+        search_provider=mock_search_provider,
+        llm_client=mock_llm_client,
+        speculative_search=True,
+    )
+
+    async def intent(**kwargs):
+        await asyncio.sleep(0)  # Let the speculative search start first
+        return make_intent(
+            normalized_query="security policy document",
+            filters=None,
+            followups=[],
+            ambiguity="low",
+        )
+
+    mock_llm_client.intent.side_effect = intent
+    mock_llm_client.relevance.return_value = make_relevance(0.9, "Relevant")
+
+    refined_result = make_result(
+        total=1,
+        hits=[make_hit(id="2", title="Policy", url="https://example.com/2", score=0.9)],
+        took_ms=10,
         page=1,
         size=5,
     )
+    speculative_cancelled = asyncio.Event()
+
+    async def search(query):
+        if query.q == "what is our policy?":
+            try:
+                await asyncio.Event().wait()  # Never completes on its own
+            except asyncio.CancelledError:
+                speculative_cancelled.set()
+                raise
+        return refined_result
+
+    mock_search_provider.search.side_effect = search
+
+    events = [e async for e in agent.search_stream("what is our policy?", {"session_id": "test"})]
+
+    await asyncio.wait_for(speculative_cancelled.wait(), timeout=1)
+    assert mock_search_provider.search.call_count == 2
+    assert mock_search_provider.search.calls[-1][0][0].q == "security policy document"
+    assert events[-1].citations_data.hits[0].id == "2"
+
+
+async def test_search_stream_close_cancels_speculative_search(
+    mock_llm_client, mock_search_provider, make_intent
+):
+    """Test closing the stream after the intent event cancels the pending speculative search."""
+    agent = FessSearchAgent(
+        search_provider=mock_search_provider,
+        llm_client=mock_llm_client,
+        speculative_search=True,
+    )
+
+    async def intent(**kwargs):
+        await asyncio.sleep(0)  # Let the speculative search start first
+        return make_intent(normalized_query="user query")
+
+    speculative_tasks: list[asyncio.Task] = []
+
+    async def search(query):
+        speculative_tasks.append(asyncio.current_task())
+        await asyncio.Event().wait()  # Never completes on its own
+
+    mock_llm_client.intent.side_effect = intent
+    mock_search_provider.search.side_effect = search
+
+    stream = agent.search_stream("user query", {"session_id": "test"})
+    async for event in stream:
+        if event.type == "intent":
+            break
+    await stream.aclose()
+
+    (task,) = speculative_tasks
+    await asyncio.wait([task], timeout=1)
+    assert task.cancelled()
+
+
+async def test_search_stream_speculative_search_bounded_by_search_timeout(
+    mock_llm_client, mock_search_provider, make_intent
+):
+    """Test a hung speculative search fails the search step at the search deadline."""
+    agent = FessSearchAgent(
+        search_provider=mock_search_provider,
+        llm_client=mock_llm_client,
+        search_timeout_ms=50,
+        speculative_search=True,
+    )
+    mock_llm_client.intent.return_value = make_intent(normalized_query="user query")
+
+    async def search(query):
+        await asyncio.Event().wait()  # Never completes on its own
+
+    mock_search_provider.search.side_effect = search
+
+    options = {"session_id": "test", "max_retries": 0}
+    with pytest.raises(RuntimeError, match="Search provider error"):
+        async for _ in agent.search_stream("user query", options):
+            pass
+
+    # The timed-out speculative search is not followed by a second, unbounded one
+    assert mock_search_provider.search.call_count == 1
+
+
+async def test_search_stream_retry_does_not_speculate(
+    mock_llm_client, mock_search_provider, make_intent, make_result
+):
+    """Test zero-hit retries do not re-issue the raw query speculatively."""
+    agent = FessSearchAgent(
+        search_provider=mock_search_provider,
+        llm_client=mock_llm_client,
+        speculative_search=True,
+    )
+    normalized_queries = iter(["q1", "q2"])
+
+    async def intent(**kwargs):
+        await asyncio.sleep(0)  # Let a speculative search start first
+        return make_intent(normalized_query=next(normalized_queries))
+
+    mock_llm_client.intent.side_effect = intent
+    mock_search_provider.search.return_value = make_result(hits=[])
+
+    options = {"session_id": "test", "max_retries": 1}
+    async for _ in agent.search_stream("user query", options):
+        pass
+
+    # First attempt: speculative raw query, discarded for q1; retry: q2 only
+    assert [args[0].q for args, _ in mock_search_provider.search.calls] == [
+        "user query",
+        "q1",
+        "q2",
+    ]
+
+
+async def test_search_stream_intent_deadline(
+    search_agent, mock_llm_client, mock_search_provider, make_result
+):
+    """Test a hung intent call is cut off at intent_timeout_ms and falls back."""
+
+    async def hang(**kwargs):
+        await asyncio.sleep(10)
 
-    # Execute search_stream
-    events = []
-    async for event in search_agent.search_stream("user query", {"session_id": "test"}):
-        events.append(event)
-
-    # Verify fallback behavior (now includes status and relevance events)
-    # Expected: status(intent), intent, status(search), status(relevance), relevance, citations
-    assert len(events) == 6
-    assert events[0].type == "status"
-    assert events[0].status_data.phase == "intent"
-    assert events[1].type == "intent"
-    assert events[1].intent_data.normalized_query == "user query"  # Original query used
+    mock_llm_client.intent.side_effect = hang
+    mock_search_provider.search.return_value = make_result()
+
+    options = {"session_id": "test", "intent_timeout_ms": 50, "max_retries": 0}
+    events = [e async for e in search_agent.search_stream("user query", options)]
+
+    assert events[1].intent_data.normalized_query == "user query"
     assert events[1].intent_data.ambiguity == "medium"
-    assert events[2].type == "status"
-    assert events[2].status_data.phase == "search"
-    assert events[3].type == "status"
-    assert events[3].status_data.phase == "relevance"
-    assert events[4].type == "relevance"
-    assert events[5].type == "citations"
 
 
-@pytest.mark.asyncio
-async def test_search_stream_search_failure(search_agent, mock_llm_client, mock_search_provider):
+async def test_search_stream_bounds_concurrent_searches(
+    mock_llm_client, mock_search_provider, make_intent, make_result
+):
+    """Test concurrent search_stream calls never exceed max_concurrent_searches in flight."""
+    agent = FessSearchAgent(
+        search_provider=mock_search_provider,
+        llm_client=mock_llm_client,
+        max_concurrent_searches=32,
+    )
+    mock_llm_client.intent.return_value = make_intent()
+
+    in_flight = 0
+    peak = 0
+    release = asyncio.Event()
+
+    async def search(query):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await release.wait()
+        in_flight -= 1
+        return make_result()
+
+    mock_search_provider.search.side_effect = search
+
+    async def run():
+        options = {"session_id": "test", "max_retries": 0}
+        return [e async for e in agent.search_stream("user query", options)]
+
+    tasks = [asyncio.create_task(run()) for _ in range(64)]
+    while in_flight < 32:
+        await asyncio.sleep(0)
+    await asyncio.sleep(0)
+    assert in_flight == 32
+
+    release.set()
+    results = await asyncio.gather(*tasks)
+
+    assert peak == 32
+    assert mock_search_provider.search.call_count == 64
+    assert all(events[-1].type == "citations" for events in results)
+
+
+async def test_search_stream_search_failure(
+    search_agent, mock_llm_client, mock_search_provider, make_intent
+):
     """Test search_stream with search failure (critical error)."""
     # Mock intent extraction
-    mock_llm_client.intent.return_value = IntentOutput(
-        normalized_query="test query",
-        filters=None,
-        followups=[],
-        ambiguity="low",
-    )
+    mock_llm_client.intent.return_value = make_intent()
 
     # Mock search failure
     mock_search_provider.search.side_effect = RuntimeError("Search provider error")
 
     # Execute search_stream and expect exception
     with pytest.raises(RuntimeError, match="Search provider error"):
-        async for event in search_agent.search_stream("user query", {"session_id": "test"}):
+        async for _ in search_agent.search_stream("user query", {"session_id": "test"}):
             pass
 
 
-@pytest.mark.asyncio
-async def test_search_non_streaming(search_agent, mock_llm_client, mock_search_provider):
+async def test_search_non_streaming(
+    search_agent, mock_llm_client, mock_search_provider, make_intent, make_result, make_hit
+):
     """Test non-streaming search() method."""
     # Mock intent extraction
-    mock_llm_client.intent.return_value = IntentOutput(
+    mock_llm_client.intent.return_value = make_intent(
         normalized_query="optimized query",
         filters={"mimetype": "text/html"},
         followups=["follow up 1", "follow up 2"],
@@ -195,17 +693,17 @@ async def test_search_non_streaming(search_agent, mock_llm_client, mock_search_p
     )
 
     # Mock search results
-    mock_search_provider.search.return_value = SearchResult(
+    mock_search_provider.search.return_value = make_result(
         total=3,
         hits=[
-            SearchHit(
+            make_hit(
                 id="1",
                 title="Doc 1",
                 url="https://example.com/1",
                 snippet="Snippet 1",
                 score=0.9,
             ),
-            SearchHit(
+            make_hit(
                 id="2",
                 title="Doc 2",
                 url="https://example.com/2",
@@ -233,7 +731,6 @@ async def test_search_non_streaming(search_agent, mock_llm_client, mock_search_p
     assert result.timings.search_ms >= 0  # Changed from > 0 to >= 0 since mock execution is instant
 
 
-@pytest.mark.asyncio
 async def test_health_check(search_agent, mock_search_provider, mock_llm_client):
     """Test health check aggregation."""
     mock_search_provider.health.return_value = (True, {"status": "green"})
@@ -248,7 +745,6 @@ async def test_health_check(search_agent, mock_search_provider, mock_llm_client)
     assert details["llm_client"]["model"] == "gpt-oss"
 
 
-@pytest.mark.asyncio
 async def test_health_check_unhealthy(search_agent, mock_search_provider, mock_llm_client):
     """Test health check with unhealthy component."""
     mock_search_provider.health.return_value = (False, {"error": "connection failed"})
@@ -260,38 +756,73 @@ async def test_health_check_unhealthy(search_agent, mock_search_provider, mock_l
     assert details["search_provider"]["error"] == "connection failed"
 
 
-@pytest.mark.asyncio
+async def test_health_check_probes_concurrently(
+    search_agent, mock_search_provider, mock_llm_client
+):
+    """Test the search provider and LLM health probes run concurrently."""
+    # Each probe returns only once both have started; run back to back, the
+    # first one would wait on the barrier until the timeout fires
+    both_started = asyncio.Barrier(2)
+
+    async def slow_health():
+        async with asyncio.timeout(1):
+            await both_started.wait()
+        return True, {}
+
+    mock_search_provider.health.side_effect = slow_health
+    mock_llm_client.health.side_effect = slow_health
+
+    is_healthy, _ = await search_agent.health()
+
+    assert is_healthy is True
+
+
 async def test_close(search_agent, mock_search_provider, mock_llm_client):
     """Test close method."""
     await search_agent.close()
 
-    mock_search_provider.close.assert_called_once()
-    mock_llm_client.close.assert_called_once()
+    assert mock_search_provider.close.call_count == 1
+    assert mock_llm_client.close.call_count == 1
 
 
-@pytest.mark.asyncio
-async def test_evaluate_relevance(search_agent, mock_llm_client):
-    """Test _evaluate_relevance method."""
-    from app.core.llm.base import RelevanceOutput
+async def test_provider_reuses_one_http_client(mock_llm_client, make_intent):
+    """Test the provider keeps one pooled HTTP client across searches and closes it once."""
+    mock_llm_client.intent.return_value = make_intent()
+
+    with patch("app.core.search_provider.fess.httpx.AsyncClient") as client_cls:
+        http_client = client_cls.return_value
+        http_client.get = AsyncMock(
+            return_value=MagicMock(status_code=200, json=MagicMock(return_value={"data": []}))
+        )
+        http_client.aclose = AsyncMock()
+
+        agent = FessSearchAgent(
+            search_provider=FessSearchProvider(base_url="http://test-fess:8080"),
+            llm_client=mock_llm_client,
+        )
+        options = {"session_id": "test", "max_retries": 0}
+        for _ in range(50):
+            async for _event in agent.search_stream("user query", options):
+                pass
+
+        await agent.close()
 
+    client_cls.assert_called_once()
+    assert client_cls.call_args.kwargs["limits"] is HTTP_LIMITS
+    assert http_client.get.call_count == 50
+    http_client.aclose.assert_awaited_once()
+
+
+async def test_evaluate_relevance(search_agent, mock_llm_client, make_relevance):
+    """Test _evaluate_relevance method."""
     # Mock relevance evaluation
     mock_llm_client.relevance.side_effect = [
-        RelevanceOutput(score=0.9, reason="Highly relevant"),
-        RelevanceOutput(score=0.6, reason="Moderately relevant"),
-        RelevanceOutput(score=0.3, reason="Barely relevant"),
+        make_relevance(0.9, "Highly relevant"),
+        make_relevance(0.6, "Moderately relevant"),
+        make_relevance(0.3, "Barely relevant"),
     ]
 
-    hits = [
-        SearchHit(
-            id="1", title="Doc 1", url="https://example.com/1", snippet="snippet 1", score=0.95
-        ),
-        SearchHit(
-            id="2", title="Doc 2", url="https://example.com/2", snippet="snippet 2", score=0.85
-        ),
-        SearchHit(
-            id="3", title="Doc 3", url="https://example.com/3", snippet="snippet 3", score=0.75
-        ),
-    ]
+    hits = _hits(3)
 
     evaluated_hits = await search_agent._evaluate_relevance(
         query="test query",
@@ -307,33 +838,19 @@ async def test_evaluate_relevance(search_agent, mock_llm_client):
     assert evaluated_hits[1].relevance_score == 0.6
     assert evaluated_hits[2].relevance_score == 0.3
     assert mock_llm_client.relevance.call_count == 3
+    # Scored hits are copies; the frozen inputs are left as they were
+    assert all(h.relevance_score is None for h in hits)
+    with pytest.raises(ValidationError, match="frozen_instance"):
+        hits[0].relevance_score = 1.0
 
 
-@pytest.mark.asyncio
-async def test_evaluate_relevance_parallel(search_agent, mock_llm_client):
+async def test_evaluate_relevance_parallel(search_agent, mock_llm_client, make_relevance):
     """Test parallel relevance evaluation with multiple results."""
-    import asyncio
-    import time
-
-    from app.core.llm.base import RelevanceOutput
+    # Every evaluation returns the same output, so no per-call side effect is needed
+    mock_llm_client.relevance.return_value = make_relevance(0.9, "Relevant")
 
-    # Mock 10 relevance evaluations
-    mock_llm_client.relevance.side_effect = [
-        RelevanceOutput(score=0.9, reason=f"Reason {i}") for i in range(10)
-    ]
+    hits = _hits(10)
 
-    hits = [
-        SearchHit(
-            id=str(i),
-            title=f"Doc {i}",
-            url=f"https://example.com/{i}",
-            snippet=f"snippet {i}",
-            score=0.95 - i * 0.05,
-        )
-        for i in range(10)
-    ]
-
-    start = time.time()
     evaluated_hits = await search_agent._evaluate_relevance(
         query="test query",
         normalized_query="test query normalized",
@@ -341,7 +858,6 @@ async def test_evaluate_relevance_parallel(search_agent, mock_llm_client):
         session_id="test-session",
         timeout_ms=45000,
     )
-    elapsed = time.time() - start
 
     # Verify all hits evaluated
     assert len(evaluated_hits) == 10
@@ -353,30 +869,20 @@ async def test_evaluate_relevance_parallel(search_agent, mock_llm_client):
     assert all(s == 0.9 for s in scores)
 
 
-@pytest.mark.asyncio
-async def test_evaluate_relevance_parallel_partial_failure(search_agent, mock_llm_client):
+async def test_evaluate_relevance_parallel_partial_failure(
+    search_agent, mock_llm_client, make_relevance
+):
     """Test parallel evaluation with some failures."""
-    from app.core.llm.base import RelevanceOutput
-
     # Mock mixed success/failure
     mock_llm_client.relevance.side_effect = [
-        RelevanceOutput(score=0.9, reason="Success 1"),
+        make_relevance(0.9, "Success 1"),
         TimeoutError("LLM timeout"),
-        RelevanceOutput(score=0.7, reason="Success 2"),
+        make_relevance(0.7, "Success 2"),
         RuntimeError("LLM error"),
-        RelevanceOutput(score=0.6, reason="Success 3"),
+        make_relevance(0.6, "Success 3"),
     ]
 
-    hits = [
-        SearchHit(
-            id=str(i),
-            title=f"Doc {i}",
-            url=f"https://example.com/{i}",
-            snippet=f"snippet {i}",
-            score=0.9,
-        )
-        for i in range(5)
-    ]
+    hits = _hits(5)
 
     evaluated_hits = await search_agent._evaluate_relevance(
         query="test query",
@@ -395,91 +901,87 @@ async def test_evaluate_relevance_parallel_partial_failure(search_agent, mock_ll
     assert len(evaluated_hits) == 5
 
 
-@pytest.mark.asyncio
 async def test_evaluate_relevance_timeout_budget(search_agent, mock_llm_client):
     """Test overall timeout is respected."""
-    import asyncio
-    import time
+    never = asyncio.Event()
 
-    from app.core.llm.base import RelevanceOutput
+    async def hung_relevance(*args, **kwargs):
+        await never.wait()  # Never completes: only the overall budget can end it
 
-    async def slow_relevance(*args, **kwargs):
-        await asyncio.sleep(2)
-        return RelevanceOutput(score=0.5, reason="Slow")
+    mock_llm_client.relevance.side_effect = hung_relevance
 
-    mock_llm_client.relevance.side_effect = slow_relevance
+    hits = _hits(10)
 
-    hits = [
-        SearchHit(
-            id=str(i),
-            title=f"Doc {i}",
-            url=f"https://example.com/{i}",
-            snippet="snippet",
-            score=0.9,
-        )
-        for i in range(10)
-    ]
-
-    start = time.time()
-    # Should timeout after 1 second
+    # An already-spent budget expires at the first suspension point, so the
+    # timeout branch is taken deterministically without waiting on the clock
     evaluated_hits = await search_agent._evaluate_relevance(
         query="test query",
         normalized_query="test query normalized",
         hits=hits,
         session_id="test-session",
-        timeout_ms=1000,
+        timeout_ms=0,
     )
-    elapsed = time.time() - start
 
-    # Should return original hits (no evaluation) due to timeout
-    assert elapsed < 1.5  # Some overhead allowed
-    assert len(evaluated_hits) == 10
-    # All hits should have no relevance_score (timeout case returns original hits)
+    # The timeout branch hands back the original list object, unevaluated
+    assert evaluated_hits is hits
     assert all(h.relevance_score is None for h in evaluated_hits)
 
 
-@pytest.mark.asyncio
-async def test_should_retry():
+@pytest.mark.parametrize(
+    "relevance_scores, retry_count, expected",
+    [
+        ([0.2], 0, True),
+        ([0.5], 0, False),
+        ([0.2], 2, False),
+        ([], 0, True),
+        ([], 2, False),
+    ],
+    ids=[
+        "below_threshold",
+        "meets_threshold",
+        "max_retries_reached",
+        "no_hits",
+        "no_hits_max_retries_reached",
+    ],
+)
+def test_should_retry(search_agent, relevance_scores, retry_count, expected, make_hit):
     """Test _should_retry method."""
-    agent = FessSearchAgent(
-        search_provider=AsyncMock(),
-        llm_client=AsyncMock(),
-        intent_timeout_ms=2000,
-        search_timeout_ms=2000,
-    )
-
-    # Test: should retry when max score below threshold
     hits = [
-        SearchHit(
-            id="1",
-            title="Doc 1",
-            url="https://example.com/1",
+        make_hit(
+            id=str(i),
+            title=f"Doc {i}",
+            url=f"https://example.com/{i}",
             snippet="snippet",
-            relevance_score=0.2,
+            relevance_score=score,
         )
+        for i, score in enumerate(relevance_scores)
     ]
-    assert agent._should_retry(hits, threshold=0.3, retry_count=0, max_retries=2) is True
-
-    # Test: should not retry when max score meets threshold
-    hits[0].relevance_score = 0.5
-    assert agent._should_retry(hits, threshold=0.3, retry_count=0, max_retries=2) is False
 
-    # Test: should not retry when max retries reached
-    hits[0].relevance_score = 0.2
-    assert agent._should_retry(hits, threshold=0.3, retry_count=2, max_retries=2) is False
+    assert (
+        search_agent._should_retry(hits, threshold=0.3, retry_count=retry_count, max_retries=2)
+        is expected
+    )
 
-    # Test: should retry when no hits (0 results)
-    assert agent._should_retry([], threshold=0.3, retry_count=0, max_retries=2) is True
 
-    # Test: should not retry when no hits but max retries reached
-    assert agent._should_retry([], threshold=0.3, retry_count=2, max_retries=2) is False
+@pytest.mark.parametrize(
+    "a, b, expected",
+    [
+        ("Python async", "python ASYNC", 1.0),
+        ("python async io", "python threads", 0.25),
+        ("python", "rust", 0.0),
+        ("", "  ", 1.0),
+    ],
+    ids=["case_insensitive", "partial_overlap", "disjoint", "both_empty"],
+)
+def test_query_similarity(a, b, expected):
+    """Test _query_similarity is the Jaccard similarity of lowercased word tokens."""
+    assert _query_similarity(a, b) == expected
 
 
-@pytest.mark.asyncio
-async def test_extract_retry_intent(search_agent, mock_llm_client):
+async def test_extract_retry_intent(search_agent, mock_llm_client, make_intent, make_hit):
     """Test _extract_retry_intent method."""
     # Mock retry intent extraction
-    mock_llm_client.intent.return_value = IntentOutput(
+    mock_llm_client.intent.return_value = make_intent(
         normalized_query="improved test query",
         filters=None,
         followups=[],
@@ -487,7 +989,7 @@ async def test_extract_retry_intent(search_agent, mock_llm_client):
     )
 
     hits = [
-        SearchHit(
+        make_hit(
             id="1",
             title="Low relevance doc",
             url="https://example.com/1",
@@ -506,14 +1008,13 @@ async def test_extract_retry_intent(search_agent, mock_llm_client):
     )
 
     assert intent.normalized_query == "improved test query"
-    mock_llm_client.intent.assert_called_once()
+    assert mock_llm_client.intent.call_count == 1
 
 
-@pytest.mark.asyncio
-async def test_extract_retry_intent_no_results(search_agent, mock_llm_client):
+async def test_extract_retry_intent_no_results(search_agent, mock_llm_client, make_intent):
     """Test _extract_retry_intent method with 0 results."""
     # Mock retry intent extraction for no results
-    mock_llm_client.intent.return_value = IntentOutput(
+    mock_llm_client.intent.return_value = make_intent(
         normalized_query="broader search query",
         filters=None,
         followups=[],
@@ -533,7 +1034,7 @@ async def test_extract_retry_intent_no_results(search_agent, mock_llm_client):
     )
 
     assert intent.normalized_query == "broader search query"
-    mock_llm_client.intent.assert_called_once()
+    assert mock_llm_client.intent.call_count == 1
     # Verify that the no-results template was used (check the prompt contains "0 results")
-    call_args = mock_llm_client.intent.call_args
-    assert "0 results" in call_args.kwargs["user_template"]
+    _, kwargs = mock_llm_client.intent.calls[-1]
+    assert "0 results" in kwargs["user_template"]
@@ -14,10 +14,15 @@
 Unit tests for health check utilities.
 """
 
+import asyncio
+from typing import Any
+
+import httpx
 import pytest
 from pytest_httpx import HTTPXMock
 
 from app.core.health import (
+    HEALTH_HTTP_LIMITS,
     check_all_dependencies,
     check_fess_health,
     check_ollama_health,
@@ -25,139 +30,86 @@ from app.core.health import (
 )
 from app.schemas.common import DependencyHealth
 
+_FESS_HEALTH_URL = "http://fess:8080/api/v1/health"
+_OLLAMA_TAGS_URL = "http://ollama:11434/api/tags"
 
-@pytest.mark.unit
-@pytest.mark.asyncio
-async def test_check_fess_health_success(httpx_mock: HTTPXMock):
-    """Test successful Fess health check."""
-    httpx_mock.add_response(
-        url="http://fess:8080/api/v1/health",
-        status_code=200,
-        json={"data": {"status": "green", "timed_out": False}},
-    )
-
-    health = await check_fess_health("http://fess:8080")
-
-    assert health.status == "healthy"
-    assert health.response_time_ms is not None
-    assert health.response_time_ms >= 0
-    assert health.error is None
-
-
-@pytest.mark.unit
-@pytest.mark.asyncio
-async def test_check_fess_health_degraded(httpx_mock: HTTPXMock):
-    """Test Fess health check with non-200 response."""
-    httpx_mock.add_response(
-        url="http://fess:8080/api/v1/health",
-        status_code=503,
-    )
-
-    health = await check_fess_health("http://fess:8080")
-
-    assert health.status == "degraded"
-    assert health.response_time_ms is not None
-    assert health.error == "HTTP 503"
+_TIMEOUT = httpx.TimeoutException("Request timeout")
 
 
-@pytest.mark.unit
-@pytest.mark.asyncio
-async def test_check_fess_health_timeout(httpx_mock: HTTPXMock):
-    """Test Fess health check with timeout."""
-    import httpx
-
-    httpx_mock.add_exception(
-        httpx.TimeoutException("Request timeout"),
-        url="http://fess:8080/api/v1/health",
-    )
+def _mock_upstream(httpx_mock: HTTPXMock, url: str, response: int | Exception, body: Any) -> None:
+    """Register either an HTTP response or a transport exception for url."""
+    if isinstance(response, Exception):
+        httpx_mock.add_exception(response, url=url)
+    else:
+        httpx_mock.add_response(url=url, status_code=response, json=body)
 
-    health = await check_fess_health("http://fess:8080", timeout_ms=100)
 
-    assert health.status == "unhealthy"
-    assert health.response_time_ms is not None
-    assert "timeout" in health.error.lower()
+@pytest.fixture
+async def health_client():
+    """Shared client, as the app passes to the probes; pytest-httpx patches its transport."""
+    async with httpx.AsyncClient(limits=HEALTH_HTTP_LIMITS) as client:
+        yield client
 
 
 @pytest.mark.unit
-@pytest.mark.asyncio
-async def test_check_ollama_health_success(httpx_mock: HTTPXMock):
-    """Test successful Ollama health check."""
-    httpx_mock.add_response(
-        url="http://ollama:11434/api/tags",
-        status_code=200,
-        json={"models": [{"name": "llama3", "size": 4661224728}]},
-    )
+@pytest.mark.parametrize(
+    "response, body, expected_status, expected_error",
+    [
+        (200, {"data": {"status": "green", "timed_out": False}}, "healthy", None),
+        (503, None, "degraded", "HTTP 503"),
+        (_TIMEOUT, None, "unhealthy", "Request timeout"),
+    ],
+    ids=["success", "degraded", "timeout"],
+)
+async def test_check_fess_health(
+    httpx_mock: HTTPXMock, health_client, response, body, expected_status, expected_error
+):
+    """Test Fess health check outcome for success, non-200 and timeout."""
+    _mock_upstream(httpx_mock, _FESS_HEALTH_URL, response, body)
 
-    health = await check_ollama_health("http://ollama:11434")
+    health = await check_fess_health("http://fess:8080", timeout_ms=100, client=health_client)
 
-    assert health.status == "healthy"
+    assert health.status == expected_status
     assert health.response_time_ms is not None
     assert health.response_time_ms >= 0
-    assert health.error is None
-
-
-@pytest.mark.unit
-@pytest.mark.asyncio
-async def test_check_ollama_health_no_models(httpx_mock: HTTPXMock):
-    """Test Ollama health check with no models available."""
-    httpx_mock.add_response(
-        url="http://ollama:11434/api/tags",
-        status_code=200,
-        json={"models": []},
-    )
-
-    health = await check_ollama_health("http://ollama:11434")
-
-    assert health.status == "degraded"
-    assert health.response_time_ms is not None
-    assert health.error == "No models available"
-
-
-@pytest.mark.unit
-@pytest.mark.asyncio
-async def test_check_ollama_health_degraded(httpx_mock: HTTPXMock):
-    """Test Ollama health check with non-200 response."""
-    httpx_mock.add_response(
-        url="http://ollama:11434/api/tags",
-        status_code=500,
-    )
-
-    health = await check_ollama_health("http://ollama:11434")
-
-    assert health.status == "degraded"
-    assert health.response_time_ms is not None
-    assert health.error == "HTTP 500"
+    assert health.error == expected_error
 
 
 @pytest.mark.unit
-@pytest.mark.asyncio
-async def test_check_ollama_health_timeout(httpx_mock: HTTPXMock):
-    """Test Ollama health check with timeout."""
-    import httpx
-
-    httpx_mock.add_exception(
-        httpx.TimeoutException("Request timeout"),
-        url="http://ollama:11434/api/tags",
-    )
+@pytest.mark.parametrize(
+    "response, body, expected_status, expected_error",
+    [
+        (200, {"models": [{"name": "llama3", "size": 4661224728}]}, "healthy", None),
+        (200, {"models": []}, "degraded", "No models available"),
+        (500, None, "degraded", "HTTP 500"),
+        (_TIMEOUT, None, "unhealthy", "Request timeout"),
+    ],
+    ids=["success", "no_models", "degraded", "timeout"],
+)
+async def test_check_ollama_health(
+    httpx_mock: HTTPXMock, health_client, response, body, expected_status, expected_error
+):
+    """Test Ollama health check outcome for success, no models, non-200 and timeout."""
+    _mock_upstream(httpx_mock, _OLLAMA_TAGS_URL, response, body)
 
-    health = await check_ollama_health("http://ollama:11434", timeout_ms=100)
+    health = await check_ollama_health("http://ollama:11434", timeout_ms=100, client=health_client)
 
-    assert health.status == "unhealthy"
+    assert health.status == expected_status
     assert health.response_time_ms is not None
-    assert "timeout" in health.error.lower()
+    assert health.response_time_ms >= 0
+    assert health.error == expected_error
 
 
 @pytest.mark.unit
-@pytest.mark.asyncio
 async def test_check_all_dependencies_healthy(httpx_mock: HTTPXMock):
     """Test checking all dependencies when all are healthy."""
     httpx_mock.add_response(
-        url="http://fess:8080/api/v1/health",
+        url=_FESS_HEALTH_URL,
         status_code=200,
         json={"data": {"status": "green", "timed_out": False}},
     )
     httpx_mock.add_response(
-        url="http://ollama:11434/api/tags",
+        url=_OLLAMA_TAGS_URL,
         status_code=200,
         json={"models": [{"name": "llama3"}]},
     )
@@ -174,15 +126,40 @@ async def test_check_all_dependencies_healthy(httpx_mock: HTTPXMock):
 
 
 @pytest.mark.unit
-@pytest.mark.asyncio
+async def test_check_all_dependencies_runs_checks_concurrently(httpx_mock: HTTPXMock):
+    """Test the Fess and Ollama checks overlap instead of running back to back."""
+    # Neither response can be sent until both requests are in flight, so a
+    # sequential implementation times out (and reports the check unhealthy)
+    both_in_flight = asyncio.Barrier(2)
+
+    async def slow_response(request: httpx.Request) -> httpx.Response:
+        async with asyncio.timeout(1):
+            await both_in_flight.wait()
+        if request.url == _FESS_HEALTH_URL:
+            return httpx.Response(200, json={"data": {"status": "green", "timed_out": False}})
+        return httpx.Response(200, json={"models": [{"name": "llama3"}]})
+
+    httpx_mock.add_callback(slow_response, url=_FESS_HEALTH_URL)
+    httpx_mock.add_callback(slow_response, url=_OLLAMA_TAGS_URL)
+
+    dependencies = await check_all_dependencies(
+        fess_url="http://fess:8080",
+        ollama_url="http://ollama:11434",
+    )
+
+    assert dependencies["fess"].status == "healthy"
+    assert dependencies["ollama"].status == "healthy"
+
+
+@pytest.mark.unit
 async def test_check_all_dependencies_with_failures(httpx_mock: HTTPXMock):
     """Test checking all dependencies with some failures."""
     httpx_mock.add_response(
-        url="http://fess:8080/api/v1/health",
+        url=_FESS_HEALTH_URL,
         status_code=503,
     )
     httpx_mock.add_response(
-        url="http://ollama:11434/api/tags",
+        url=_OLLAMA_TAGS_URL,
         status_code=200,
         json={"models": [{"name": "llama3"}]},
     )
@@ -197,48 +174,21 @@ async def test_check_all_dependencies_with_failures(httpx_mock: HTTPXMock):
 
 
 @pytest.mark.unit
-def test_determine_overall_status_all_healthy():
-    """Test overall status when all dependencies are healthy."""
-    dependencies = {
-        "fess": DependencyHealth(status="healthy"),
-        "ollama": DependencyHealth(status="healthy"),
-    }
-
-    status = determine_overall_status(dependencies)
-    assert status == "healthy"
-
-
-@pytest.mark.unit
-def test_determine_overall_status_one_degraded():
-    """Test overall status when one dependency is degraded."""
-    dependencies = {
-        "fess": DependencyHealth(status="healthy"),
-        "ollama": DependencyHealth(status="degraded", error="No models"),
-    }
-
-    status = determine_overall_status(dependencies)
-    assert status == "degraded"
-
-
-@pytest.mark.unit
-def test_determine_overall_status_one_unhealthy():
-    """Test overall status when one dependency is unhealthy."""
-    dependencies = {
-        "fess": DependencyHealth(status="unhealthy", error="Connection refused"),
-        "ollama": DependencyHealth(status="healthy"),
-    }
-
-    status = determine_overall_status(dependencies)
-    assert status == "unhealthy"
-
-
-@pytest.mark.unit
-def test_determine_overall_status_all_unhealthy():
-    """Test overall status when all dependencies are unhealthy."""
+@pytest.mark.parametrize(
+    "fess_status, ollama_status, expected",
+    [
+        ("healthy", "healthy", "healthy"),
+        ("healthy", "degraded", "degraded"),
+        ("unhealthy", "healthy", "unhealthy"),
+        ("unhealthy", "unhealthy", "unhealthy"),
+    ],
+    ids=["all_healthy", "one_degraded", "one_unhealthy", "all_unhealthy"],
+)
+def test_determine_overall_status(fess_status, ollama_status, expected):
+    """Test overall status is the worst of the dependency statuses."""
     dependencies = {
-        "fess": DependencyHealth(status="unhealthy", error="Connection refused"),
-        "ollama": DependencyHealth(status="unhealthy", error="Timeout"),
+        "fess": DependencyHealth(status=fess_status),
+        "ollama": DependencyHealth(status=ollama_status),
     }
 
-    status = determine_overall_status(dependencies)
-    assert status == "unhealthy"
+    assert determine_overall_status(dependencies) == expected
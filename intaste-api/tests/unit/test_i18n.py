@@ -14,7 +14,11 @@
 Tests for i18n module.
 """
 
-from app.i18n import _, SUPPORTED_LANGUAGES
+import pytest
+
+from app.i18n import SUPPORTED_LANGUAGES, _
+
+pytestmark = pytest.mark.unit
 
 
 def test_supported_languages():
@@ -28,50 +32,40 @@ def test_supported_languages():
     assert "fr" in SUPPORTED_LANGUAGES
 
 
-def test_translation_japanese():
-    """Test Japanese translation."""
-    message = "Results are displayed. Please review the sources for details."
-    translated = _(message, language="ja")
-    assert translated == "検索結果が表示されています。詳細は各ソースをご確認ください。"
-
-
-def test_translation_english():
-    """Test English translation (should be same as original)."""
-    message = "Results are displayed. Please review the sources for details."
-    translated = _(message, language="en")
-    assert translated == message
-
-
-def test_translation_chinese_simplified():
-    """Test Chinese (Simplified) translation."""
-    message = "Results are displayed. Please review the sources for details."
-    translated = _(message, language="zh_CN")
-    assert translated == "搜索结果已显示。请查看各来源以获取详细信息。"
-
-
-def test_translation_chinese_simplified_with_hyphen():
-    """Test Chinese (Simplified) translation with hyphen in language code."""
-    message = "Results are displayed. Please review the sources for details."
-    translated = _(message, language="zh-CN")  # Hyphen instead of underscore
-    assert translated == "搜索结果已显示。请查看各来源以获取详细信息。"
-
-
-def test_translation_fallback():
-    """Test fallback to original message when translation not found."""
-    message = "This message does not exist in translations"
-    translated = _(message, language="ja")
-    assert translated == message  # Should return original
-
-
-def test_translation_unsupported_language():
-    """Test fallback to original for unsupported language."""
-    message = "Processing query..."
-    translated = _(message, language="ko")  # Korean not supported
-    assert translated == message  # Should return original
-
-
-def test_translation_default_language():
-    """Test that default language is English."""
-    message = "Processing query..."
-    translated = _(message)  # No language specified
-    assert translated == message  # Should use English (same as original)
+_RESULTS_MESSAGE = "Results are displayed. Please review the sources for details."
+_RESULTS_ZH_CN = "搜索结果已显示。请查看各来源以获取详细信息。"
+
+
+@pytest.mark.parametrize(
+    "message, language, expected",
+    [
+        (_RESULTS_MESSAGE, "ja", "検索結果が表示されています。詳細は各ソースをご確認ください。"),
+        (_RESULTS_MESSAGE, "en", _RESULTS_MESSAGE),
+        (_RESULTS_MESSAGE, "zh_CN", _RESULTS_ZH_CN),
+        # Hyphen instead of underscore
+        (_RESULTS_MESSAGE, "zh-CN", _RESULTS_ZH_CN),
+        # Missing translations fall back to the original message
+        (
+            "This message does not exist in translations",
+            "ja",
+            "This message does not exist in translations",
+        ),
+        # Korean is not supported
+        ("Processing query...", "ko", "Processing query..."),
+        # No language specified: English (same as original)
+        ("Processing query...", None, "Processing query..."),
+    ],
+    ids=[
+        "japanese",
+        "english",
+        "chinese_simplified",
+        "chinese_simplified_with_hyphen",
+        "fallback",
+        "unsupported_language",
+        "default_language",
+    ],
+)
+def test_translation(message, language, expected):
+    """Test translation lookup, language-code normalization and fallbacks."""
+    translated = _(message) if language is None else _(message, language=language)
+    assert translated == expected
@@ -0,0 +1,85 @@
+# Copyright (c) 2025 CodeLibs
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit tests for IntentCache.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from app.core.llm.base import IntentOutput
+from app.core.llm.intent_cache import IntentCache
+
+
+def _intent(normalized_query: str) -> IntentOutput:
+    return IntentOutput(normalized_query=normalized_query, filters=None, followups=[])
+
+
+@pytest.mark.unit
+class TestIntentCache:
+    """Test cases for IntentCache."""
+
+    def test_set_and_get(self):
+        """Test a stored intent is returned as an equal IntentOutput."""
+        cache = IntentCache()
+        key = IntentCache.make_key("query", "1.0", "gpt-oss")
+
+        assert cache.get(key) is None
+
+        cache.set(key, _intent("normalized"))
+
+        assert cache.get(key) == _intent("normalized")
+        assert len(cache) == 1
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"query": "other query"},
+            {"prompt_version": "2.0"},
+            {"model_id": "llama3"},
+            {"language": "ja"},
+            {"filters": {"site": "example.com"}},
+        ],
+        ids=["query", "prompt_version", "model_id", "language", "filters"],
+    )
+    def test_key_depends_on_inputs(self, kwargs):
+        """Test every intent input changes the cache key."""
+        base = {"query": "query", "prompt_version": "1.0", "model_id": "gpt-oss", "language": "en"}
+
+        assert IntentCache.make_key(**base) != IntentCache.make_key(**{**base, **kwargs})
+
+    def test_entry_expires_after_ttl(self):
+        """Test entries are dropped once their TTL has elapsed."""
+        cache = IntentCache(ttl_s=10)
+        key = IntentCache.make_key("query", "1.0", "gpt-oss")
+
+        with patch("app.core.llm.intent_cache.time.monotonic", return_value=100.0):
+            cache.set(key, _intent("normalized"))
+        with patch("app.core.llm.intent_cache.time.monotonic", return_value=110.0):
+            assert cache.get(key) is None
+
+        assert len(cache) == 0
+
+    def test_least_recently_used_entry_is_evicted(self):
+        """Test the least recently used entry is evicted when the cache is full."""
+        cache = IntentCache(maxsize=2)
+        cache.set("a", _intent("a"))
+        cache.set("b", _intent("b"))
+        cache.get("a")
+
+        cache.set("c", _intent("c"))
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
@@ -13,7 +13,7 @@
 """Tests for Ollama LLM client"""
 
 import pytest
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, Mock, patch
 import json
 
 from app.core.llm.ollama import OllamaClient
@@ -63,7 +63,6 @@ def ollama_client():
 
 
 @pytest.mark.unit
-@pytest.mark.asyncio
 async def test_intent_success(ollama_client):
     """Test successful intent extraction"""
     mock_response = {
@@ -90,7 +89,6 @@ async def test_intent_success(ollama_client):
 
 
 @pytest.mark.unit
-@pytest.mark.asyncio
 async def test_intent_fallback_on_json_error(ollama_client):
     """Test intent fallback when JSON parsing fails"""
     with patch.object(ollama_client, "_complete", return_value="invalid json"):
@@ -103,10 +101,10 @@ async def test_intent_fallback_on_json_error(ollama_client):
         # Should fallback to original query
         assert result.normalized_query == "test query"
         assert result.ambiguity == "medium"  # Fallback uses "medium" ambiguity
+        assert result.is_fallback
 
 
 @pytest.mark.unit
-@pytest.mark.asyncio
 async def test_intent_retry_on_validation_error(ollama_client):
     """Test intent retry with lower temperature on validation error"""
     # First call returns invalid structure, second call succeeds
@@ -133,10 +131,10 @@ async def test_intent_retry_on_validation_error(ollama_client):
 
         assert result.normalized_query == "test query"
         assert result.ambiguity == "low"
+        assert not result.is_fallback
 
 
 @pytest.mark.unit
-@pytest.mark.asyncio
 async def test_intent_with_query_history(ollama_client):
     """Test intent extraction with query history"""
     mock_response = {
@@ -173,7 +171,6 @@ async def test_intent_with_query_history(ollama_client):
 
 
 @pytest.mark.unit
-@pytest.mark.asyncio
 async def test_intent_without_query_history(ollama_client):
     """Test intent extraction without query history"""
     mock_response = {
@@ -202,7 +199,6 @@ async def test_intent_without_query_history(ollama_client):
 
 
 @pytest.mark.unit
-@pytest.mark.asyncio
 async def test_compose_success(ollama_client):
     """Test successful answer composition"""
     mock_response = {
@@ -231,7 +227,6 @@ async def test_compose_success(ollama_client):
 
 
 @pytest.mark.unit
-@pytest.mark.asyncio
 async def test_compose_fallback_on_error(ollama_client):
     """Test compose fallback when LLM fails"""
     with patch.object(ollama_client, "_complete", side_effect=Exception("LLM error")):
@@ -247,7 +242,6 @@ async def test_compose_fallback_on_error(ollama_client):
 
 
 @pytest.mark.unit
-@pytest.mark.asyncio
 async def test_compose_with_language(ollama_client):
     """Test compose with language parameter"""
     mock_response_ja = {
@@ -278,7 +272,6 @@ async def test_compose_with_language(ollama_client):
 
 
 @pytest.mark.unit
-@pytest.mark.asyncio
 async def test_health_check_success(ollama_client):
     """Test health check when Ollama is healthy"""
     mock_tags_response = {
@@ -286,7 +279,8 @@ async def test_health_check_success(ollama_client):
     }
 
     with patch("httpx.AsyncClient.get") as mock_get:
-        mock_get.return_value.status_code = 200
+        # httpx.Response methods are synchronous, so the response is a plain Mock
+        mock_get.return_value = Mock(status_code=200)
         mock_get.return_value.json.return_value = mock_tags_response
 
         is_healthy, details = await ollama_client.health()
@@ -296,7 +290,6 @@ async def test_health_check_success(ollama_client):
 
 
 @pytest.mark.unit
-@pytest.mark.asyncio
 async def test_health_check_failure(ollama_client):
     """Test health check when Ollama is unreachable"""
     with patch("httpx.AsyncClient.get", side_effect=Exception("Connection error")):
@@ -307,7 +300,6 @@ async def test_health_check_failure(ollama_client):
 
 
 @pytest.mark.unit
-@pytest.mark.asyncio
 async def test_complete_timeout(ollama_client):
     """Test timeout handling in _complete"""
     import asyncio
@@ -318,7 +310,6 @@ async def test_complete_timeout(ollama_client):
 
 
 @pytest.mark.unit
-@pytest.mark.asyncio
 async def test_relevance_success(ollama_client):
     """Test successful relevance evaluation"""
     from app.core.llm.base import RelevanceOutput
@@ -351,7 +342,6 @@ async def test_relevance_success(ollama_client):
 
 
 @pytest.mark.unit
-@pytest.mark.asyncio
 async def test_relevance_fallback_on_error(ollama_client):
     """Test relevance fallback when evaluation fails"""
     from app.core.llm.base import RelevanceOutput
@@ -379,7 +369,6 @@ async def test_relevance_fallback_on_error(ollama_client):
 
 
 @pytest.mark.unit
-@pytest.mark.asyncio
 async def test_relevance_retry_on_json_error(ollama_client):
     """Test relevance retry with lower temperature on JSON error"""
     from app.core.llm.base import RelevanceOutput
@@ -34,7 +34,6 @@ def ollama_client(httpx_mock):
 
 
 @pytest.mark.unit
-@pytest.mark.asyncio
 async def test_compose_stream_success(ollama_client, httpx_mock):
     """Test successful streaming composition."""
     # Mock streaming response with NDJSON lines
@@ -70,7 +69,6 @@ async def test_compose_stream_success(ollama_client, httpx_mock):
 
 
 @pytest.mark.unit
-@pytest.mark.asyncio
 async def test_compose_stream_empty_chunks(ollama_client, httpx_mock):
     """Test streaming with empty content chunks."""
     stream_data = [
@@ -103,7 +101,6 @@ async def test_compose_stream_empty_chunks(ollama_client, httpx_mock):
 
 
 @pytest.mark.unit
-@pytest.mark.asyncio
 async def test_compose_stream_malformed_json(ollama_client, httpx_mock):
     """Test handling of malformed JSON in stream."""
     # Mix valid and invalid JSON
@@ -135,7 +132,6 @@ async def test_compose_stream_malformed_json(ollama_client, httpx_mock):
 
 
 @pytest.mark.unit
-@pytest.mark.asyncio
 async def test_compose_stream_http_error(ollama_client, httpx_mock):
     """Test streaming with HTTP error response."""
     httpx_mock.add_response(
@@ -159,7 +155,6 @@ async def test_compose_stream_http_error(ollama_client, httpx_mock):
 
 
 @pytest.mark.unit
-@pytest.mark.asyncio
 async def test_compose_stream_timeout(ollama_client, httpx_mock):
     """Test streaming with timeout."""
     httpx_mock.add_exception(
@@ -183,7 +178,6 @@ async def test_compose_stream_timeout(ollama_client, httpx_mock):
 
 
 @pytest.mark.unit
-@pytest.mark.asyncio
 async def test_compose_stream_with_followups(ollama_client, httpx_mock):
     """Test streaming with follow-up suggestions."""
     stream_data = [
@@ -213,7 +207,6 @@ async def test_compose_stream_with_followups(ollama_client, httpx_mock):
 
 
 @pytest.mark.unit
-@pytest.mark.asyncio
 async def test_compose_stream_unicode(ollama_client, httpx_mock):
     """Test streaming with Unicode characters."""
     stream_data = [
@@ -244,7 +237,6 @@ async def test_compose_stream_unicode(ollama_client, httpx_mock):
 
 
 @pytest.mark.unit
-@pytest.mark.asyncio
 async def test_compose_stream_with_language(ollama_client, httpx_mock):
     """Test streaming with language parameter."""
     stream_data = [
@@ -16,20 +16,52 @@ from app.core.llm.prompts import (
     reset_registry,
 )
 
+pytestmark = pytest.mark.unit
+
+_EXPECTED_PROMPTS = frozenset(
+    {
+        "intent",
+        "compose",
+        "relevance",
+        "retry_intent",
+        "retry_intent_no_results",
+        "merge_results",
+    }
+)
+
+_IntentTemplate = PromptTemplate[IntentParams]
+
+
+def _intent_template(
+    prompt_id: str, version: str, system_prompt: str = "S", user_template: str = "T"
+) -> PromptTemplate[IntentParams]:
+    """Build a trusted intent template for registry tests without validation."""
+    return _IntentTemplate.model_construct(
+        prompt_id=prompt_id,
+        version=version,
+        system_prompt=system_prompt,
+        user_template=user_template,
+    )
+
 
 class TestPromptParams:
-    """Test Pydantic parameter models."""
+    """Test Pydantic parameter models.
+
+    These tests exercise validation, so they build params with the validating
+    constructor. Tests elsewhere that only format trusted literals use
+    model_construct() instead.
+    """
 
     def test_intent_params_valid(self):
         """Test IntentParams with valid data."""
-        params = IntentParams(
-            query="test query",
-            language="en",
-            query_history_text="history",
-            filters_json="{}",
-        )
-        assert params.query == "test query"
-        assert params.language == "en"
+        expected = {
+            "query": "test query",
+            "language": "en",
+            "query_history_text": "history",
+            "filters_json": "{}",
+        }
+        params = IntentParams(**expected)
+        assert params.model_dump() == expected
 
     def test_intent_params_defaults(self):
         """Test IntentParams default values."""
@@ -39,7 +71,7 @@ class TestPromptParams:
 
     def test_intent_params_extra_field_rejected(self):
         """Test that extra fields are rejected."""
-        with pytest.raises(ValidationError):
+        with pytest.raises(ValidationError, match="extra_forbidden"):
             IntentParams(
                 query="test",
                 language="en",
@@ -48,53 +80,55 @@ class TestPromptParams:
 
     def test_compose_params_valid(self):
         """Test ComposeParams with valid data."""
-        params = ComposeParams(
-            query="test",
-            normalized_query="normalized",
-            language="en",
-            citations_text="citations",
-        )
-        assert params.query == "test"
-        assert params.citations_text == "citations"
+        expected = {
+            "query": "test",
+            "normalized_query": "normalized",
+            "language": "en",
+            "citations_text": "citations",
+        }
+        params = ComposeParams(**expected)
+        assert params.model_dump() == expected
 
     def test_relevance_params_valid(self):
         """Test RelevanceParams with valid data."""
-        params = RelevanceParams(
-            query="test",
-            normalized_query="normalized",
-            title="Test Title",
-            snippet="Test snippet",
-        )
-        assert params.title == "Test Title"
-        assert params.snippet == "Test snippet"
+        expected = {
+            "query": "test",
+            "normalized_query": "normalized",
+            "title": "Test Title",
+            "snippet": "Test snippet",
+        }
+        params = RelevanceParams(**expected)
+        assert params.model_dump() == expected
 
     def test_retry_intent_params_valid(self):
         """Test RetryIntentParams with valid data."""
-        params = RetryIntentParams(
-            query="test",
-            previous_normalized_query="prev",
-            language="en",
-            low_score_results="results",
-        )
-        assert params.previous_normalized_query == "prev"
-        assert params.low_score_results == "results"
+        expected = {
+            "query": "test",
+            "previous_normalized_query": "prev",
+            "language": "en",
+            "low_score_results": "results",
+        }
+        params = RetryIntentParams(**expected)
+        assert params.model_dump() == expected
 
     def test_retry_intent_no_results_params_valid(self):
         """Test RetryIntentNoResultsParams with valid data."""
-        params = RetryIntentNoResultsParams(
-            query="test",
-            previous_normalized_query="prev",
-            language="en",
-        )
-        assert params.previous_normalized_query == "prev"
+        expected = {
+            "query": "test",
+            "previous_normalized_query": "prev",
+            "language": "en",
+        }
+        params = RetryIntentNoResultsParams(**expected)
+        assert params.model_dump() == expected
 
     def test_merge_results_params_valid(self):
         """Test MergeResultsParams with valid data."""
-        params = MergeResultsParams(
-            query="test",
-            agent_results_text="results",
-        )
-        assert params.agent_results_text == "results"
+        expected = {
+            "query": "test",
+            "agent_results_text": "results",
+        }
+        params = MergeResultsParams(**expected)
+        assert params.model_dump() == expected
 
 
 class TestPromptTemplate:
@@ -120,7 +154,7 @@ class TestPromptTemplate:
             system_prompt="System",
             user_template="Query: {query}, Lang: {language}",
         )
-        params = IntentParams(query="hello", language="en")
+        params = IntentParams.model_construct(query="hello", language="en")
         result = template.format(params)
         assert "Query: hello" in result
         assert "Lang: en" in result
@@ -133,7 +167,7 @@ class TestPromptTemplate:
             system_prompt="System",
             user_template="Query: {query}, Missing: {missing_field}",
         )
-        params = IntentParams(query="hello", language="en")
+        params = IntentParams.model_construct(query="hello", language="en")
         with pytest.raises(KeyError):
             template.format(params)
 
@@ -145,7 +179,7 @@ class TestPromptTemplate:
             system_prompt="System",
             user_template="Template",
         )
-        with pytest.raises(ValidationError):
+        with pytest.raises(ValidationError, match="frozen_instance"):
             template.prompt_id = "modified"  # type: ignore
 
 
@@ -159,12 +193,7 @@ class TestPromptRegistry:
     def test_register_and_get_prompt(self):
         """Test registering and retrieving a prompt."""
         registry = get_registry()
-        template = PromptTemplate[IntentParams](
-            prompt_id="test",
-            version="1.0",
-            system_prompt="System",
-            user_template="Template",
-        )
+        template = _intent_template("test", "1.0", system_prompt="System", user_template="Template")
         registry.register(template)
 
         retrieved = registry.get("test", IntentParams)
@@ -180,29 +209,19 @@ class TestPromptRegistry:
     def test_register_duplicate_identical(self):
         """Test that registering identical prompt twice is allowed."""
         registry = get_registry()
-        template = PromptTemplate[IntentParams](
-            prompt_id="test",
-            version="1.0",
-            system_prompt="System",
-            user_template="Template",
-        )
+        template = _intent_template("test", "1.0", system_prompt="System", user_template="Template")
         registry.register(template)
         registry.register(template)  # Should not raise
 
     def test_register_duplicate_different_content(self):
         """Test that registering same id/version with different content raises."""
         registry = get_registry()
-        template1 = PromptTemplate[IntentParams](
-            prompt_id="test",
-            version="1.0",
-            system_prompt="System1",
-            user_template="Template1",
+        template1 = _intent_template(
+            "test", "1.0", system_prompt="System1", user_template="Template1"
         )
-        template2 = PromptTemplate[IntentParams](
-            prompt_id="test",
-            version="1.0",
-            system_prompt="System2",  # Different content
-            user_template="Template2",
+        # Same id/version, different content
+        template2 = _intent_template(
+            "test", "1.0", system_prompt="System2", user_template="Template2"
         )
         registry.register(template1)
         with pytest.raises(ValueError, match="already registered"):
@@ -211,18 +230,8 @@ class TestPromptRegistry:
     def test_register_multiple_versions(self):
         """Test registering multiple versions of same prompt."""
         registry = get_registry()
-        v1 = PromptTemplate[IntentParams](
-            prompt_id="test",
-            version="1.0",
-            system_prompt="System",
-            user_template="V1",
-        )
-        v2 = PromptTemplate[IntentParams](
-            prompt_id="test",
-            version="2.0",
-            system_prompt="System",
-            user_template="V2",
-        )
+        v1 = _intent_template("test", "1.0", system_prompt="System", user_template="V1")
+        v2 = _intent_template("test", "2.0", system_prompt="System", user_template="V2")
         registry.register(v1)
         registry.register(v2, set_as_default=True)
 
@@ -237,18 +246,8 @@ class TestPromptRegistry:
     def test_list_prompts(self):
         """Test listing all prompts."""
         registry = get_registry()
-        t1 = PromptTemplate[IntentParams](
-            prompt_id="prompt1",
-            version="1.0",
-            system_prompt="S",
-            user_template="T",
-        )
-        t2 = PromptTemplate[IntentParams](
-            prompt_id="prompt2",
-            version="1.0",
-            system_prompt="S",
-            user_template="T",
-        )
+        t1 = _intent_template("prompt1", "1.0")
+        t2 = _intent_template("prompt2", "1.0")
         registry.register(t1)
         registry.register(t2)
 
@@ -256,27 +255,19 @@ class TestPromptRegistry:
         assert "prompt1" in prompts
         assert "prompt2" in prompts
         assert prompts["prompt1"] == ["1.0"]
+        assert registry.prompt_ids() == {"prompt1", "prompt2"}
 
     def test_set_default_version(self):
         """Test changing default version."""
         registry = get_registry()
-        v1 = PromptTemplate[IntentParams](
-            prompt_id="test",
-            version="1.0",
-            system_prompt="S",
-            user_template="V1",
-        )
-        v2 = PromptTemplate[IntentParams](
-            prompt_id="test",
-            version="2.0",
-            system_prompt="S",
-            user_template="V2",
-        )
+        v1 = _intent_template("test", "1.0", user_template="V1")
+        v2 = _intent_template("test", "2.0", user_template="V2")
         registry.register(v1)
         registry.register(v2, set_as_default=False)
 
-        # Default is v1
+        # Default is v1 (resolving it also primes the registry's lookup cache)
         assert registry.get_default_version("test") == "1.0"
+        assert registry.get("test", IntentParams).version == "1.0"
 
         # Change to v2
         registry.set_default_version("test", "2.0")
@@ -287,106 +278,96 @@ class TestPromptRegistry:
         assert default.version == "2.0"
 
 
+@pytest.fixture(scope="class")
+def _prompts_registered():
+    """Register the standard prompts once per class (TestPromptRegistry resets the registry)."""
+    reset_registry()
+    register_all_prompts()
+    yield
+
+
+@pytest.mark.usefixtures("_prompts_registered")
 class TestPromptDefinitions:
     """Test that all standard prompts are registered correctly."""
 
-    def setup_method(self):
-        """Reset and register all prompts."""
-        reset_registry()
-        register_all_prompts()
-
     def test_all_prompts_registered(self):
         """Test that all expected prompts are registered."""
-        registry = get_registry()
-        expected_prompts = [
+        missing = _EXPECTED_PROMPTS - get_registry().prompt_ids()
+        assert not missing, f"Prompts not registered: {sorted(missing)}"
+
+    @pytest.mark.parametrize(
+        "prompt_id, params, expected_substrings",
+        [
+            (
+                "intent",
+                IntentParams.model_construct(
+                    query="test query",
+                    language="en",
+                    query_history_text="history",
+                    filters_json="{}",
+                ),
+                ("test query", "en"),
+            ),
+            (
+                "compose",
+                ComposeParams.model_construct(
+                    query="test",
+                    normalized_query="normalized",
+                    language="en",
+                    citations_text="citations",
+                ),
+                ("test", "citations"),
+            ),
+            (
+                "relevance",
+                RelevanceParams.model_construct(
+                    query="test",
+                    normalized_query="normalized",
+                    title="Title",
+                    snippet="Snippet",
+                ),
+                ("Title", "Snippet"),
+            ),
+            (
+                "retry_intent",
+                RetryIntentParams.model_construct(
+                    query="test",
+                    previous_normalized_query="prev",
+                    language="en",
+                    low_score_results="results",
+                ),
+                ("prev", "results"),
+            ),
+            (
+                "retry_intent_no_results",
+                RetryIntentNoResultsParams.model_construct(
+                    query="test",
+                    previous_normalized_query="prev",
+                    language="en",
+                ),
+                ("prev", "0 results"),
+            ),
+            (
+                "merge_results",
+                MergeResultsParams.model_construct(
+                    query="test",
+                    agent_results_text="results",
+                ),
+                ("test", "results"),
+            ),
+        ],
+        ids=[
             "intent",
             "compose",
             "relevance",
             "retry_intent",
             "retry_intent_no_results",
             "merge_results",
-        ]
-        prompts = registry.list_prompts()
-        for expected in expected_prompts:
-            assert expected in prompts, f"Prompt '{expected}' not registered"
-
-    def test_intent_prompt_format(self):
-        """Test that intent prompt can be formatted."""
-        registry = get_registry()
-        template = registry.get("intent", IntentParams)
-        params = IntentParams(
-            query="test query",
-            language="en",
-            query_history_text="history",
-            filters_json="{}",
-        )
-        user_prompt = template.format(params)
-        assert "test query" in user_prompt
-        assert "en" in user_prompt
-
-    def test_compose_prompt_format(self):
-        """Test that compose prompt can be formatted."""
-        registry = get_registry()
-        template = registry.get("compose", ComposeParams)
-        params = ComposeParams(
-            query="test",
-            normalized_query="normalized",
-            language="en",
-            citations_text="citations",
-        )
-        user_prompt = template.format(params)
-        assert "test" in user_prompt
-        assert "citations" in user_prompt
-
-    def test_relevance_prompt_format(self):
-        """Test that relevance prompt can be formatted."""
-        registry = get_registry()
-        template = registry.get("relevance", RelevanceParams)
-        params = RelevanceParams(
-            query="test",
-            normalized_query="normalized",
-            title="Title",
-            snippet="Snippet",
-        )
-        user_prompt = template.format(params)
-        assert "Title" in user_prompt
-        assert "Snippet" in user_prompt
-
-    def test_retry_intent_prompt_format(self):
-        """Test that retry intent prompt can be formatted."""
-        registry = get_registry()
-        template = registry.get("retry_intent", RetryIntentParams)
-        params = RetryIntentParams(
-            query="test",
-            previous_normalized_query="prev",
-            language="en",
-            low_score_results="results",
-        )
-        user_prompt = template.format(params)
-        assert "prev" in user_prompt
-        assert "results" in user_prompt
-
-    def test_retry_intent_no_results_prompt_format(self):
-        """Test that retry intent (no results) prompt can be formatted."""
-        registry = get_registry()
-        template = registry.get("retry_intent_no_results", RetryIntentNoResultsParams)
-        params = RetryIntentNoResultsParams(
-            query="test",
-            previous_normalized_query="prev",
-            language="en",
-        )
-        user_prompt = template.format(params)
-        assert "prev" in user_prompt
-        assert "0 results" in user_prompt or "no results" in user_prompt.lower()
-
-    def test_merge_results_prompt_format(self):
-        """Test that merge results prompt can be formatted."""
-        registry = get_registry()
-        template = registry.get("merge_results", MergeResultsParams)
-        params = MergeResultsParams(
-            query="test",
-            agent_results_text="results",
-        )
+        ],
+    )
+    def test_prompt_format(self, prompt_id, params, expected_substrings):
+        """Test that each standard prompt can be formatted with its params."""
+        template = get_registry().get(prompt_id, type(params))
         user_prompt = template.format(params)
-        assert "test" in user_prompt
-        assert "results" in user_prompt
+        for expected in expected_substrings:
+            assert expected in user_prompt
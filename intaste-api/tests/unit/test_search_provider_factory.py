@@ -14,7 +14,7 @@
 Unit tests for SearchProviderFactory.
 """
 
-from unittest.mock import MagicMock
+from types import SimpleNamespace
 
 import pytest
 
@@ -51,11 +51,12 @@ class TestSearchProviderFactory:
 
     def test_create_from_settings(self):
         """Test creating provider from settings object."""
-        # Mock settings object
-        settings = MagicMock()
-        settings.intaste_search_provider = "fess"
-        settings.fess_base_url = "http://test-fess:8080"
-        settings.fess_timeout_ms = 2500
+        # The factory only reads attributes, so a plain namespace stands in for Settings
+        settings = SimpleNamespace(
+            intaste_search_provider="fess",
+            fess_base_url="http://test-fess:8080",
+            fess_timeout_ms=2500,
+        )
 
         provider = SearchProviderFactory.create_from_settings(settings)
 
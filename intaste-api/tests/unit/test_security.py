@@ -14,26 +14,58 @@
 Unit tests for security features (authentication, middleware).
 """
 
+from collections.abc import Awaitable, Callable
+
 import pytest
 from fastapi import HTTPException, status
-from unittest.mock import MagicMock
+from starlette.middleware.cors import CORSMiddleware
 
 from app.core.security.auth import verify_api_token
 from app.core.config import Settings
 
+_LONG_TOKEN = "a" * 10000
+
+
+# Minimal HTTP scope; tests take a copy since the middleware writes scope["state"]
+_BASE_HTTP_SCOPE = {
+    "type": "http",
+    "method": "GET",
+    "path": "/test",
+    "headers": [],
+    "query_string": b"",
+    "raw_path": b"/test",
+}
+
+
+async def _noop_app(scope, receive, send):
+    """ASGI app that neither reads the request nor sends a response."""
+
+
+async def _receive():
+    """ASGI receive callable delivering an empty request body."""
+    return {"type": "http.request", "body": b"", "more_body": False}
+
+
+def _recording_send() -> tuple[list[dict], Callable[[dict], Awaitable[None]]]:
+    """Return a list and an ASGI send callable that appends every message to it."""
+    sent: list[dict] = []
+
+    async def send(message):
+        sent.append(message)
+
+    return sent, send
+
 
 @pytest.mark.unit
 class TestAuthenticationToken:
     """Test cases for API token authentication."""
 
-    @pytest.mark.asyncio
     async def test_valid_token(self, test_settings: Settings):
         """Test authentication with valid token."""
         token = test_settings.intaste_api_token
         result = await verify_api_token(x_intaste_token=token)
         assert result == token
 
-    @pytest.mark.asyncio
     async def test_missing_token(self):
         """Test authentication with missing token."""
         with pytest.raises(HTTPException) as exc_info:
@@ -43,7 +75,6 @@ class TestAuthenticationToken:
         assert "UNAUTHORIZED" in str(exc_info.value.detail)
         assert "Invalid or missing API token" in str(exc_info.value.detail)
 
-    @pytest.mark.asyncio
     async def test_invalid_token(self):
         """Test authentication with invalid token."""
         with pytest.raises(HTTPException) as exc_info:
@@ -52,7 +83,6 @@ class TestAuthenticationToken:
         assert exc_info.value.status_code == status.HTTP_401_UNAUTHORIZED
         assert "UNAUTHORIZED" in str(exc_info.value.detail)
 
-    @pytest.mark.asyncio
     async def test_empty_token(self):
         """Test authentication with empty token."""
         with pytest.raises(HTTPException) as exc_info:
@@ -60,7 +90,6 @@ class TestAuthenticationToken:
 
         assert exc_info.value.status_code == status.HTTP_401_UNAUTHORIZED
 
-    @pytest.mark.asyncio
     async def test_token_with_whitespace(self):
         """Test authentication with token containing whitespace."""
         with pytest.raises(HTTPException) as exc_info:
@@ -68,33 +97,32 @@ class TestAuthenticationToken:
 
         assert exc_info.value.status_code == status.HTTP_401_UNAUTHORIZED
 
-    @pytest.mark.asyncio
     async def test_very_long_token(self):
         """Test authentication with very long invalid token."""
-        long_token = "a" * 10000
         with pytest.raises(HTTPException) as exc_info:
-            await verify_api_token(x_intaste_token=long_token)
+            await verify_api_token(x_intaste_token=_LONG_TOKEN)
 
         assert exc_info.value.status_code == status.HTTP_401_UNAUTHORIZED
 
-    @pytest.mark.asyncio
-    async def test_token_with_special_characters(self):
-        """Test authentication with token containing special characters."""
-        special_tokens = [
+    @pytest.mark.parametrize(
+        "token",
+        [
             "token-with-special-!@#$%",
             "token\nwith\nnewlines",
             "token\twith\ttabs",
             "token with spaces",
             "token<script>alert('xss')</script>",
-        ]
-
-        for token in special_tokens:
-            with pytest.raises(HTTPException) as exc_info:
-                await verify_api_token(x_intaste_token=token)
+            "tökén-with-non-ascii",
+        ],
+        ids=["punctuation", "newlines", "tabs", "spaces", "html", "non_ascii"],
+    )
+    async def test_token_with_special_characters(self, token):
+        """Test authentication with token containing special characters."""
+        with pytest.raises(HTTPException) as exc_info:
+            await verify_api_token(x_intaste_token=token)
 
-            assert exc_info.value.status_code == status.HTTP_401_UNAUTHORIZED
+        assert exc_info.value.status_code == status.HTTP_401_UNAUTHORIZED
 
-    @pytest.mark.asyncio
     async def test_case_sensitive_token(self, test_settings: Settings):
         """Test that token comparison is case-sensitive."""
         token = test_settings.intaste_api_token.upper()
@@ -115,33 +143,75 @@ class TestRequestIDMiddleware:
         assert RequestIDMiddleware is not None
         assert add_request_id_middleware is not None
 
-    def test_middleware_generates_request_id(self):
+    async def test_middleware_generates_request_id(self):
         """Test that middleware generates request ID."""
-        from app.core.security.middleware import RequestIDMiddleware
         from starlette.requests import Request
         from starlette.responses import Response
-        import asyncio
 
-        # Create mock request and call_next
-        async def mock_call_next(request):
-            return Response(content="test", status_code=200)
+        from app.core.security.middleware import RequestIDMiddleware
+
+        seen_requests: list[Request] = []
+
+        async def app(scope, receive, send):
+            seen_requests.append(Request(scope))
+            await Response(content="test", status_code=200)(scope, receive, send)
+
+        sent, send = _recording_send()
+        middleware = RequestIDMiddleware(app=app)
+        scope = _BASE_HTTP_SCOPE.copy()
+        await middleware(scope, _receive, send)
+
+        # Verify request has request_id
+        request = seen_requests[0]
+        assert request.state.request_id
+        # 128 random bits as 32 lowercase hex chars
+        assert len(request.state.request_id) == 32
+        assert set(request.state.request_id) <= set("0123456789abcdef")
+
+        # Verify response has X-Request-ID header
+        assert sent[0]["type"] == "http.response.start"
+        headers = dict(sent[0]["headers"])
+        assert headers[b"x-request-id"].decode() == request.state.request_id
+        assert b"x-process-time" in headers
+
+    async def test_middleware_keeps_incoming_request_id(self):
+        """Test that a client-supplied X-Request-ID is propagated unchanged."""
+        from starlette.responses import Response
+
+        from app.core.security.middleware import RequestIDMiddleware
+
+        sent, send = _recording_send()
+        middleware = RequestIDMiddleware(app=Response(content="test", status_code=200))
+        scope = {**_BASE_HTTP_SCOPE, "headers": [(b"x-request-id", b"client-rid")]}
+        await middleware(scope, _receive, send)
+
+        assert scope["state"]["request_id"] == "client-rid"
+        assert sent[0]["type"] == "http.response.start"
+        assert dict(sent[0]["headers"])[b"x-request-id"] == b"client-rid"
+
+    async def test_middleware_sets_request_id_without_response(self):
+        """Test that the request ID is stored in scope state before the app runs."""
+        from app.core.security.middleware import RequestIDMiddleware
 
-        async def test_middleware():
-            middleware = RequestIDMiddleware(app=MagicMock())
-            request = Request(scope={"type": "http", "method": "GET", "path": "/test", "headers": []})
+        sent, send = _recording_send()
+        middleware = RequestIDMiddleware(app=_noop_app)
+        scope = _BASE_HTTP_SCOPE.copy()
+        await middleware(scope, _receive, send)
 
-            response = await middleware.dispatch(request, mock_call_next)
+        assert len(scope["state"]["request_id"]) == 32
+        assert sent == []
 
-            # Verify request has request_id
-            assert hasattr(request.state, "request_id")
-            assert request.state.request_id is not None
-            assert len(request.state.request_id) > 0
 
-            # Verify response has X-Request-ID header
-            assert "x-request-id" in response.headers
-            assert response.headers["x-request-id"] == request.state.request_id
+@pytest.fixture(scope="module")
+def cors_app():
+    """FastAPI app with CORS configured, shared by the CORS tests (read-only use)."""
+    from fastapi import FastAPI
 
-        asyncio.run(test_middleware())
+    from app.core.security.middleware import setup_cors
+
+    app = FastAPI()
+    setup_cors(app)
+    return app
 
 
 @pytest.mark.unit
@@ -154,23 +224,14 @@ class TestCORSConfiguration:
 
         assert setup_cors is not None
 
-    def test_cors_setup_with_app(self):
+    def test_cors_setup_with_app(self, cors_app):
         """Test CORS setup with FastAPI app."""
-        from fastapi import FastAPI
-        from app.core.security.middleware import setup_cors
-        from app.core.config import settings
-
-        app = FastAPI()
-        setup_cors(app)
-
         # Verify middleware is added (check user_middleware)
-        assert len(app.user_middleware) > 0
+        assert len(cors_app.user_middleware) > 0
 
         # Find CORSMiddleware
-        cors_middleware = None
-        for middleware in app.user_middleware:
-            if "CORSMiddleware" in str(middleware.cls):
-                cors_middleware = middleware
-                break
+        cors_middleware = next(
+            (mw for mw in cors_app.user_middleware if mw.cls is CORSMiddleware), None
+        )
 
         assert cors_middleware is not None, "CORSMiddleware should be added"
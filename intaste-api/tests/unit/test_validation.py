@@ -28,6 +28,16 @@ from app.schemas.assist import (
 )
 from uuid import uuid4
 
+# Shared immutable inputs, built once per module rather than in every test
+_SESSION_ID = uuid4()
+_LONG_300 = "a" * 300
+_LONG_301 = "a" * 301
+_LONG_500 = "a" * 500
+_LONG_501 = "a" * 501
+_LONG_4096 = "a" * 4096
+_LONG_4097 = "a" * 4097
+_HISTORY_10 = tuple(f"query {i}" for i in range(10))
+_HISTORY_11 = tuple(f"query {i}" for i in range(11))
 
 @pytest.mark.unit
 class TestAssistQueryRequestValidation:
@@ -44,44 +54,43 @@ class TestAssistQueryRequestValidation:
             AssistQueryRequest(query="")
 
         errors = exc_info.value.errors()
-        assert any(
-            error["type"] == "string_too_short" for error in errors
-        ), "Should fail with string_too_short"
+        assert [error["type"] for error in errors] == ["string_too_short"]
 
     def test_query_max_length(self):
         """Test query maximum length (max_length=4096)."""
         # Valid: exactly 4096 characters
-        long_query = "a" * 4096
-        request = AssistQueryRequest(query=long_query)
+        request = AssistQueryRequest(query=_LONG_4096)
         assert len(request.query) == 4096
 
         # Invalid: 4097 characters
         with pytest.raises(ValidationError) as exc_info:
-            AssistQueryRequest(query="a" * 4097)
+            AssistQueryRequest(query=_LONG_4097)
 
         errors = exc_info.value.errors()
-        assert any(error["type"] == "string_too_long" for error in errors)
-
-    def test_query_with_special_characters(self):
+        assert [error["type"] for error in errors] == ["string_too_long"]
+
+    @pytest.mark.parametrize(
+        "query",
+        [
+            "What is the 🔒 security policy?",
+            "How to use <script>alert('xss')</script>?",
+            "SELECT * FROM users WHERE name='admin'--",
+            "Query with\nnewlines\nand\ttabs",
+            "Query with 日本語",
+            "Query with 한글",
+            "Query with العربية",
+        ],
+        ids=["emoji", "html_xss", "sql_like", "whitespace", "japanese", "korean", "arabic"],
+    )
+    def test_query_with_special_characters(self, query):
         """Test query with special characters (emoji, HTML, etc)."""
-        special_queries = [
-            "What is the 🔒 security policy?",  # Emoji
-            "How to use <script>alert('xss')</script>?",  # HTML/XSS
-            "SELECT * FROM users WHERE name='admin'--",  # SQL-like
-            "Query with\nnewlines\nand\ttabs",  # Whitespace
-            "Query with 日本語",  # Unicode
-            "Query with 한글",  # Korean
-            "Query with العربية",  # Arabic
-        ]
-
-        for query in special_queries:
-            request = AssistQueryRequest(query=query)
-            assert request.query == query
+        request = AssistQueryRequest(query=query)
+        assert request.query == query
 
     def test_session_id_validation(self):
         """Test session_id validation (UUID v4 format required)."""
         # Valid: proper UUID v4 format
-        valid_uuid = str(uuid4())
+        valid_uuid = str(_SESSION_ID)
         request = AssistQueryRequest(query="test", session_id=valid_uuid)
         assert request.session_id == valid_uuid
 
@@ -94,26 +103,25 @@ class TestAssistQueryRequestValidation:
             AssistQueryRequest(query="test", session_id="not-a-uuid")
 
         errors = exc_info.value.errors()
-        assert any("session_id" in str(error) for error in errors)
+        assert [error["loc"] for error in errors] == [("session_id",)]
 
     def test_query_history_validation(self):
         """Test query_history validation (max_length=10)."""
         # Valid: exactly 10 items
-        history = [f"query {i}" for i in range(10)]
-        request = AssistQueryRequest(query="test", query_history=history)
-        assert len(request.query_history) == 10
+        request = AssistQueryRequest(query="test", query_history=_HISTORY_10)
+        assert request.query_history == _HISTORY_10
 
         # Invalid: 11 items
         with pytest.raises(ValidationError) as exc_info:
-            AssistQueryRequest(query="test", query_history=[f"query {i}" for i in range(11)])
+            AssistQueryRequest(query="test", query_history=_HISTORY_11)
 
         errors = exc_info.value.errors()
-        assert any("too_long" in error["type"] for error in errors)
+        assert [error["type"] for error in errors] == ["too_long"]
 
     def test_query_history_empty_list(self):
         """Test query_history with empty list."""
         request = AssistQueryRequest(query="test", query_history=[])
-        assert request.query_history == []
+        assert request.query_history == ()
 
     def test_options_field(self):
         """Test options field accepts arbitrary dict."""
@@ -155,7 +163,7 @@ class TestCitationValidation:
             Citation(id=0, title="Test", url="https://example.com")
 
         errors = exc_info.value.errors()
-        assert any("greater_than_equal" in error["type"] for error in errors)
+        assert [error["type"] for error in errors] == ["greater_than_equal"]
 
         # Invalid: negative id
         with pytest.raises(ValidationError) as exc_info:
@@ -207,16 +215,15 @@ class TestAnswerValidation:
     def test_answer_text_max_length(self):
         """Test answer text maximum length (max_length=300)."""
         # Valid: exactly 300 characters
-        text = "a" * 300
-        answer = Answer(text=text)
+        answer = Answer(text=_LONG_300)
         assert len(answer.text) == 300
 
         # Invalid: 301 characters
         with pytest.raises(ValidationError) as exc_info:
-            Answer(text="a" * 301)
+            Answer(text=_LONG_301)
 
         errors = exc_info.value.errors()
-        assert any(error["type"] == "string_too_long" for error in errors)
+        assert [error["type"] for error in errors] == ["string_too_long"]
 
     def test_suggested_questions_max_items(self):
         """Test suggested_questions maximum items (max_length=3)."""
@@ -229,7 +236,7 @@ class TestAnswerValidation:
             Answer(text="Test", suggested_questions=["Q1?", "Q2?", "Q3?", "Q4?"])
 
         errors = exc_info.value.errors()
-        assert any("too_long" in error["type"] for error in errors)
+        assert [error["type"] for error in errors] == ["too_long"]
 
     def test_suggested_questions_default(self):
         """Test suggested_questions default value."""
@@ -243,7 +250,7 @@ class TestSessionValidation:
 
     def test_valid_session(self):
         """Test validation with valid session."""
-        session = Session(id=str(uuid4()), turn=1)
+        session = Session(id=str(_SESSION_ID), turn=1)
         assert session.turn == 1
 
     def test_session_turn_minimum(self):
@@ -257,7 +264,7 @@ class TestSessionValidation:
             Session(id="test-id", turn=0)
 
         errors = exc_info.value.errors()
-        assert any("greater_than_equal" in error["type"] for error in errors)
+        assert [error["type"] for error in errors] == ["greater_than_equal"]
 
 
 @pytest.mark.unit
@@ -282,7 +289,7 @@ class TestTimingsValidation:
             Timings(llm_ms=-1, search_ms=0, total_ms=0)
 
         errors = exc_info.value.errors()
-        assert any("greater_than_equal" in error["type"] for error in errors)
+        assert [error["type"] for error in errors] == ["greater_than_equal"]
 
 
 @pytest.mark.unit
@@ -301,13 +308,11 @@ class TestNoticeValidation:
         assert notice.fallback is True
         assert notice.reason == "LLM_TIMEOUT"
 
-    def test_notice_valid_reasons(self):
+    @pytest.mark.parametrize("reason", ["LLM_TIMEOUT", "BAD_LLM_OUTPUT", "LLM_UNAVAILABLE"])
+    def test_notice_valid_reasons(self, reason):
         """Test Notice with documented reason values."""
-        valid_reasons = ["LLM_TIMEOUT", "BAD_LLM_OUTPUT", "LLM_UNAVAILABLE"]
-
-        for reason in valid_reasons:
-            notice = Notice(fallback=True, reason=reason)
-            assert notice.reason == reason
+        notice = Notice(fallback=True, reason=reason)
+        assert notice.reason == reason
 
 
 @pytest.mark.unit
@@ -317,7 +322,7 @@ class TestFeedbackRequestValidation:
     def test_valid_feedback(self):
         """Test validation with valid feedback."""
         feedback = FeedbackRequest(
-            session_id=uuid4(),
+            session_id=_SESSION_ID,
             turn=1,
             rating="up",
         )
@@ -326,47 +331,42 @@ class TestFeedbackRequestValidation:
     def test_feedback_rating_literal(self):
         """Test feedback rating accepts only 'up' or 'down'."""
         # Valid: up
-        feedback = FeedbackRequest(session_id=uuid4(), turn=1, rating="up")
+        feedback = FeedbackRequest(session_id=_SESSION_ID, turn=1, rating="up")
         assert feedback.rating == "up"
 
         # Valid: down
-        feedback = FeedbackRequest(session_id=uuid4(), turn=1, rating="down")
+        feedback = FeedbackRequest(session_id=_SESSION_ID, turn=1, rating="down")
         assert feedback.rating == "down"
 
         # Invalid: other value
         with pytest.raises(ValidationError) as exc_info:
-            FeedbackRequest(session_id=uuid4(), turn=1, rating="neutral")
+            FeedbackRequest(session_id=_SESSION_ID, turn=1, rating="neutral")
 
         errors = exc_info.value.errors()
-        assert any("literal_error" in error["type"] for error in errors)
+        assert [error["type"] for error in errors] == ["literal_error"]
 
     def test_feedback_comment_max_length(self):
         """Test feedback comment maximum length (max_length=500)."""
         # Valid: exactly 500 characters
-        comment = "a" * 500
-        feedback = FeedbackRequest(
-            session_id=uuid4(), turn=1, rating="up", comment=comment
-        )
+        feedback = FeedbackRequest(session_id=_SESSION_ID, turn=1, rating="up", comment=_LONG_500)
         assert len(feedback.comment) == 500
 
         # Invalid: 501 characters
         with pytest.raises(ValidationError) as exc_info:
-            FeedbackRequest(
-                session_id=uuid4(), turn=1, rating="up", comment="a" * 501
-            )
+            FeedbackRequest(session_id=_SESSION_ID, turn=1, rating="up", comment=_LONG_501)
 
         errors = exc_info.value.errors()
-        assert any(error["type"] == "string_too_long" for error in errors)
+        assert [error["type"] for error in errors] == ["string_too_long"]
 
     def test_feedback_turn_minimum(self):
         """Test feedback turn minimum value (ge=1)."""
         # Valid: turn=1
-        feedback = FeedbackRequest(session_id=uuid4(), turn=1, rating="up")
+        feedback = FeedbackRequest(session_id=_SESSION_ID, turn=1, rating="up")
         assert feedback.turn == 1
 
         # Invalid: turn=0
         with pytest.raises(ValidationError) as exc_info:
-            FeedbackRequest(session_id=uuid4(), turn=0, rating="up")
+            FeedbackRequest(session_id=_SESSION_ID, turn=0, rating="up")
 
         errors = exc_info.value.errors()
-        assert any("greater_than_equal" in error["type"] for error in errors)
+        assert [error["type"] for error in errors] == ["greater_than_equal"]